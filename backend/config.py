@@ -45,6 +45,9 @@ CORS_ORIGINS = os.getenv(
 DEMO_MODE = os.getenv("DEMO_MODE", "true").lower() == "true"
 DEBUG = os.getenv("DEBUG", "true").lower() == "true"
 
+# 설정 시 시뮬레이션/노이즈 난수가 실행마다 동일 (벤치마크, 회귀 비교용)
+RANDOM_SEED = int(os.getenv("RANDOM_SEED")) if os.getenv("RANDOM_SEED") else None
+
 # =============================================================================
 # Simulation Intervals (seconds)
 # =============================================================================
@@ -52,6 +55,105 @@ THREAT_UPDATE_INTERVAL = int(os.getenv("THREAT_UPDATE_INTERVAL", 10))
 NEW_THREAT_INTERVAL = int(os.getenv("NEW_THREAT_INTERVAL", 45))
 HISTORY_RECORD_INTERVAL = int(os.getenv("HISTORY_RECORD_INTERVAL", 300))  # 5 minutes
 LOG_RETENTION_DAYS = int(os.getenv("LOG_RETENTION_DAYS", 30))
+# 메모리에 보관할 위협 지수 히스토리 샘플 수 (지수 업데이트마다 1개, 기본 24시간 분량)
+THREAT_HISTORY_SIZE = int(os.getenv("THREAT_HISTORY_SIZE", 8640))
+
+# 부하 생성 모드 (/demo/load/start) - 초당 위협 수 기본값/상한, 배치 생성 주기 (초)
+LOAD_GEN_RATE = int(os.getenv("LOAD_GEN_RATE", 1000))
+LOAD_GEN_MAX_RATE = int(os.getenv("LOAD_GEN_MAX_RATE", 50000))
+LOAD_GEN_TICK = float(os.getenv("LOAD_GEN_TICK", 0.1))
+
+# =============================================================================
+# WebSocket Fan-out
+# =============================================================================
+# 클라이언트별 송신 큐 최대 메시지 수
+WS_SEND_QUEUE_SIZE = int(os.getenv("WS_SEND_QUEUE_SIZE", 100))
+# 큐 초과 시 정책: drop_oldest | coalesce | disconnect
+WS_SLOW_CONSUMER_POLICY = os.getenv("WS_SLOW_CONSUMER_POLICY", "drop_oldest")
+# threat_index 변경분(delta) 전송 여부와 전체 상태(keyframe) 전송 주기 (업데이트 N회마다, 최소 1 = 매번 전체 상태)
+WS_THREAT_INDEX_DELTA = os.getenv("WS_THREAT_INDEX_DELTA", "true").lower() == "true"
+WS_KEYFRAME_INTERVAL = max(1, int(os.getenv("WS_KEYFRAME_INTERVAL", 6)))
+# 마이크로 배칭 윈도우 (ms, 0 = 비활성) - 윈도우 내 메시지를 JSON 배열 프레임 하나로 전송
+WS_BATCH_WINDOW_MS = int(os.getenv("WS_BATCH_WINDOW_MS", 0))
+# 이 레벨 이상의 알림은 배칭 윈도우를 기다리지 않고 즉시 전송
+WS_BATCH_BYPASS_LEVEL = int(os.getenv("WS_BATCH_BYPASS_LEVEL", 5))
+# permessage-deflate 압축 협상 (uvicorn websockets 구현 - python main.py 실행용, uvicorn CLI는 --ws-per-message-deflate)
+WS_PER_MESSAGE_DEFLATE = os.getenv("WS_PER_MESSAGE_DEFLATE", "true").lower() == "true"
+# 재연결 재전송 버퍼 크기 (이벤트 수)와 재전송 불가 시 스냅샷에 담을 최근 위협/알림 수
+WS_REPLAY_BUFFER_SIZE = int(os.getenv("WS_REPLAY_BUFFER_SIZE", 500))
+WS_RESUME_SNAPSHOT_LIMIT = int(os.getenv("WS_RESUME_SNAPSHOT_LIMIT", 20))
+# heartbeat ping 주기 (초, 0 = 비활성)와 이 시간 동안 응답이 없으면 연결 정리
+# (pong으로 응답해 온 클라이언트만 정리, 0 = 정리 안 함 - 나머지는 uvicorn 프로토콜 ping으로 확인)
+WS_HEARTBEAT_INTERVAL = float(os.getenv("WS_HEARTBEAT_INTERVAL", 15))
+WS_IDLE_TIMEOUT = float(os.getenv("WS_IDLE_TIMEOUT", 45))
+# 연결 시 initial_state에 함께 보낼 섹션 (threats,alerts,kpi,distribution,trend / 빈 값 = 상태만)
+WS_INITIAL_SNAPSHOT_SECTIONS = [
+    section.strip()
+    for section in os.getenv("WS_INITIAL_SNAPSHOT_SECTIONS", "threats,alerts,kpi,distribution,trend").split(",")
+    if section.strip()
+]
+# initial_state에 담을 최근 위협 / 읽지 않은 알림 수와 트렌드 포인트 수 (다운샘플링)
+WS_INITIAL_SNAPSHOT_THREATS = int(os.getenv("WS_INITIAL_SNAPSHOT_THREATS", 50))
+WS_INITIAL_SNAPSHOT_ALERTS = int(os.getenv("WS_INITIAL_SNAPSHOT_ALERTS", 20))
+WS_INITIAL_SNAPSHOT_TREND_POINTS = int(os.getenv("WS_INITIAL_SNAPSHOT_TREND_POINTS", 48))
+
+# =============================================================================
+# Alert Persistence
+# =============================================================================
+# 알림 일괄 저장 주기 (초)와 1회 INSERT 최대 건수 (대기 건수가 이 값에 도달하면 즉시 저장)
+ALERT_FLUSH_INTERVAL = float(os.getenv("ALERT_FLUSH_INTERVAL", 1.0))
+ALERT_FLUSH_BATCH = int(os.getenv("ALERT_FLUSH_BATCH", 200))
+# DB 장애 시 메모리에 보관할 최대 대기 알림 수 (초과 시 가장 오래된 알림부터 버림)
+ALERT_WRITER_MAX_PENDING = int(os.getenv("ALERT_WRITER_MAX_PENDING", 10000))
+# 일시적 저장 실패(DB 연결 등) 시 같은 배치를 재시도할 최대 횟수 (저장 주기마다 1회, 초과 시 배치를 버림)
+ALERT_WRITER_MAX_RETRIES = int(os.getenv("ALERT_WRITER_MAX_RETRIES", 30))
+# 알림 폭주 집계 윈도우 (초, 0 = 비활성) - 같은 (카테고리, 레벨, 제목) 알림을 집계 알림 1건으로 묶음
+ALERT_AGGREGATION_WINDOW = float(os.getenv("ALERT_AGGREGATION_WINDOW", 30))
+# 이 레벨 이상의 알림은 집계하지 않고 매번 즉시 전송/저장/외부 채널 발송 (기본: CRITICAL)
+ALERT_AGGREGATION_BYPASS_LEVEL = int(os.getenv("ALERT_AGGREGATION_BYPASS_LEVEL", 5))
+
+# =============================================================================
+# Alert Dispatch (email / sms)
+# =============================================================================
+# 채널별 워커 수 / 대기열 크기 / 실패 시 재시도 횟수
+ALERT_DISPATCH_WORKERS = int(os.getenv("ALERT_DISPATCH_WORKERS", 2))
+ALERT_DISPATCH_QUEUE_SIZE = int(os.getenv("ALERT_DISPATCH_QUEUE_SIZE", 1000))
+ALERT_DISPATCH_RETRIES = int(os.getenv("ALERT_DISPATCH_RETRIES", 3))
+# 채널별 전송률 제한 (초당 건수, 토큰 버킷)과 순간 허용량
+ALERT_EMAIL_RATE = float(os.getenv("ALERT_EMAIL_RATE", 5))
+ALERT_SMS_RATE = float(os.getenv("ALERT_SMS_RATE", 1))
+ALERT_DISPATCH_BURST = int(os.getenv("ALERT_DISPATCH_BURST", 10))
+# 이메일 (SMTP_HOST 미설정 시 비활성)
+SMTP_HOST = os.getenv("SMTP_HOST", "")
+SMTP_PORT = int(os.getenv("SMTP_PORT", 25))
+SMTP_USER = os.getenv("SMTP_USER", "")
+SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
+SMTP_STARTTLS = os.getenv("SMTP_STARTTLS", "false").lower() == "true"
+ALERT_EMAIL_FROM = os.getenv("ALERT_EMAIL_FROM", "argus-sky@localhost")
+ALERT_EMAIL_TO = [addr.strip() for addr in os.getenv("ALERT_EMAIL_TO", "").split(",") if addr.strip()]
+# SMS 게이트웨이 (HTTP POST, SMS_GATEWAY_URL 미설정 시 비활성)
+SMS_GATEWAY_URL = os.getenv("SMS_GATEWAY_URL", "")
+SMS_GATEWAY_TOKEN = os.getenv("SMS_GATEWAY_TOKEN", "")
+ALERT_SMS_TO = [number.strip() for number in os.getenv("ALERT_SMS_TO", "").split(",") if number.strip()]
+
+# =============================================================================
+# Event Bus (multi-worker)
+# =============================================================================
+# memory: 단일 프로세스 | unix: uvicorn --workers N (리더 1개가 시뮬레이션 실행)
+EVENT_BUS_BACKEND = os.getenv("EVENT_BUS_BACKEND", "memory")
+EVENT_BUS_SOCKET_PATH = os.getenv("EVENT_BUS_SOCKET_PATH", "./data/argus-bus.sock")
+EVENT_BUS_LOCK_PATH = os.getenv("EVENT_BUS_LOCK_PATH", "./data/argus-leader.lock")
+
+# =============================================================================
+# Scoring Configuration Overrides (hot reload)
+# =============================================================================
+# JSON 파일로 가중치/신뢰도/레벨을 덮어쓰며, 변경 시 재시작 없이 반영
+SCORING_CONFIG_PATH = os.getenv("SCORING_CONFIG_PATH", "./data/scoring_config.json")
+SCORING_CONFIG_RELOAD_INTERVAL = int(os.getenv("SCORING_CONFIG_RELOAD_INTERVAL", 30))
+# What-if 시뮬레이션 프로세스 풀 크기 (0 = CPU 수)
+WHAT_IF_WORKERS = int(os.getenv("WHAT_IF_WORKERS", 0))
+# 점수 상세 내역 캐시 최대 항목 수
+BREAKDOWN_CACHE_SIZE = int(os.getenv("BREAKDOWN_CACHE_SIZE", 1024))
 
 # =============================================================================
 # Data Source Configuration (for evidence tracking)
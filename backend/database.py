@@ -4,7 +4,7 @@ Supabase PostgreSQL + Full Logging System
 """
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, JSON, ForeignKey, Text, Index
+from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, JSON, ForeignKey, Text, Index, inspect, text
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
 import uuid
@@ -89,6 +89,7 @@ class Alert(Base):
     
     id = Column(String(36), primary_key=True, default=generate_uuid)
     threat_id = Column(String(36), ForeignKey("threats.id"), nullable=True, index=True)
+    category = Column(String(50), nullable=True)  # 위협 카테고리 (시스템 알림은 NULL)
     level = Column(Integer, nullable=False, index=True)  # 1-5
     title = Column(String(500), nullable=False)
     message = Column(Text)
@@ -96,6 +97,10 @@ class Alert(Base):
     is_read = Column(Boolean, default=False, index=True)
     read_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    
+    __table_args__ = (
+        Index('idx_alert_read_created', 'is_read', 'created_at'),
+    )
 
 
 class ThreatIndexHistory(Base):
@@ -322,10 +327,37 @@ class AIReasoningLog(Base):
 # Database Functions
 # =============================================================================
 
+# 기존 테이블에 추가된 nullable 컬럼 / 인덱스 (create_all은 이미 있는 테이블을 변경하지 않음)
+ADDED_COLUMNS = [
+    (Alert.__table__, Alert.__table__.c.category),
+]
+ADDED_INDEXES = [
+    (Alert.__table__, "idx_alert_read_created"),  # 읽음 상태별 최신순 조회 (/alerts)
+]
+
+
+def _upgrade_schema(conn):
+    """기존 DB에 없는 추가 컬럼(ALTER TABLE ADD COLUMN)과 인덱스(CREATE INDEX) 생성"""
+    inspector = inspect(conn)
+    for table, column in ADDED_COLUMNS:
+        existing = {col["name"] for col in inspector.get_columns(table.name)}
+        if column.name not in existing:
+            column_type = column.type.compile(dialect=conn.dialect)
+            conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+            print(f"[DB] Added column {table.name}.{column.name}")
+    for table, index_name in ADDED_INDEXES:
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        if index_name not in existing:
+            index = next(index for index in table.indexes if index.name == index_name)
+            index.create(conn)
+            print(f"[DB] Added index {table.name}.{index_name}")
+
+
 async def init_db():
-    """데이터베이스 초기화 - 테이블 생성"""
+    """데이터베이스 초기화 - 테이블 생성 + 기존 테이블 보강"""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_upgrade_schema)
     print("✅ Database tables created successfully")
 
 
@@ -11,7 +11,15 @@ from database import init_db
 from routers import threats, alerts, analytics, demo, evidence
 from services.websocket_manager import manager
 from services.simulation_scheduler import scheduler
-from config import CORS_ORIGINS, HOST, PORT, DATABASE_URL, USE_SQLITE
+from services.initial_snapshot import initial_snapshot
+from services.alert_service import alert_service
+from services.alert_writer import alert_writer
+from services.alert_dispatcher import alert_dispatcher
+from services.what_if import what_if
+from services.event_bus import event_bus
+from services.event_pipeline import pipeline
+from services.load_generator import load_generator
+from config import CORS_ORIGINS, HOST, PORT, DATABASE_URL, USE_SQLITE, WS_PER_MESSAGE_DEFLATE
 
 
 @asynccontextmanager
@@ -23,7 +31,13 @@ async def lifespan(app: FastAPI):
     if not USE_SQLITE:
         print(f"🔗 Connection: {DATABASE_URL[:50]}...")
     await init_db()
-    await scheduler.start()
+    # 저장된 최근 알림 적재 + 알림 일괄 저장 시작
+    await alert_service.restore()
+    alert_writer.start()
+    alert_dispatcher.start()
+    # 리더로 선출된 워커만 시뮬레이션 실행 (memory 백엔드는 항상 리더)
+    await event_bus.start(on_leader=scheduler.start)
+    manager.start_heartbeat()
     print("✅ Server is ready!")
     print(f"📡 API Docs: http://localhost:{PORT}/docs")
     
@@ -32,6 +46,12 @@ async def lifespan(app: FastAPI):
     # Shutdown
     print("🛑 Shutting down...")
     scheduler.stop()
+    await manager.stop_heartbeat()
+    await alert_service.flush_aggregates()
+    await alert_dispatcher.stop()
+    await alert_writer.stop()
+    await event_bus.stop()
+    what_if.shutdown()
     print("👋 Goodbye!")
 
 
@@ -87,17 +107,15 @@ async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     
     try:
-        # 연결 시 현재 위협 지수 전송
-        state = scheduler.get_current_state()
-        await websocket.send_json({
-            "type": "initial_state",
-            "data": state
-        })
+        # 연결 시 현재 상태 + 대시보드 초기 데이터 전송 (상태 버전별로 한 번만 직렬화)
+        await initial_snapshot.send(websocket)
+        # 이후 threat_index_delta 적용 기준이 되는 전체 상태 (seq 포함)
+        await manager.send_threat_index_snapshot(websocket)
         
-        # 연결 유지
+        # 클라이언트 메시지 처리 (구독/구독 해제)
         while True:
             data = await websocket.receive_text()
-            # 클라이언트 메시지 처리 (필요시)
+            await manager.handle_client_message(websocket, data)
             
     except WebSocketDisconnect:
         await manager.disconnect(websocket)
@@ -127,6 +145,15 @@ async def health_check():
         "service": "ARGUS SKY",
         "simulation_running": state["is_running"],
         "websocket_connections": manager.connection_count,
+        "websocket_reaped": manager.reaped,
+        "websocket_clients": manager.get_connection_stats(),
+        "event_bus": event_bus.stats(),
+        "event_pipeline": pipeline.stats(),
+        "initial_snapshot": initial_snapshot.stats(),
+        "alert_writer": alert_writer.stats(),
+        "alert_aggregation": alert_service.stats(),
+        "alert_dispatch": alert_dispatcher.stats(),
+        "load_generator": load_generator.stats(),
     }
 
 
@@ -136,6 +163,7 @@ if __name__ == "__main__":
         host=HOST,
         port=PORT,
         reload=True,
-        log_level="info"
+        log_level="info",
+        ws_per_message_deflate=WS_PER_MESSAGE_DEFLATE
     )
 
@@ -2,45 +2,22 @@
 ARGUS SKY - Alerts Router
 알림 관리 API 엔드포인트
 """
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func, desc
 from typing import Optional, List
-from datetime import datetime, timedelta
-import random
-import uuid
+from datetime import datetime
 
+from database import get_db, Alert
 from schemas import AlertResponse
-from services.osint_simulator import simulator
+from services.initial_snapshot import initial_snapshot
+from services.alert_store import alert_store
+from services.alert_writer import alert_writer
+from services.event_bus import event_bus
+from config import WS_INITIAL_SNAPSHOT_ALERTS
 
 router = APIRouter()
 
-# 인메모리 알림 저장소 (데모용)
-_alerts_store: List[dict] = []
-
-
-def _initialize_alerts():
-    """초기 알림 데이터 생성"""
-    global _alerts_store
-    if _alerts_store:
-        return
-    
-    # 샘플 알림 생성
-    categories = ["terror", "cyber", "smuggling", "drone", "insider", "geopolitical"]
-    
-    for i in range(15):
-        threat = simulator.generate_threat(random.choice(categories))
-        alert = simulator.generate_alert_from_threat(threat)
-        alert["is_read"] = random.random() > 0.4
-        
-        # 시간 분산
-        hours_ago = random.randint(0, 48)
-        created_at = datetime.utcnow() - timedelta(hours=hours_ago)
-        alert["created_at"] = created_at.isoformat()
-        
-        _alerts_store.append(alert)
-    
-    # 최신순 정렬
-    _alerts_store.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-
 
 def format_time_ago(dt: datetime) -> str:
     """시간 경과 포맷팅"""
@@ -63,87 +40,117 @@ def format_time_ago(dt: datetime) -> str:
         return f"{days}일 전"
 
 
+def _alert_response(alert) -> dict:
+    """alerts 테이블 행(ORM 객체 또는 저장 대기 중인 행 dict) → 응답"""
+    get = alert.get if isinstance(alert, dict) else lambda key: getattr(alert, key)
+    return {
+        "id": get("id"),
+        "threat_id": get("threat_id"),
+        "category": get("category"),
+        "level": get("level"),
+        "title": get("title"),
+        "message": get("message"),
+        "is_read": get("is_read"),
+        "created_at": get("created_at"),
+        "time_ago": format_time_ago(get("created_at")),
+    }
+
+
 @router.get("", response_model=List[AlertResponse])
 async def get_alerts(
     is_read: Optional[bool] = Query(None, description="읽음 상태 필터"),
     level: Optional[int] = Query(None, ge=1, le=5, description="알림 레벨"),
     limit: int = Query(20, ge=1, le=50, description="결과 수"),
+    db: AsyncSession = Depends(get_db)
 ):
-    """알림 목록 조회"""
-    _initialize_alerts()
-    
-    alerts = _alerts_store.copy()
-    
-    # 필터링
+    """알림 목록 조회 (is_read+created_at / level 인덱스 사용, 아직 저장되지 않은 알림 병합)"""
+    query = select(Alert)
     if is_read is not None:
-        alerts = [a for a in alerts if a.get("is_read") == is_read]
-    
+        query = query.where(Alert.is_read == is_read)
     if level:
-        alerts = [a for a in alerts if a.get("level") == level]
-    
-    # 최신순 정렬
-    alerts.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-    
-    # 제한
-    alerts = alerts[:limit]
-    
-    # time_ago 추가
-    for alert in alerts:
-        created_at = alert.get("created_at", "")
-        if created_at:
-            try:
-                dt = datetime.fromisoformat(created_at.replace('Z', ''))
-                alert["time_ago"] = format_time_ago(dt)
-            except:
-                alert["time_ago"] = "알 수 없음"
-    
+        query = query.where(Alert.level == level)
+    query = query.order_by(desc(Alert.created_at)).limit(limit)
+    
+    result = await db.execute(query)
+    alerts = [_alert_response(alert) for alert in result.scalars().all()]
+    
+    # 저장 대기열은 최신순이므로 조건에 맞는 limit개까지만 확인 (조회 도중 저장된 행은 id로 중복 제거)
+    seen = {alert["id"] for alert in alerts}
+    pending = []
+    for row in alert_writer.pending_rows():
+        if len(pending) >= limit:
+            break
+        if (is_read is not None and row["is_read"] != is_read) or (level and row["level"] != level):
+            continue
+        if row["id"] not in seen:
+            pending.append(_alert_response(row))
+    
+    if pending:
+        alerts = sorted(pending + alerts, key=lambda x: x["created_at"], reverse=True)[:limit]
     return alerts
 
 
 @router.post("/{alert_id}/read")
-async def mark_alert_read(alert_id: str):
-    """알림 읽음 처리"""
-    _initialize_alerts()
-    
-    for alert in _alerts_store:
-        if alert.get("id") == alert_id:
-            alert["is_read"] = True
-            return {"success": True, "message": "Alert marked as read"}
-    
-    raise HTTPException(status_code=404, detail="Alert not found")
+async def mark_alert_read(alert_id: str, db: AsyncSession = Depends(get_db)):
+    """알림 읽음 처리 (저장 대기 중인 알림은 저장 시 반영)"""
+    was_unread = alert_writer.mark_read(alert_id)
+    if was_unread is None:
+        result = await db.execute(
+            update(Alert)
+            .where(Alert.id == alert_id, Alert.is_read == False)
+            .values(is_read=True, read_at=datetime.utcnow())
+        )
+        was_unread = result.rowcount > 0
+        if not was_unread:
+            stored = alert_store.get(alert_id)
+            if stored is not None:
+                # 다른 워커(리더)의 저장 대기열에 있는 알림
+                was_unread = not stored.get("is_read")
+            elif not await db.scalar(select(func.count()).select_from(Alert).where(Alert.id == alert_id)):
+                raise HTTPException(status_code=404, detail="Alert not found")
+    
+    await event_bus.publish("alerts", {"kind": "read", "id": alert_id, "was_unread": was_unread})
+    return {"success": True, "message": "Alert marked as read"}
 
 
 @router.post("/read-all")
-async def mark_all_read():
-    """모든 알림 읽음 처리"""
-    _initialize_alerts()
-    
-    count = 0
-    for alert in _alerts_store:
-        if not alert.get("is_read"):
-            alert["is_read"] = True
-            count += 1
-    
+async def mark_all_read(db: AsyncSession = Depends(get_db)):
+    """모든 알림 읽음 처리 (UPDATE 1회 + 저장 대기 중인 알림)"""
+    result = await db.execute(
+        update(Alert)
+        .where(Alert.is_read == False)
+        .values(is_read=True, read_at=datetime.utcnow())
+    )
+    count = result.rowcount + alert_writer.mark_all_read()
+    
+    await event_bus.publish("alerts", {"kind": "read_all"})
     return {"success": True, "message": f"{count} alerts marked as read"}
 
 
 @router.get("/unread-count")
 async def get_unread_count():
-    """읽지 않은 알림 수"""
-    _initialize_alerts()
-    
-    count = sum(1 for a in _alerts_store if not a.get("is_read"))
-    return {"unread_count": count}
+    """읽지 않은 알림 수 (restore에서 DB 값으로 초기화한 카운터 - 새 알림/읽음 처리 시 갱신)"""
+    return {"unread_count": alert_store.unread_count}
+
+
+async def apply_read_event(message: dict):
+    """읽음 처리 이벤트를 모든 워커에 반영 (리더의 저장 대기열, 최근 알림 저장소, 읽지 않은 알림 수)"""
+    if message.get("kind") == "read":
+        alert_writer.mark_read(message["id"])
+        alert_store.mark_read(message["id"], message.get("was_unread", False))
+    elif message.get("kind") == "read_all":
+        alert_writer.mark_all_read()
+        alert_store.mark_all_read()
+    else:
+        return
+    initial_snapshot.invalidate()
 
 
-def add_alert(alert: dict):
-    """새 알림 추가 (내부용)"""
-    global _alerts_store
-    _initialize_alerts()
-    
-    _alerts_store.insert(0, alert)
-    
-    # 최대 100개 유지
-    if len(_alerts_store) > 100:
-        _alerts_store = _alerts_store[:100]
+def get_recent_alerts(limit: int = WS_INITIAL_SNAPSHOT_ALERTS) -> List[dict]:
+    """최근 알림 (최신순, 읽음 여부 포함 - WebSocket initial_state용, GET /alerts?limit와 동일)"""
+    return alert_store.recent(limit)
+
+
+initial_snapshot.register("alerts", get_recent_alerts)
+event_bus.subscribe("alerts", apply_read_event)
 
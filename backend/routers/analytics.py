@@ -2,17 +2,26 @@
 ARGUS SKY - Analytics Router
 분석 및 통계 API 엔드포인트
 """
-from fastapi import APIRouter, Query
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from datetime import datetime, timedelta
-import random
-
-from schemas import ThreatIndexResponse, TrendDataPoint, CategoryDistribution, SourceStats, CategoryIndex
+import asyncio
+from database import get_db
+from schemas import ThreatIndexResponse, TrendDataPoint, CategoryDistribution, SourceStats, CategoryIndex, WhatIfRequest
+from services.backtest import backtest_window, load_threat_columns, run_backtest
+from services.scoring_tables import scoring_config
+from services.what_if import candidate_tables, what_if
 from services.simulation_scheduler import scheduler
 from services.threat_calculator import calculator
+from services.randomness import make_rng
+from services.initial_snapshot import initial_snapshot
 
 router = APIRouter()
 
+# 시뮬레이션 변동값용 난수 생성기 (RANDOM_SEED 설정 시 결정적)
+_rng = make_rng("analytics")
+
 
 @router.get("/threat-index", response_model=ThreatIndexResponse)
 async def get_current_threat_index():
@@ -24,11 +33,66 @@ async def get_current_threat_index():
         "level": state["level"],
         "level_name": state["level_name"],
         "categories": CategoryIndex(**state["categories"]),
-        "change_24h": round(random.uniform(-5, 5), 1),
+        "change_24h": round(_rng.uniform(-5, 5), 1),
         "timestamp": datetime.utcnow(),
     }
 
 
+@router.get("/category-scores")
+async def get_category_scores():
+    """활성 위협 점수 기반 카테고리별 지수 (증분 집계)"""
+    return scheduler.get_category_scores()
+
+
+@router.get("/backtest")
+async def get_backtest(
+    days: float = Query(90, gt=0, le=365, description="재계산 기간 (일)"),
+    step_hours: float = Query(1.0, ge=0.25, le=24, description="평가 간격 (시간)"),
+    max_age_hours: Optional[float] = Query(None, gt=0, description="이 시간보다 오래된 위협 제외"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    저장된 위협으로 과거 시점별 위협 지수 재계산 (현재 점수 설정 기준)
+    """
+    start, end, since = backtest_window(days, max_age_hours)
+    columns = await load_threat_columns(db, end, since=since)
+    
+    # 벡터 연산은 이벤트 루프 밖에서 실행
+    return await asyncio.to_thread(run_backtest, columns, start, end, step_hours, None, max_age_hours)
+
+
+@router.post("/what-if")
+async def run_what_if(request: WhatIfRequest, db: AsyncSession = Depends(get_db)):
+    """
+    후보 가중치 세트별 과거 지수 곡선 비교
+    
+    후보마다 프로세스 풀 워커 1개에서 계산하며, 과거 위협 배열은 공유 메모리로 전달
+    """
+    base = scoring_config.tables
+    try:
+        candidates = [
+            (candidate.name, candidate_tables(candidate.category_weights, candidate.source_credibility, base))
+            for candidate in request.candidates
+        ]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if request.include_baseline:
+        candidates.insert(0, ("baseline", base))
+    
+    start, end, since = backtest_window(request.days, request.max_age_hours)
+    columns = await load_threat_columns(db, end, base, since)
+    
+    return await what_if.evaluate(
+        columns,
+        start,
+        end,
+        candidates,
+        step_hours=request.step_hours,
+        max_age_hours=request.max_age_hours,
+        include_categories=request.include_categories,
+    )
+
+
 @router.get("/trend", response_model=List[TrendDataPoint])
 async def get_trend(
     hours: int = Query(24, ge=1, le=720, description="시간 범위"),
@@ -57,7 +121,7 @@ async def get_trend(
         
         # 시간에 따른 변동 시뮬레이션
         time_factor = 1 + 0.1 * ((i % 12) - 6) / 6  # 주기적 변동
-        noise = random.uniform(-5, 5)
+        noise = _rng.uniform(-5, 5)
         
         # 총 지수
         total = max(10, min(95, base_index * time_factor + noise))
@@ -65,7 +129,7 @@ async def get_trend(
         # 카테고리별 지수
         category_values = {}
         for cat, val in base_categories.items():
-            cat_noise = random.uniform(-8, 8)
+            cat_noise = _rng.uniform(-8, 8)
             category_values[cat] = max(10, min(95, val * time_factor + cat_noise))
         
         data_points.append({
@@ -80,30 +144,7 @@ async def get_trend(
 @router.get("/category-distribution", response_model=List[CategoryDistribution])
 async def get_category_distribution():
     """카테고리별 위협 분포"""
-    threats = scheduler.get_threats(limit=100)
-    
-    # 카테고리별 집계
-    category_counts = {}
-    total = len(threats)
-    
-    for threat in threats:
-        cat = threat.get("category", "unknown")
-        category_counts[cat] = category_counts.get(cat, 0) + 1
-    
-    # 결과 생성
-    distribution = []
-    for cat, count in category_counts.items():
-        percentage = (count / total * 100) if total > 0 else 0
-        distribution.append({
-            "category": cat,
-            "count": count,
-            "percentage": round(percentage, 1),
-        })
-    
-    # 카운트 내림차순 정렬
-    distribution.sort(key=lambda x: x["count"], reverse=True)
-    
-    return distribution
+    return scheduler.get_category_distribution()
 
 
 @router.get("/source-stats", response_model=List[SourceStats])
@@ -140,27 +181,19 @@ async def get_source_stats():
     return stats
 
 
+def kpi_metrics() -> dict:
+    """주요 KPI 지표 (GET /kpi, WebSocket initial_state 공용)"""
+    return {
+        **scheduler.get_kpi(),
+        "avg_response_time_minutes": _rng.randint(5, 15),  # 시뮬레이션
+        "change_vs_yesterday": round(_rng.uniform(-10, 10), 1),
+    }
+
+
 @router.get("/kpi")
 async def get_kpi_metrics():
     """주요 KPI 지표"""
-    threats = scheduler.get_threats(limit=100)
-    state = scheduler.get_current_state()
-    
-    # 통계 계산
-    total_threats = len(threats)
-    resolved = sum(1 for t in threats if t.get("status") == "resolved")
-    confirmed = sum(1 for t in threats if t.get("status") == "confirmed")
-    
-    severities = [t.get("severity", 0) for t in threats]
-    avg_severity = sum(severities) / len(severities) if severities else 0
-    
-    return {
-        "avg_threat_index": state["total_index"],
-        "total_threats_detected": total_threats,
-        "resolved_rate": round(resolved / total_threats * 100, 1) if total_threats > 0 else 0,
-        "confirmed_threats": confirmed,
-        "avg_severity": round(avg_severity, 1),
-        "avg_response_time_minutes": random.randint(5, 15),  # 시뮬레이션
-        "change_vs_yesterday": round(random.uniform(-10, 10), 1),
-    }
+    return kpi_metrics()
+
 
+initial_snapshot.register("kpi", kpi_metrics)
@@ -2,10 +2,11 @@
 ARGUS SKY - Demo Router
 데모 시나리오 API 엔드포인트
 """
-from fastapi import APIRouter, HTTPException
-from typing import Literal
+from fastapi import APIRouter, HTTPException, Query
+from typing import Literal, Optional
 
 from services.simulation_scheduler import scheduler
+from config import LOAD_GEN_RATE, LOAD_GEN_MAX_RATE
 
 router = APIRouter()
 
@@ -55,6 +56,35 @@ async def trigger_scenario(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/load/start")
+async def start_load(
+    rate: int = Query(LOAD_GEN_RATE, ge=1, le=LOAD_GEN_MAX_RATE, description="초당 생성할 위협 수"),
+    duration: Optional[float] = Query(None, gt=0, description="자동 종료까지 시간 (초, 미지정 시 stop까지)"),
+    alerts: bool = Query(False, description="심각도 50 이상 위협의 알림도 생성")
+):
+    """부하 생성 모드 시작 - 합성 위협을 활성 위협 저장소와 이벤트 파이프라인에 주입 (리더 워커에서 실행)"""
+    await scheduler.start_load(rate=rate, duration=duration, alerts=alerts)
+    
+    return {
+        "success": True,
+        "rate": rate,
+        "duration": duration,
+        "alerts": alerts,
+        "message": f"부하 생성이 시작되었습니다 (초당 {rate}건). 진행 상황은 /health의 load_generator에서 확인하세요."
+    }
+
+
+@router.post("/load/stop")
+async def stop_load():
+    """부하 생성 모드 중지"""
+    await scheduler.stop_load()
+    
+    return {
+        "success": True,
+        "message": "부하 생성이 중지되었습니다."
+    }
+
+
 @router.get("/status")
 async def get_demo_status():
     """데모 상태 조회"""
@@ -99,9 +129,8 @@ async def get_demo_status():
 @router.post("/reset")
 async def reset_demo():
     """데모 상태 초기화"""
-    # 스케줄러 재시작
-    scheduler.stop()
-    await scheduler.start()
+    # 스케줄러 재시작 (다중 워커에서는 리더 워커가 실행)
+    await scheduler.restart()
     
     return {
         "success": True,
@@ -18,7 +18,9 @@ from database import (
     ThreatIndexHistory,
     AIReasoningLog
 )
-from config import DATA_SOURCES, CATEGORY_WEIGHTS, THREAT_LEVELS, SCORE_CALCULATION
+from config import SCORE_CALCULATION
+from services.breakdown_cache import breakdown_cache
+from services.scoring_tables import scoring_config
 from services.threat_calculator import calculator
 from services.simulation_scheduler import scheduler
 
@@ -35,7 +37,7 @@ async def get_data_sources():
     - 모든 데이터 소스의 설명, 신뢰도, 수집 방법 제공
     """
     return {
-        "sources": DATA_SOURCES,
+        "sources": dict(scoring_config.tables.source_config),
         "description": "ARGUS SKY에서 위협 정보를 수집하는 모든 데이터 출처 목록",
         "credibility_scale": {
             "1.0": "완전 신뢰 (정부 공식 발표)",
@@ -53,10 +55,11 @@ async def get_category_info():
     위협 카테고리 정보 조회
     - 각 카테고리의 가중치와 설명 제공
     """
+    tables = scoring_config.tables
     return {
-        "categories": CATEGORY_WEIGHTS,
+        "categories": dict(tables.category_config),
         "description": "위협 지수 계산에 사용되는 카테고리별 가중치",
-        "total_weight": sum(c["weight"] for c in CATEGORY_WEIGHTS.values())
+        "total_weight": sum(tables.category_weights)
     }
 
 
@@ -67,7 +70,7 @@ async def get_threat_levels():
     - 각 레벨의 범위, 색상, 설명 제공
     """
     return {
-        "levels": THREAT_LEVELS,
+        "levels": dict(scoring_config.tables.level_config),
         "description": "위협 지수에 따른 경보 레벨 정의"
     }
 
@@ -84,6 +87,43 @@ async def get_calculation_formulas():
     }
 
 
+@router.get("/scoring-config")
+async def get_scoring_config_status():
+    """
+    현재 적용 중인 점수 설정 테이블 정보
+    """
+    tables = scoring_config.tables
+    return {
+        "version": tables.version,
+        "source_path": tables.source_path,
+        "watched_path": scoring_config.path,
+        "loaded_at": tables.loaded_at,
+        "category_weights": dict(zip(tables.category_names, tables.category_weights)),
+        "source_credibility": dict(zip(tables.source_names, tables.source_credibility)),
+        "level_floors": dict(zip(tables.levels, tables.level_floors))
+    }
+
+
+@router.post("/scoring-config/reload")
+async def reload_scoring_config():
+    """
+    점수 설정 파일 즉시 리로드 (서버 재시작 없음)
+    """
+    try:
+        tables = scoring_config.reload()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    scheduler.sync_scoring_config()
+    await scheduler.publish_scoring_config()
+    
+    return {
+        "success": True,
+        "version": tables.version,
+        "loaded_at": tables.loaded_at
+    }
+
+
 # =============================================================================
 # Score Calculation Evidence
 # =============================================================================
@@ -96,7 +136,16 @@ async def get_threat_score_breakdown(
     """
     특정 위협의 점수 계산 상세 내역 조회
     - 점수가 어떻게 산출되었는지 단계별 확인
+    - 감쇠 구간/설정 버전이 같으면 캐시된 내역 반환 (DB 조회 없음)
     """
+    now = datetime.utcnow()
+    config_version = scoring_config.version
+    
+    cached = breakdown_cache.get(breakdown_cache.key_for(threat_id, config_version, now))
+    if cached is not None:
+        hours_ago = (now - breakdown_cache.created_at(threat_id)).total_seconds() / 3600
+        return _with_hours_ago(cached, hours_ago)
+    
     # Get threat
     result = await db.execute(select(Threat).where(Threat.id == threat_id))
     threat = result.scalar_one_or_none()
@@ -104,18 +153,18 @@ async def get_threat_score_breakdown(
     if not threat:
         raise HTTPException(status_code=404, detail="Threat not found")
     
-    # Calculate score with full details
-    score, details = calculator.calculate_threat_score(threat, include_details=True)
+    # Calculate score, then render the step-by-step explanation
+    score_result = calculator.score_threat(threat, now)
     
     # Get source info
     source_info = calculator.get_source_info(threat.source_type)
     category_info = calculator.get_category_info(threat.category)
     
-    return {
+    payload = {
         "threat_id": threat_id,
         "threat_title": threat.title,
-        "threat_score": score,
-        "calculation_details": details,
+        "threat_score": score_result.score,
+        "calculation_details": score_result.explain(),
         "source_evidence": {
             "source_type": threat.source_type,
             "source_name": threat.source_name,
@@ -130,6 +179,21 @@ async def get_threat_score_breakdown(
             "updated_at": threat.updated_at
         }
     }
+    breakdown_cache.put((threat_id, score_result.decay_bucket, config_version), threat.created_at, payload)
+    return payload
+
+
+def _with_hours_ago(payload: dict, hours_ago: float) -> dict:
+    """캐시된 내역의 경과 시간만 현재 값으로 교체 (캐시 항목은 변경하지 않음)"""
+    details = payload["calculation_details"]
+    temporal = {**details["temporal_details"], "hours_ago": round(hours_ago, 2)}
+    return {**payload, "calculation_details": {**details, "temporal_details": temporal}}
+
+
+@router.get("/score-breakdown/cache-stats")
+async def get_breakdown_cache_stats():
+    """점수 상세 내역 캐시 적중률 통계"""
+    return breakdown_cache.stats()
 
 
 @router.get("/threat/{threat_id}/raw-data")
@@ -657,8 +721,8 @@ async def get_evidence_summary(
             "threats_processed": threat_count.scalar() or 0,
             "index_snapshots": history_count.scalar() or 0
         },
-        "data_sources_configured": len(DATA_SOURCES),
-        "categories_configured": len(CATEGORY_WEIGHTS),
+        "data_sources_configured": len(scoring_config.tables.source_names),
+        "categories_configured": len(scoring_config.tables.category_names),
         "system_status": "operational"
     }
 
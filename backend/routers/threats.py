@@ -3,7 +3,7 @@ ARGUS SKY - Threats Router
 위협 정보 API 엔드포인트
 """
 from fastapi import APIRouter, Query, HTTPException
-from typing import Optional, List
+from typing import Optional, List, Literal
 from datetime import datetime, timedelta
 
 from schemas import ThreatResponse, ThreatSummary
@@ -136,3 +136,16 @@ async def get_threat(threat_id: str):
     
     raise HTTPException(status_code=404, detail="Threat not found")
 
+
+@router.post("/{threat_id}/status")
+async def update_threat_status(
+    threat_id: str,
+    status: Literal["new", "analyzing", "confirmed", "resolved", "false_positive"] = Query(..., description="변경할 상태"),
+):
+    """위협 상태 변경"""
+    threat = await scheduler.update_threat_status(threat_id, status)
+    
+    if threat is None:
+        raise HTTPException(status_code=404, detail="Threat not found")
+    
+    return {"success": True, "threat_id": threat_id, "status": status}
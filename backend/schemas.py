@@ -1,7 +1,7 @@
 """
 ARGUS SKY - Pydantic Schemas
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List, Dict
 from datetime import datetime
 
@@ -59,6 +59,7 @@ class AlertCreate(AlertBase):
 class AlertResponse(AlertBase):
     id: str
     threat_id: Optional[str]
+    category: Optional[str] = None
     is_read: bool
     created_at: datetime
     time_ago: str = ""
@@ -109,6 +110,21 @@ class SourceStats(BaseModel):
     avg_credibility: float
 
 
+class WhatIfCandidate(BaseModel):
+    name: str
+    category_weights: Dict[str, float] = {}  # category -> weight (미지정 카테고리는 현재 설정 사용)
+    source_credibility: Dict[str, float] = {}  # source_type -> credibility
+
+
+class WhatIfRequest(BaseModel):
+    candidates: List[WhatIfCandidate] = Field(min_length=1, max_length=8)
+    days: float = Field(30, gt=0, le=365)
+    step_hours: float = Field(1.0, ge=0.25, le=24)
+    max_age_hours: Optional[float] = Field(None, gt=0)
+    include_baseline: bool = True
+    include_categories: bool = False
+
+
 # ============ WebSocket Schemas ============
 class WebSocketMessage(BaseModel):
     type: str  # threat_index, new_threat, new_alert, threat_update
@@ -0,0 +1,203 @@
+"""
+ARGUS SKY - Alert Channel Stand-in Servers
+알림 전송 테스트용 로컬 SMTP 서버 + SMS 게이트웨이(HTTP) 대역 서버
+
+수신한 메일/SMS를 출력하고 건수를 집계합니다. --fail-rate로 일시적 실패
+(SMTP 451 / HTTP 503)를, --latency로 응답 지연을 흉내 내 재시도·전송률 제한을 확인할 수 있습니다.
+
+실행 (backend 디렉토리에서):
+    python -m scripts.alert_standin_servers --smtp-port 2525 --http-port 8025
+
+서버 설정:
+    SMTP_HOST=127.0.0.1 SMTP_PORT=2525 ALERT_EMAIL_TO=ops@localhost \\
+    SMS_GATEWAY_URL=http://127.0.0.1:8025/sms ALERT_SMS_TO=010-0000-0000
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+
+class Counters:
+    def __init__(self):
+        self.started = time.monotonic()
+        self.emails = 0
+        self.sms = 0
+        self.failures = 0
+        self.smtp_connections = 0
+        self.http_connections = 0
+
+    def summary(self) -> str:
+        elapsed = time.monotonic() - self.started
+        return (
+            f"emails={self.emails} sms={self.sms} injected_failures={self.failures} "
+            f"smtp_connections={self.smtp_connections} http_connections={self.http_connections} "
+            f"elapsed={elapsed:.0f}s"
+        )
+
+
+class StandinServers:
+    def __init__(self, fail_rate: float, latency: float, quiet: bool):
+        self.fail_rate = fail_rate
+        self.latency = latency
+        self.quiet = quiet
+        self.counters = Counters()
+
+    def _should_fail(self) -> bool:
+        if self.fail_rate > 0 and random.random() < self.fail_rate:
+            self.counters.failures += 1
+            return True
+        return False
+
+    # =========================================================================
+    # SMTP (HELO/EHLO, MAIL, RCPT, DATA, RSET, NOOP, QUIT)
+    # =========================================================================
+
+    async def handle_smtp(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.counters.smtp_connections += 1
+
+        async def reply(line: str):
+            writer.write(f"{line}\r\n".encode())
+            await writer.drain()
+
+        await reply("220 argus-standin ESMTP")
+        recipients = []
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.decode(errors="replace").strip()
+                verb = command[:4].upper()
+                if verb == "EHLO":
+                    await reply("250-argus-standin")
+                    await reply("250 8BITMIME")
+                elif verb == "HELO":
+                    await reply("250 argus-standin")
+                elif verb == "MAIL":
+                    recipients = []
+                    await reply("250 OK")
+                elif verb == "RCPT":
+                    recipients.append(command[8:].strip(" <>"))
+                    await reply("250 OK")
+                elif verb == "DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    subject = ""
+                    while True:
+                        data = await reader.readline()
+                        if not data or data in (b".\r\n", b".\n"):
+                            break
+                        if data.lower().startswith(b"subject:"):
+                            subject = data.decode(errors="replace")[8:].strip()
+                    if self.latency:
+                        await asyncio.sleep(self.latency)
+                    if self._should_fail():
+                        await reply("451 Temporary failure (injected)")
+                        continue
+                    self.counters.emails += 1
+                    if not self.quiet:
+                        print(f"[SMTP] #{self.counters.emails} to={','.join(recipients)} subject={subject}")
+                    await reply("250 OK queued")
+                elif verb == "RSET":
+                    recipients = []
+                    await reply("250 OK")
+                elif verb == "NOOP":
+                    await reply("250 OK")
+                elif verb == "QUIT":
+                    await reply("221 Bye")
+                    break
+                else:
+                    await reply("502 Command not implemented")
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    # =========================================================================
+    # HTTP SMS gateway (POST /sms, keep-alive)
+    # =========================================================================
+
+    async def handle_http(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.counters.http_connections += 1
+
+        async def respond(status: str, body: dict):
+            payload = json.dumps(body).encode()
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(payload)}\r\nConnection: keep-alive\r\n\r\n".encode() + payload
+            )
+            await writer.drain()
+
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode().split(" ", 2)
+                length = 0
+                while True:
+                    header = await reader.readline()
+                    if header in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = header.decode().partition(":")
+                    if name.strip().lower() == "content-length":
+                        length = int(value.strip())
+                body = await reader.readexactly(length) if length else b""
+
+                if method != "POST" or path != "/sms":
+                    await respond("404 Not Found", {"error": "not found"})
+                    continue
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                if self._should_fail():
+                    await respond("503 Service Unavailable", {"error": "injected failure"})
+                    continue
+                message = json.loads(body or b"{}")
+                self.counters.sms += 1
+                if not self.quiet:
+                    print(f"[SMS] #{self.counters.sms} to={message.get('to')} message={message.get('message')}")
+                await respond("200 OK", {"status": "queued", "id": self.counters.sms})
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def report(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            print(f"[Standin] {self.counters.summary()}")
+
+
+async def main_async(args):
+    servers = StandinServers(args.fail_rate, args.latency, args.quiet)
+    smtp = await asyncio.start_server(servers.handle_smtp, args.host, args.smtp_port)
+    http = await asyncio.start_server(servers.handle_http, args.host, args.http_port)
+    print(f"[Standin] SMTP on {args.host}:{args.smtp_port}, SMS gateway on http://{args.host}:{args.http_port}/sms")
+    reporter = asyncio.create_task(servers.report(args.report_interval))
+    try:
+        async with smtp, http:
+            await asyncio.gather(smtp.serve_forever(), http.serve_forever())
+    finally:
+        reporter.cancel()
+        print(f"[Standin] {servers.counters.summary()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="알림 채널(SMTP / SMS 게이트웨이) 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소")
+    parser.add_argument("--smtp-port", type=int, default=2525, help="SMTP 포트")
+    parser.add_argument("--http-port", type=int, default=8025, help="SMS 게이트웨이 HTTP 포트")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="일시적 실패 응답 비율 (0-1)")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--report-interval", type=float, default=10.0, help="수신 건수 출력 주기 (초)")
+    parser.add_argument("--quiet", action="store_true", help="건별 출력 생략")
+    args = parser.parse_args()
+    try:
+        asyncio.run(main_async(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
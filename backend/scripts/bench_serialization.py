@@ -0,0 +1,114 @@
+"""
+ARGUS SKY - WebSocket Broadcast Serialization Benchmark
+브로드캐스트 1회당 직렬화 CPU 비용 비교 (기존 _serialize + json.dumps vs orjson)
+
+실행 (backend 디렉토리에서):
+    python -m scripts.bench_serialization --clients 50 --iterations 2000
+"""
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+import argparse
+import json
+import random
+import time
+
+from services.osint_simulator import OsintSimulator
+from services.serialization import dumps
+
+
+def _legacy_serialize(obj: Any) -> Any:
+    """변경 전 WebSocketManager._serialize"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    elif hasattr(obj, '__dict__'):
+        return {k: _legacy_serialize(v) for k, v in obj.__dict__.items() if not k.startswith('_')}
+    elif isinstance(obj, dict):
+        return {k: _legacy_serialize(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [_legacy_serialize(item) for item in obj]
+    return obj
+
+
+def legacy_broadcast(message: Dict, clients: int):
+    """기존 경로: 재귀 변환 + json.dumps, 서버가 클라이언트마다 UTF-8 인코딩"""
+    data = json.dumps(_legacy_serialize(message), ensure_ascii=False)
+    for _ in range(clients):
+        data.encode("utf-8")
+
+
+def orjson_broadcast(message: Dict, clients: int):
+    """새 경로: orjson 1회 직렬화, 같은 bytes를 모든 클라이언트에 바이너리 프레임으로 전송 (재인코딩 없음)"""
+    dumps(message)
+
+
+def build_messages(seed: int = 42) -> Dict[str, Dict]:
+    """대표 메시지 형태 (threat_index / new_threat / demo_event)"""
+    simulator = OsintSimulator(random.Random(seed))
+    threat = simulator.generate_threat("cyber")
+    now = datetime.utcnow()
+
+    return {
+        "threat_index": {
+            "type": "threat_index",
+            "data": {
+                "total_index": 47.3,
+                "level": 3,
+                "level_name": "ELEVATED",
+                "categories": {
+                    "terror": 32.1, "cyber": 58.4, "smuggling": 27.9,
+                    "drone": 44.0, "insider": 21.5, "geopolitical": 39.8,
+                },
+                "change_24h": -1.2,
+                "timestamp": now.isoformat(),
+            },
+            "timestamp": now.isoformat(),
+        },
+        "new_threat": {
+            "type": "new_threat",
+            "data": threat,
+            "timestamp": now.isoformat(),
+        },
+        "demo_event": {
+            "type": "demo_event",
+            "event": "cyber_attack",
+            "data": {
+                "message": "사이버 공격 시나리오가 실행되었습니다",
+                "threat": threat,
+            },
+            "timestamp": now.isoformat(),
+        },
+    }
+
+
+def measure(func: Callable, message: Dict, clients: int, iterations: int) -> float:
+    """브로드캐스트 1회당 CPU 시간 (µs)"""
+    for _ in range(min(100, iterations)):
+        func(message, clients)
+
+    start = time.process_time()
+    for _ in range(iterations):
+        func(message, clients)
+    return (time.process_time() - start) / iterations * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WebSocket 브로드캐스트 직렬화 벤치마크")
+    parser.add_argument("--clients", type=int, default=50, help="브로드캐스트 대상 클라이언트 수")
+    parser.add_argument("--iterations", type=int, default=2000, help="메시지 형태별 반복 횟수")
+    args = parser.parse_args()
+
+    rows: List[str] = []
+    for name, message in build_messages().items():
+        legacy = measure(legacy_broadcast, message, args.clients, args.iterations)
+        fast = measure(orjson_broadcast, message, args.clients, args.iterations)
+        size = len(dumps(message))
+        rows.append(f"{name:<14} {size:>7,d} B {legacy:>12.1f} µs {fast:>12.1f} µs {legacy / fast:>7.1f}x")
+
+    print(f"[Bench] clients={args.clients}, iterations={args.iterations}")
+    print(f"{'message':<14} {'size':>9} {'legacy':>15} {'orjson':>15} {'speedup':>8}")
+    for row in rows:
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
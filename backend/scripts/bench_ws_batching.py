@@ -0,0 +1,120 @@
+"""
+ARGUS SKY - WebSocket Batching / Compression Benchmark
+데모 시나리오 버스트(new_threat, threat_index, new_alert, demo_event)를 기준으로
+배칭 윈도우와 permessage-deflate 적용 시 프레임 수/전송 바이트 비교
+
+permessage-deflate는 RFC 7692 방식(context takeover, raw deflate + SYNC_FLUSH)으로
+클라이언트 연결 1개의 압축 스트림을 그대로 재현합니다.
+
+실행 (backend 디렉토리에서):
+    python -m scripts.bench_ws_batching --bursts 500 --clients 200 --bursts-per-sec 2
+"""
+from typing import Dict, List
+import argparse
+import random
+import time
+import zlib
+
+from scripts.bench_serialization import build_messages
+from services.osint_simulator import OsintSimulator
+from services.serialization import dumps
+
+
+def frame_header_size(payload_size: int) -> int:
+    """서버 → 클라이언트 WebSocket 프레임 헤더 크기 (마스킹 없음)"""
+    if payload_size < 126:
+        return 2
+    if payload_size < 65536:
+        return 4
+    return 10
+
+
+class DeflateStream:
+    """연결 1개의 permessage-deflate 압축 스트림 (context takeover)"""
+
+    def __init__(self):
+        self._compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+
+    def compress(self, payload: bytes) -> bytes:
+        data = self._compressor.compress(payload) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        return data[:-4]  # 메시지 끝의 00 00 ff ff 제거 (RFC 7692)
+
+
+def build_bursts(count: int, seed: int = 42) -> List[List[bytes]]:
+    """데모 버스트마다 4개 메시지의 인코딩된 프레임"""
+    rng = random.Random(seed)
+    simulator = OsintSimulator(random.Random(seed))
+    template = build_messages(seed)
+    bursts = []
+    for _ in range(count):
+        threat = simulator.generate_threat()
+        index = dict(template["threat_index"]["data"])
+        index["categories"] = {k: round(v + rng.uniform(-2.5, 2.5), 1) for k, v in index["categories"].items()}
+        alert = simulator.generate_alert_from_threat(threat)
+        messages = [
+            {"type": "new_threat", "data": threat},
+            {"type": "threat_index", "data": index},
+            {"type": "new_alert", "data": alert},
+            {"type": "demo_event", "event": "cyber_attack", "data": {"message": "사이버 공격 시나리오가 실행되었습니다", "threat": threat}},
+        ]
+        bursts.append([dumps(message) for message in messages])
+    return bursts
+
+
+def run_mode(bursts: List[List[bytes]], batched: bool, deflate: bool) -> Dict:
+    """모드별 버스트당 프레임 수/전송 바이트/CPU 시간"""
+    stream = DeflateStream() if deflate else None
+    frames = 0
+    wire_bytes = 0
+
+    start = time.process_time()
+    for burst in bursts:
+        payloads = [b"[" + b",".join(burst) + b"]"] if batched else burst
+        for payload in payloads:
+            if stream is not None:
+                payload = stream.compress(payload)
+            frames += 1
+            wire_bytes += len(payload) + frame_header_size(len(payload))
+    cpu = time.process_time() - start
+
+    return {
+        "frames_per_burst": frames / len(bursts),
+        "bytes_per_burst": wire_bytes / len(bursts),
+        "cpu_us_per_burst": cpu / len(bursts) * 1_000_000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WebSocket 배칭/압축 벤치마크")
+    parser.add_argument("--bursts", type=int, default=500, help="측정할 데모 버스트 수")
+    parser.add_argument("--clients", type=int, default=200, help="연결된 클라이언트 수")
+    parser.add_argument("--bursts-per-sec", type=float, default=1.0, help="초당 버스트 수 (환산용)")
+    args = parser.parse_args()
+
+    bursts = build_bursts(args.bursts)
+    rate = args.clients * args.bursts_per_sec
+    modes = [
+        ("plain", False, False),
+        ("batched", True, False),
+        ("deflate", False, True),
+        ("batched+deflate", True, True),
+    ]
+
+    results = {name: run_mode(bursts, batched, deflate) for name, batched, deflate in modes}
+    baseline = results["plain"]
+
+    print(f"[Bench] bursts={args.bursts}, clients={args.clients}, bursts/sec={args.bursts_per_sec}")
+    print(f"{'mode':<16} {'frames/s':>10} {'bytes/s':>12} {'saved bytes/s':>14} {'saved':>7} {'cpu/burst/client':>17}")
+    for name, result in results.items():
+        frames_per_sec = result["frames_per_burst"] * rate
+        bytes_per_sec = result["bytes_per_burst"] * rate
+        saved = (baseline["bytes_per_burst"] - result["bytes_per_burst"]) * rate
+        saved_pct = saved / (baseline["bytes_per_burst"] * rate) * 100
+        print(
+            f"{name:<16} {frames_per_sec:>10,.0f} {bytes_per_sec:>12,.0f} {saved:>14,.0f} "
+            f"{saved_pct:>6.1f}% {result['cpu_us_per_burst']:>14.1f} µs"
+        )
+
+
+if __name__ == "__main__":
+    main()
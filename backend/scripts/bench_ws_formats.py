@@ -0,0 +1,77 @@
+"""
+ARGUS SKY - WebSocket Frame Format Benchmark
+기존 메시지 타입별 JSON(orjson) vs MessagePack 프레임 크기 / 인코딩·디코딩 CPU 비교
+
+디코딩 시간은 Python 기준이므로 월 디스플레이(브라우저) 파싱 비용의 상대 비교용입니다.
+
+실행 (backend 디렉토리에서, msgpack 설치 필요):
+    python -m scripts.bench_ws_formats --iterations 5000
+"""
+from typing import Callable, Dict
+import argparse
+import random
+import time
+
+import msgpack
+
+from scripts.bench_serialization import build_messages
+from services.osint_simulator import OsintSimulator
+from services.serialization import JSON, MSGPACK, encode, loads
+
+
+def build_all_messages(seed: int = 42) -> Dict[str, Dict]:
+    """브로드캐스트되는 메시지 타입 전체 (threat_index_delta / new_alert 추가)"""
+    messages = build_messages(seed)
+    simulator = OsintSimulator(random.Random(seed))
+    alert = simulator.generate_alert_from_threat(messages["new_threat"]["data"])
+    timestamp = messages["threat_index"]["timestamp"]
+
+    messages["threat_index_delta"] = {
+        "type": "threat_index_delta",
+        "data": {"seq": 42, "changes": {"total_index": 48.1, "categories": {"cyber": 59.2, "drone": 43.1}}},
+        "seq": 1042,
+        "timestamp": timestamp,
+    }
+    messages["new_alert"] = {"type": "new_alert", "data": alert, "seq": 1043, "timestamp": timestamp}
+    return messages
+
+
+def measure(func: Callable[[], object], iterations: int) -> float:
+    """1회당 CPU 시간 (µs)"""
+    for _ in range(min(100, iterations)):
+        func()
+
+    start = time.process_time()
+    for _ in range(iterations):
+        func()
+    return (time.process_time() - start) / iterations * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WebSocket JSON vs MessagePack 벤치마크")
+    parser.add_argument("--iterations", type=int, default=5000, help="메시지 타입별 반복 횟수")
+    args = parser.parse_args()
+
+    print(f"[Bench] iterations={args.iterations}")
+    print(
+        f"{'message':<20} {'json':>9} {'msgpack':>9} {'size':>7} "
+        f"{'enc json':>11} {'enc msgpack':>12} {'dec json':>11} {'dec msgpack':>12}"
+    )
+    for name, message in build_all_messages().items():
+        json_frame = encode(message, JSON)
+        msgpack_frame = encode(message, MSGPACK)
+
+        enc_json = measure(lambda: encode(message, JSON), args.iterations)
+        enc_msgpack = measure(lambda: encode(message, MSGPACK), args.iterations)
+        dec_json = measure(lambda: loads(json_frame), args.iterations)
+        dec_msgpack = measure(lambda: msgpack.unpackb(msgpack_frame, strict_map_key=False), args.iterations)
+
+        print(
+            f"{name:<20} {len(json_frame):>7,d} B {len(msgpack_frame):>7,d} B "
+            f"{len(msgpack_frame) / len(json_frame) * 100:>6.1f}% "
+            f"{enc_json:>8.2f} µs {enc_msgpack:>9.2f} µs {dec_json:>8.2f} µs {dec_msgpack:>9.2f} µs"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+"""
+ARGUS SKY - WebSocket Load Test
+로컬 서버에 다수의 /ws 클라이언트를 연결하고 /demo/scenario/* 트리거로 브로드캐스트를 발생시켜
+종단 간 전송 지연(트리거 요청 → 클라이언트 수신), 서버 CPU/메모리, 연결 끊김을 측정
+
+- 지연: 라운드마다 시나리오 1개를 트리거하고, 각 클라이언트가 해당 demo_event를 받기까지의 시간
+- 서버 CPU/메모리: /proc/<pid> 샘플링 (pid는 /health의 event_bus.pid, --pid로 지정 가능)
+- 클라이언트는 서버 heartbeat ping에 pong으로 응답 (유휴 연결 정리 대상에서 제외)
+- 부하 발생기도 CPU를 사용하므로 서버와 코어를 분리해 실행해야 지연 값이 정확합니다
+
+실행 (backend 디렉토리에서, 서버 실행 후):
+    python -m scripts.ws_load_test --clients 2000 --rounds 10 --output results.json
+"""
+from typing import Dict, List, Optional
+import argparse
+import asyncio
+import json
+import os
+import resource
+import time
+
+import httpx
+import websockets
+
+from services.serialization import loads
+
+SCENARIO_EVENTS = {
+    "cyber": "cyber_attack",
+    "missile": "missile_alert",
+    "drone": "drone_intrusion",
+    "stabilize": "stabilization",
+}
+
+
+def percentiles(values: List[float]) -> Dict[str, Optional[float]]:
+    """nearest-rank 백분위 (ms)"""
+    if not values:
+        return {"count": 0, "p50": None, "p90": None, "p99": None, "max": None}
+    ordered = sorted(values)
+
+    def rank(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, max(0, int(len(ordered) * p + 0.5) - 1))], 2)
+
+    return {
+        "count": len(ordered),
+        "p50": rank(0.50),
+        "p90": rank(0.90),
+        "p99": rank(0.99),
+        "max": round(ordered[-1], 2),
+    }
+
+
+class ProcessSampler:
+    """/proc 기반 서버 프로세스 CPU/메모리 샘플러"""
+
+    def __init__(self, pid: int, interval: float = 1.0):
+        self.pid = pid
+        self.interval = interval
+        self.ticks = os.sysconf("SC_CLK_TCK")
+        self.samples: List[Dict] = []
+
+    def _cpu_seconds(self) -> float:
+        with open(f"/proc/{self.pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / self.ticks  # utime + stime
+
+    def _rss_mb(self) -> float:
+        with open(f"/proc/{self.pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+        return 0.0
+
+    async def run(self):
+        last_cpu, last_at = self._cpu_seconds(), time.monotonic()
+        while True:
+            await asyncio.sleep(self.interval)
+            cpu, now = self._cpu_seconds(), time.monotonic()
+            self.samples.append({
+                "cpu_percent": round((cpu - last_cpu) / (now - last_at) * 100, 1),
+                "rss_mb": round(self._rss_mb(), 1),
+            })
+            last_cpu, last_at = cpu, now
+
+    def summary(self) -> Dict:
+        if not self.samples:
+            return {"pid": self.pid, "samples": 0}
+        cpu = [s["cpu_percent"] for s in self.samples]
+        rss = [s["rss_mb"] for s in self.samples]
+        return {
+            "pid": self.pid,
+            "samples": len(self.samples),
+            "cpu_percent_avg": round(sum(cpu) / len(cpu), 1),
+            "cpu_percent_max": max(cpu),
+            "rss_mb_start": rss[0],
+            "rss_mb_max": max(rss),
+        }
+
+
+class LoadTest:
+    """클라이언트 연결 관리 + 라운드별 수신 지연 기록"""
+
+    def __init__(self, ws_url: str, fmt: str, deflate: bool):
+        self.ws_url = ws_url
+        self.fmt = fmt
+        self.deflate = deflate
+        self.connected = 0
+        self.connect_failures = 0
+        self.dropped = 0
+        self.connect_ms: List[float] = []
+        self.messages = 0
+        self._stopping = False
+        # 진행 중인 라운드 (기다리는 demo_event, 트리거 시각, 수신 지연 목록)
+        self.expected_event: Optional[str] = None
+        self.round_started = 0.0
+        self.latencies: List[float] = []
+        self.all_latencies: List[float] = []
+        self.round_done = asyncio.Event()
+        self.round_target = 0
+
+    def _decode(self, raw) -> List[Dict]:
+        if self.fmt == "msgpack":
+            import msgpack
+            message = msgpack.unpackb(raw, strict_map_key=False)
+        else:
+            message = loads(raw)
+        return message if isinstance(message, list) else [message]
+
+    async def client(self):
+        """클라이언트 1개 - 연결 후 종료 시까지 수신"""
+        started = time.perf_counter()
+        try:
+            ws = await websockets.connect(
+                self.ws_url,
+                subprotocols=["msgpack"] if self.fmt == "msgpack" else None,
+                compression="deflate" if self.deflate else None,
+                open_timeout=30,
+                max_queue=None,
+            )
+        except Exception:
+            self.connect_failures += 1
+            return
+
+        self.connected += 1
+        self.connect_ms.append((time.perf_counter() - started) * 1000)
+        try:
+            async for raw in ws:
+                received = time.perf_counter()
+                for message in self._decode(raw):
+                    self.messages += 1
+                    message_type = message.get("type")
+                    if message_type == "ping":
+                        await ws.send(json.dumps({"action": "pong", "id": message["data"]["id"]}))
+                    elif message_type == "demo_event" and message.get("event") == self.expected_event:
+                        self.latencies.append((received - self.round_started) * 1000)
+                        if len(self.latencies) >= self.round_target:
+                            self.round_done.set()
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            if not self._stopping:
+                self.dropped += 1
+            self.connected -= 1
+            await ws.close()
+
+    async def run_round(self, http: httpx.AsyncClient, scenario: str, timeout: float) -> Dict:
+        """시나리오 1회 트리거 후 연결된 클라이언트 전체의 수신을 기다림"""
+        self.expected_event = SCENARIO_EVENTS[scenario]
+        self.latencies = []
+        self.round_target = self.connected
+        self.round_done.clear()
+
+        self.round_started = time.perf_counter()
+        response = await http.post(f"/demo/scenario/{scenario}")
+        response.raise_for_status()
+        try:
+            await asyncio.wait_for(self.round_done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+        result = {
+            "scenario": scenario,
+            "clients": self.round_target,
+            "received": len(self.latencies),
+            "missed": max(0, self.round_target - len(self.latencies)),
+            "latency_ms": percentiles(self.latencies),
+        }
+        self.expected_event = None
+        self.all_latencies.extend(self.latencies)
+        return result
+
+
+def raise_fd_limit(clients: int):
+    """클라이언트 수만큼 파일 디스크립터 한도 상향 (hard limit까지)"""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = clients + 256
+    if soft < wanted:
+        target = wanted if hard == resource.RLIM_INFINITY else min(wanted, hard)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        if target < wanted:
+            print(f"[LoadTest] File descriptor limit {target} < {wanted}, some connections may fail")
+
+
+async def main_async(args) -> Dict:
+    raise_fd_limit(args.clients)
+    base_url = args.url.rstrip("/")
+    ws_url = base_url.replace("http", "ws", 1) + "/ws"
+    test = LoadTest(ws_url, args.format, args.deflate)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as http:
+        health = (await http.get("/health")).json()
+        pid = args.pid or (health.get("event_bus") or {}).get("pid")
+        sampler = ProcessSampler(pid) if pid and os.path.exists(f"/proc/{pid}") else None
+        sampler_task = asyncio.create_task(sampler.run()) if sampler else None
+        if sampler is None:
+            print("[LoadTest] Server process not found locally, skipping CPU/memory sampling")
+
+        # 연결 (초당 ramp개씩)
+        print(f"[LoadTest] Connecting {args.clients} clients to {ws_url} ...")
+        connect_started = time.perf_counter()
+        tasks = []
+        for i in range(args.clients):
+            tasks.append(asyncio.create_task(test.client()))
+            if args.ramp and (i + 1) % args.ramp == 0:
+                await asyncio.sleep(1)
+        while test.connected + test.connect_failures < args.clients:
+            await asyncio.sleep(0.1)
+        connect_seconds = time.perf_counter() - connect_started
+        print(f"[LoadTest] Connected {test.connected} ({test.connect_failures} failed) in {connect_seconds:.1f}s")
+
+        await asyncio.sleep(args.settle)
+
+        rounds = []
+        scenarios = args.scenarios.split(",")
+        for i in range(args.rounds):
+            scenario = scenarios[i % len(scenarios)]
+            result = await test.run_round(http, scenario, args.round_timeout)
+            latency = result["latency_ms"]
+            print(
+                f"[LoadTest] Round {i + 1}/{args.rounds} {scenario:<9} received {result['received']}/{result['clients']} "
+                f"p50={latency['p50']}ms p99={latency['p99']}ms"
+            )
+            rounds.append(result)
+            await asyncio.sleep(args.interval)
+
+        health_after = (await http.get("/health")).json()
+
+    test._stopping = True
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    if sampler_task is not None:
+        sampler_task.cancel()
+
+    return {
+        "config": {
+            "url": base_url,
+            "clients": args.clients,
+            "rounds": args.rounds,
+            "scenarios": scenarios,
+            "format": args.format,
+            "deflate": args.deflate,
+        },
+        "connections": {
+            "connected": args.clients - test.connect_failures,
+            "failed": test.connect_failures,
+            "dropped": test.dropped,
+            "connect_seconds": round(connect_seconds, 2),
+            "connect_ms": percentiles(test.connect_ms),
+        },
+        "rounds": rounds,
+        "latency_ms": percentiles(test.all_latencies),
+        "missed_total": sum(result["missed"] for result in rounds),
+        "messages_received": test.messages,
+        "server": {
+            **(sampler.summary() if sampler else {}),
+            "reaped": health_after.get("websocket_reaped"),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WebSocket 브로드캐스트 부하 테스트")
+    parser.add_argument("--url", default="http://127.0.0.1:8001", help="서버 주소")
+    parser.add_argument("--clients", type=int, default=1000, help="동시 연결 클라이언트 수")
+    parser.add_argument("--ramp", type=int, default=500, help="초당 연결 수 (0 = 한 번에)")
+    parser.add_argument("--rounds", type=int, default=10, help="시나리오 트리거 횟수")
+    parser.add_argument("--scenarios", default="cyber,drone,stabilize,missile", help="라운드마다 순환할 시나리오")
+    parser.add_argument("--interval", type=float, default=1.0, help="라운드 간 대기 (초)")
+    parser.add_argument("--round-timeout", type=float, default=30.0, help="라운드별 최대 수신 대기 (초)")
+    parser.add_argument("--settle", type=float, default=2.0, help="연결 완료 후 측정 전 대기 (초)")
+    parser.add_argument("--format", choices=["json", "msgpack"], default="json", help="프레임 포맷 (서브프로토콜)")
+    parser.add_argument("--deflate", action="store_true", help="permessage-deflate 협상 (브라우저와 동일)")
+    parser.add_argument("--pid", type=int, default=None, help="서버 프로세스 pid (기본: /health에서 조회)")
+    parser.add_argument("--output", default=None, help="결과 JSON 파일 경로 (기본: 표준 출력)")
+    args = parser.parse_args()
+
+    results = asyncio.run(main_async(args))
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+        print(f"[LoadTest] Results written to {args.output}")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+"""
+ARGUS SKY - Alert Dispatcher
+알림의 channels(email / sms)에 따라 외부 채널로 비동기 전송
+
+- 채널마다 제한된 크기의 대기열 + 워커 풀 (스케줄러 코루틴은 대기열에 넣기만 함)
+- 채널별 토큰 버킷 전송률 제한
+- 연결 재사용: 이메일은 워커마다 SMTP 연결 1개 유지, SMS는 httpx 연결 풀 공유
+- 일시적 실패는 지수 백오프로 재시도, 영구 실패(5xx SMTP 응답 / 4xx HTTP 응답)는 즉시 실패 처리
+- 설정이 없는 채널(SMTP_HOST / SMS_GATEWAY_URL 미설정)은 비활성 - 해당 채널 알림은 건너뜀
+
+로컬 테스트: python -m scripts.alert_standin_servers 로 SMTP / SMS 게이트웨이 대역 서버 실행
+"""
+from abc import ABC, abstractmethod
+from email.message import EmailMessage
+from typing import Dict, List, Optional
+import asyncio
+import smtplib
+import time
+
+import httpx
+
+from config import (
+    ALERT_DISPATCH_WORKERS, ALERT_DISPATCH_QUEUE_SIZE, ALERT_DISPATCH_RETRIES, ALERT_DISPATCH_BURST,
+    ALERT_EMAIL_RATE, ALERT_SMS_RATE,
+    SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASSWORD, SMTP_STARTTLS, ALERT_EMAIL_FROM, ALERT_EMAIL_TO,
+    SMS_GATEWAY_URL, SMS_GATEWAY_TOKEN, ALERT_SMS_TO,
+)
+
+LEVEL_NAMES = {1: "LOW", 2: "GUARDED", 3: "ELEVATED", 4: "HIGH", 5: "CRITICAL"}
+
+
+class PermanentDispatchError(Exception):
+    """재시도해도 성공할 수 없는 전송 실패 (수신자 거부, 잘못된 요청 등)"""
+
+
+class TokenBucket:
+    """초당 rate개, 최대 burst개까지 모아 둘 수 있는 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """토큰 1개 획득 (부족하면 채워질 때까지 대기, rate <= 0 = 무제한)"""
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class DispatchChannel(ABC):
+    """전송 채널 공통 - 대기열, 워커 풀, 전송률 제한, 재시도 (채널별로 send 구현)"""
+
+    name = ""
+
+    def __init__(
+        self,
+        rate: float,
+        workers: int = ALERT_DISPATCH_WORKERS,
+        queue_size: int = ALERT_DISPATCH_QUEUE_SIZE,
+        retries: int = ALERT_DISPATCH_RETRIES,
+        burst: int = ALERT_DISPATCH_BURST,
+        backoff: float = 0.5,
+    ):
+        self.workers = max(1, workers)
+        self.retries = retries
+        self.backoff = backoff
+        self.bucket = TokenBucket(rate, burst)
+        self.queue: Optional[asyncio.Queue] = None
+        self._queue_size = queue_size
+        self._tasks: List[asyncio.Task] = []
+        self.sent = 0
+        self.failed = 0
+        self.retried = 0
+        self.dropped = 0
+
+    def submit(self, alert: Dict) -> bool:
+        """대기열에 추가 (가득 차면 버림) - 즉시 반환"""
+        if self.queue is None:
+            return False
+        try:
+            self.queue.put_nowait(alert)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            print(f"[Dispatch] {self.name} queue full, dropping alert {alert.get('id')}")
+            return False
+        return True
+
+    def start(self):
+        """워커 풀 시작"""
+        if self._tasks:
+            return
+        self.queue = asyncio.Queue(maxsize=self._queue_size)
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+
+    async def stop(self, drain_timeout: float = 5.0):
+        """남은 알림을 drain_timeout 동안 전송한 뒤 워커 종료"""
+        if not self._tasks:
+            return
+        try:
+            await asyncio.wait_for(self.queue.join(), drain_timeout)
+        except asyncio.TimeoutError:
+            print(f"[Dispatch] {self.name}: {self.queue.qsize()} alerts not sent before shutdown")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self.close()
+
+    async def _worker(self, index: int):
+        while True:
+            alert = await self.queue.get()
+            try:
+                await self._deliver(index, alert)
+            finally:
+                self.queue.task_done()
+
+    async def _deliver(self, index: int, alert: Dict):
+        """전송률 제한 + 재시도 (지수 백오프)"""
+        for attempt in range(self.retries + 1):
+            await self.bucket.acquire()
+            try:
+                await self.send(index, alert)
+                self.sent += 1
+                return
+            except asyncio.CancelledError:
+                raise
+            except PermanentDispatchError as e:
+                print(f"[Dispatch] {self.name} rejected alert {alert.get('id')}: {e}")
+                break
+            except Exception as e:
+                if attempt == self.retries:
+                    print(f"[Dispatch] {self.name} failed alert {alert.get('id')} after {attempt + 1} attempts: {e}")
+                    break
+                self.retried += 1
+                await asyncio.sleep(self.backoff * (2 ** attempt))
+        self.failed += 1
+
+    @abstractmethod
+    async def send(self, index: int, alert: Dict):
+        """알림 1건 전송 (워커 index별 연결 사용)"""
+
+    async def close(self):
+        """연결 정리"""
+
+    def stats(self) -> Dict:
+        return {
+            "queued": self.queue.qsize() if self.queue is not None else 0,
+            "workers": self.workers,
+            "sent": self.sent,
+            "failed": self.failed,
+            "retried": self.retried,
+            "dropped": self.dropped,
+        }
+
+
+class EmailChannel(DispatchChannel):
+    """SMTP 이메일 - 워커마다 SMTP 연결을 유지하고 스레드에서 전송 (smtplib은 블로킹)"""
+
+    name = "email"
+
+    def __init__(self, host: str, port: int, sender: str, recipients: List[str],
+                 user: str = "", password: str = "", starttls: bool = False, **kwargs):
+        super().__init__(rate=kwargs.pop("rate", ALERT_EMAIL_RATE), **kwargs)
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.recipients = recipients
+        self.user = user
+        self.password = password
+        self.starttls = starttls
+        self._connections: Dict[int, smtplib.SMTP] = {}
+
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=10)
+        if self.starttls:
+            smtp.starttls()
+        if self.user:
+            smtp.login(self.user, self.password)
+        return smtp
+
+    def _send_sync(self, index: int, message: EmailMessage):
+        """워커 연결로 전송 - 끊긴 연결은 한 번 다시 연결"""
+        smtp = self._connections.get(index)
+        if smtp is None:
+            smtp = self._connections[index] = self._connect()
+        try:
+            smtp.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            smtp = self._connections[index] = self._connect()
+            smtp.send_message(message)
+        except smtplib.SMTPResponseException as e:
+            if e.smtp_code >= 500:
+                raise PermanentDispatchError(f"{e.smtp_code} {e.smtp_error!r}")
+            raise
+        except smtplib.SMTPRecipientsRefused as e:
+            raise PermanentDispatchError(str(e.recipients))
+        except OSError:
+            # 연결 자체가 깨진 경우 다음 시도에서 새로 연결
+            self._connections.pop(index, None)
+            raise
+
+    async def send(self, index: int, alert: Dict):
+        message = EmailMessage()
+        message["Subject"] = f"[ARGUS SKY {LEVEL_NAMES.get(alert.get('level'), 'ALERT')}] {alert.get('title', '')}"
+        message["From"] = self.sender
+        message["To"] = ", ".join(self.recipients)
+        message.set_content(
+            f"{alert.get('message') or ''}\n\n"
+            f"레벨: {alert.get('level')}\n"
+            f"카테고리: {alert.get('category') or '-'}\n"
+            f"발생 시각: {alert.get('created_at')}\n"
+            f"알림 ID: {alert.get('id')}\n"
+        )
+        await asyncio.to_thread(self._send_sync, index, message)
+
+    def _close_sync(self):
+        for smtp in self._connections.values():
+            try:
+                smtp.quit()
+            except Exception:
+                pass
+        self._connections.clear()
+
+    async def close(self):
+        await asyncio.to_thread(self._close_sync)
+
+
+class SmsChannel(DispatchChannel):
+    """HTTP SMS 게이트웨이 - 워커들이 httpx 연결 풀 1개를 공유"""
+
+    name = "sms"
+
+    def __init__(self, url: str, recipients: List[str], token: str = "", **kwargs):
+        super().__init__(rate=kwargs.pop("rate", ALERT_SMS_RATE), **kwargs)
+        self.url = url
+        self.recipients = recipients
+        self.token = token
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def start(self):
+        if self._client is None:
+            headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+            self._client = httpx.AsyncClient(
+                headers=headers,
+                timeout=10,
+                limits=httpx.Limits(max_connections=self.workers, max_keepalive_connections=self.workers),
+            )
+        super().start()
+
+    async def send(self, index: int, alert: Dict):
+        response = await self._client.post(self.url, json={
+            "to": self.recipients,
+            "message": f"[ARGUS SKY] {alert.get('title', '')}",
+            "alert_id": alert.get("id"),
+            "level": alert.get("level"),
+        })
+        if response.status_code == 429 or response.status_code >= 500:
+            raise RuntimeError(f"gateway returned {response.status_code}")
+        if response.status_code >= 400:
+            raise PermanentDispatchError(f"gateway returned {response.status_code}")
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class AlertDispatcher:
+    """알림 채널 라우팅 - channels에 포함된 활성 채널의 대기열에 추가"""
+
+    def __init__(self, channels: Optional[List[DispatchChannel]] = None):
+        self.channels: Dict[str, DispatchChannel] = {}
+        for channel in channels if channels is not None else self._configured_channels():
+            self.channels[channel.name] = channel
+        self.skipped = 0  # 비활성 채널로 보내지 못한 건수
+
+    @staticmethod
+    def _configured_channels() -> List[DispatchChannel]:
+        """환경 변수로 설정된 채널"""
+        channels: List[DispatchChannel] = []
+        if SMTP_HOST and ALERT_EMAIL_TO:
+            channels.append(EmailChannel(
+                SMTP_HOST, SMTP_PORT, ALERT_EMAIL_FROM, ALERT_EMAIL_TO,
+                user=SMTP_USER, password=SMTP_PASSWORD, starttls=SMTP_STARTTLS,
+            ))
+        if SMS_GATEWAY_URL and ALERT_SMS_TO:
+            channels.append(SmsChannel(SMS_GATEWAY_URL, ALERT_SMS_TO, token=SMS_GATEWAY_TOKEN))
+        return channels
+
+    def dispatch(self, alert: Dict):
+        """알림의 외부 채널 전송 예약 (대기열 추가만 하고 즉시 반환, dashboard는 WebSocket)"""
+        for name in alert.get("channels") or []:
+            if name == "dashboard":
+                continue
+            channel = self.channels.get(name)
+            if channel is None:
+                self.skipped += 1
+                continue
+            channel.submit(alert)
+
+    def start(self):
+        for channel in self.channels.values():
+            channel.start()
+        if self.channels:
+            print(f"[Dispatch] Alert channels: {', '.join(self.channels)}")
+
+    async def stop(self):
+        for channel in self.channels.values():
+            await channel.stop()
+
+    def stats(self) -> Dict:
+        return {
+            "channels": {name: channel.stats() for name, channel in self.channels.items()},
+            "skipped": self.skipped,
+        }
+
+
+# 싱글톤 인스턴스
+alert_dispatcher = AlertDispatcher()
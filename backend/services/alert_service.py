@@ -1,17 +1,81 @@
 """
 ARGUS SKY - Alert Service
 알림 생성 및 관리 서비스
+
+생성한 알림은 이벤트 파이프라인의 new_alert 이벤트 1건으로 발행합니다.
+싱크: 최근 알림 저장소(메모리) → alerts 테이블 일괄 저장 대기열 → 외부 채널(email / sms)
+전송 대기열 → WebSocket 브로드캐스트 (모든 싱크가 같은 이벤트 객체와 인코딩을 공유)
+
+알림 폭주 집계: 같은 (카테고리, 레벨, 제목) 알림은 ALERT_AGGREGATION_WINDOW 동안 첫 알림만 즉시 보내고,
+나머지는 모아 두었다가 윈도우가 끝나면 건수를 담은 집계 알림 1건으로 보냅니다.
+ALERT_AGGREGATION_BYPASS_LEVEL 이상(기본 CRITICAL) 알림은 집계하지 않고 매번 바로 보냅니다.
 """
-from datetime import datetime
-from typing import Optional, Dict
-import uuid
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import random
+
+from sqlalchemy import func, select
 
-from services.websocket_manager import manager
+from database import AsyncSessionLocal, Alert
+from services.randomness import make_rng, new_id
+from services.event_bus import event_bus
+from services.event_pipeline import DomainEvent, pipeline
+from services.osint_simulator import simulator
+from services.alert_store import alert_store
+from services.alert_writer import alert_writer
+from services.alert_dispatcher import alert_dispatcher
+from config import ALERT_AGGREGATION_WINDOW, ALERT_AGGREGATION_BYPASS_LEVEL
+
+AggregationKey = Tuple[Optional[str], int, str]
+
+# 집계 알림에 담는 관련 위협 id 수 (최근 순, 전체 수는 threat_count)
+ROLLUP_THREAT_ID_SAMPLE = 20
+
+
+class AlertGroup:
+    """집계 윈도우 1개 - 첫 알림은 이미 전송, 이후 알림은 건수/위협 id만 누적"""
+    
+    def __init__(self, key: AggregationKey, first: Dict):
+        self.key = key
+        self.first = first
+        self.count = 1
+        self.threat_ids: Dict[str, None] = {}  # 중복 없는 위협 id (삽입 순서 유지)
+        if first.get("threat_id"):
+            self.threat_ids[first["threat_id"]] = None
+        self.last_at = first["created_at"]
+        self.timer: Optional[asyncio.Task] = None  # 윈도우 종료 태스크
+    
+    def absorb(self, alert: Dict):
+        self.count += 1
+        self.last_at = alert["created_at"]
+        if alert.get("threat_id"):
+            # 이미 있는 id는 최근 순서로 이동
+            self.threat_ids.pop(alert["threat_id"], None)
+            self.threat_ids[alert["threat_id"]] = None
+    
+    def recent_threat_ids(self, limit: int = ROLLUP_THREAT_ID_SAMPLE) -> List[str]:
+        """최근 위협 id limit개 (오래된 순)"""
+        return list(islice(reversed(self.threat_ids), limit))[::-1]
 
 
 class AlertService:
     """알림 서비스"""
     
+    def __init__(
+        self,
+        rng: Optional[random.Random] = None,
+        window: float = ALERT_AGGREGATION_WINDOW,
+        bypass_level: int = ALERT_AGGREGATION_BYPASS_LEVEL,
+    ):
+        self.rng = rng or make_rng("alerts")
+        self.window = window  # 집계 윈도우 (초, 0 = 비활성)
+        self.bypass_level = bypass_level  # 이 레벨 이상은 집계하지 않음
+        self._groups: Dict[AggregationKey, AlertGroup] = {}
+        self.suppressed = 0  # 집계되어 개별 전송/저장되지 않은 알림 수
+        self.rollups = 0  # 전송한 집계 알림 수
+    
     @staticmethod
     def calculate_level_from_severity(severity: int) -> int:
         """심각도로부터 알림 레벨 계산"""
@@ -50,8 +114,9 @@ class AlertService:
         level = self.calculate_level_from_severity(severity)
         
         alert = {
-            "id": str(uuid.uuid4()),
+            "id": new_id(),
             "threat_id": threat_id,
+            "category": category,
             "level": level,
             "title": f"[{category.upper()}] {title}",
             "message": self._generate_message(level, severity, category),
@@ -61,9 +126,7 @@ class AlertService:
             "time_ago": "방금 전"
         }
         
-        if broadcast:
-            await manager.send_new_alert(alert)
-        
+        await self._emit(alert, broadcast)
         return alert
     
     async def create_system_alert(
@@ -75,8 +138,9 @@ class AlertService:
     ) -> Dict:
         """시스템 알림 생성"""
         alert = {
-            "id": str(uuid.uuid4()),
+            "id": new_id(),
             "threat_id": None,
+            "category": None,
             "level": level,
             "title": f"[SYSTEM] {title}",
             "message": message,
@@ -86,11 +150,145 @@ class AlertService:
             "time_ago": "방금 전"
         }
         
-        if broadcast:
-            await manager.send_new_alert(alert)
-        
+        await self._emit(alert, broadcast)
         return alert
     
+    async def _emit(self, alert: Dict, broadcast: bool = True):
+        """집계 윈도우 확인 후 저장/브로드캐스트 (윈도우 내 중복 알림은 건수만 누적, 긴급 알림은 항상 즉시)"""
+        if self.window > 0 and alert["level"] < self.bypass_level:
+            key = (alert.get("category"), alert["level"], alert["title"])
+            group = self._groups.get(key)
+            if group is not None:
+                group.absorb(alert)
+                self.suppressed += 1
+                return
+            group = self._groups[key] = AlertGroup(key, alert)
+            group.timer = asyncio.create_task(self._close_after(key))
+        
+        await pipeline.emit(DomainEvent("new_alert", alert, broadcast=broadcast))
+    
+    async def _close_after(self, key: AggregationKey):
+        await asyncio.sleep(self.window)
+        try:
+            await self._close_group(key)
+        except Exception as e:
+            print(f"[Alerts] Error closing aggregation window: {e}")
+    
+    async def _close_group(self, key: AggregationKey):
+        """윈도우 종료 - 누적된 알림이 있으면 건수를 담은 집계 알림 전송"""
+        group = self._groups.pop(key, None)
+        if group is None or group.count == 1:
+            return
+        
+        first = group.first
+        threat_ids = group.recent_threat_ids()
+        alert = {
+            "id": new_id(),
+            "threat_id": threat_ids[-1] if threat_ids else None,
+            "category": first.get("category"),
+            "level": first["level"],
+            "title": f"{first['title']} (외 {group.count - 1}건)",
+            "message": f"{self.window:g}초 동안 같은 유형의 알림이 {group.count}건 발생했습니다. {first['message']}",
+            "channels": first["channels"],
+            "is_read": False,
+            "created_at": datetime.utcnow().isoformat(),
+            "time_ago": "방금 전",
+            "aggregated": True,
+            "count": group.count,
+            "threat_count": len(group.threat_ids),
+            "threat_ids": threat_ids,
+            "first_at": first["created_at"],
+            "last_at": group.last_at,
+        }
+        self.rollups += 1
+        await pipeline.emit(DomainEvent("new_alert", alert))
+    
+    async def flush_aggregates(self):
+        """열린 집계 윈도우를 모두 즉시 종료 (서버 종료 시)"""
+        for key, group in list(self._groups.items()):
+            if group.timer is not None:
+                group.timer.cancel()
+            await self._close_group(key)
+    
+    def stats(self) -> Dict:
+        """집계 통계"""
+        return {
+            "aggregation_window": self.window,
+            "bypass_level": self.bypass_level,
+            "open_windows": len(self._groups),
+            "suppressed": self.suppressed,
+            "rollups": self.rollups,
+        }
+    
+    def _record(self, alert: Dict):
+        """최근 알림 저장소 추가 + DB 저장 대기열 (발행하지 않는 데모 시드 알림)"""
+        alert_store.add(alert)
+        alert_writer.enqueue(alert)
+    
+    # =========================================================================
+    # new_alert 이벤트 싱크
+    # =========================================================================
+    
+    @staticmethod
+    def _store_sink(event: DomainEvent):
+        # 저장소는 읽음 처리로 알림을 수정하므로 인코딩이 캐시된 이벤트 데이터 대신 사본 보관
+        alert_store.add(dict(event.data))
+    
+    @staticmethod
+    def _persist_sink(event: DomainEvent):
+        alert_writer.enqueue(event.data)
+    
+    @staticmethod
+    def _dispatch_sink(event: DomainEvent):
+        alert_dispatcher.dispatch(event.data)
+    
+    def register_sinks(self):
+        """new_alert 싱크 등록 (WebSocket 싱크보다 먼저 - 저장소가 브로드캐스트 시점에 최신 상태)"""
+        pipeline.add_sink("new_alert", self._store_sink)
+        pipeline.add_sink("new_alert", self._persist_sink)
+        pipeline.add_sink("new_alert", self._dispatch_sink)
+    
+    async def restore(self) -> int:
+        """DB에 저장된 최근 알림을 저장소로 적재 + 읽지 않은 알림 수 초기화 (서버 재시작 후)"""
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(Alert).order_by(Alert.created_at.desc()).limit(alert_store.max_size)
+            )
+            rows = result.scalars().all()
+            unread = await session.scalar(
+                select(func.count()).select_from(Alert).where(Alert.is_read == False)
+            )
+        
+        alert_store.extend(alert_to_dict(row) for row in rows)
+        alert_store.unread_count = unread
+        return len(rows)
+    
+    async def seed_demo_alerts(self, count: int = 15):
+        """알림 테이블이 비어 있으면 데모용 샘플 알림 생성 (리더 워커)"""
+        async with AsyncSessionLocal() as session:
+            existing = await session.scalar(select(func.count()).select_from(Alert))
+        if existing:
+            return
+        
+        rng = make_rng("alerts_seed")
+        categories = ["terror", "cyber", "smuggling", "drone", "insider", "geopolitical"]
+        seeds = []
+        for _ in range(count):
+            threat = simulator.generate_threat(rng.choice(categories))
+            alert = simulator.generate_alert_from_threat(threat)
+            alert["is_read"] = rng.random() > 0.4
+            
+            # 시간 분산
+            hours_ago = rng.randint(0, 48)
+            alert["created_at"] = (datetime.utcnow() - timedelta(hours=hours_ago)).isoformat()
+            seeds.append(alert)
+        
+        # 생성 시각 순으로 추가
+        for alert in sorted(seeds, key=lambda x: x["created_at"]):
+            self._record(alert)
+        await alert_writer.flush()
+        print(f"[Alerts] Seeded {count} demo alerts")
+    
     def _generate_message(self, level: int, severity: int, category: str) -> str:
         """알림 메시지 생성"""
         if level >= 5:
@@ -112,6 +310,29 @@ class AlertService:
             return ["dashboard"]
 
 
+def alert_to_dict(row: Alert) -> Dict:
+    """alerts 테이블 행 → 알림 dict"""
+    return {
+        "id": row.id,
+        "threat_id": row.threat_id,
+        "category": row.category,
+        "level": row.level,
+        "title": row.title,
+        "message": row.message,
+        "channels": row.channels or [],
+        "is_read": row.is_read,
+        "created_at": row.created_at.isoformat(),
+    }
+
+
+async def _mirror_alert(message: Dict):
+    """팔로워 워커: 리더가 발행한 새 알림을 이 워커의 최근 알림 저장소에 반영"""
+    if not event_bus.is_leader and message.get("type") == "new_alert":
+        alert_store.add(dict(message["data"]))
+
+
 # 싱글톤 인스턴스
 alert_service = AlertService()
+alert_service.register_sinks()
+event_bus.subscribe("ws", _mirror_alert)
 
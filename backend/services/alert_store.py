@@ -0,0 +1,73 @@
+"""
+ARGUS SKY - Alert Store
+인메모리 최근 알림 저장소 (WebSocket initial_state, 팔로워 워커의 읽음 처리 확인용)
+
+- 시간순 deque (최신 알림이 왼쪽) + id 인덱스
+- 목록 조회/필터는 DB(/alerts)에서 처리하므로 저장소는 최근 알림 limit개만 제공 (O(limit))
+- unread_count는 저장소 밖(오래되어 제거된) 알림까지 포함한 전체 수 - restore에서 DB 값으로 초기화하고
+  새 알림 추가 / 읽음 처리 이벤트로 갱신
+- 최대 개수를 넘으면 가장 오래된 알림부터 제거
+"""
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Iterable, List, Optional
+
+
+class AlertStore:
+    """최근 알림 저장소"""
+
+    def __init__(self, max_size: int = 100):
+        self.max_size = max_size
+        self._alerts: Deque[dict] = deque()  # 최신순
+        self._by_id: Dict[str, dict] = {}
+        self.unread_count = 0  # 전체 읽지 않은 알림 수 (저장소에서 제거된 알림 포함)
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def add(self, alert: dict):
+        """새 알림 추가 (생성 시각 순으로 호출, 최대 개수 초과 시 가장 오래된 알림 제거)"""
+        alert_id = alert.get("id")
+        if alert_id in self._by_id:
+            return
+
+        self._alerts.appendleft(alert)
+        self._by_id[alert_id] = alert
+        if not alert.get("is_read"):
+            self.unread_count += 1
+
+        while len(self._alerts) > self.max_size:
+            self._by_id.pop(self._alerts.pop().get("id"), None)
+
+    def extend(self, alerts: Iterable[dict]):
+        """여러 알림 추가 (created_at 오래된 순으로 정렬 후 추가)"""
+        for alert in sorted(alerts, key=lambda x: x.get("created_at", "")):
+            self.add(alert)
+
+    def get(self, alert_id: str) -> Optional[dict]:
+        """id로 알림 조회"""
+        return self._by_id.get(alert_id)
+
+    def mark_read(self, alert_id: str, was_unread: bool = False) -> Optional[dict]:
+        """알림 읽음 처리 (was_unread: DB 기준 읽지 않은 알림이었는지 - 저장소 밖 알림도 전체 수에 반영, 없으면 None)"""
+        if was_unread:
+            self.unread_count = max(0, self.unread_count - 1)
+        alert = self._by_id.get(alert_id)
+        if alert is None:
+            return None
+        alert["is_read"] = True
+        return alert
+
+    def mark_all_read(self):
+        """모든 알림 읽음 처리"""
+        for alert in self._alerts:
+            alert["is_read"] = True
+        self.unread_count = 0
+
+    def recent(self, limit: int = 20) -> List[dict]:
+        """최근 알림 limit개 (최신순, 읽음 여부 포함)"""
+        return list(islice(self._alerts, limit))
+
+
+# 싱글톤 인스턴스
+alert_store = AlertStore()
@@ -0,0 +1,235 @@
+"""
+ARGUS SKY - Alert Writer
+알림을 alerts 테이블에 일괄 저장 (행 단위 INSERT 대신 주기적 multi-row INSERT)
+
+- enqueue()는 메모리 대기열에 추가만 하고 즉시 반환 (브로드캐스트 경로를 막지 않음)
+- ALERT_FLUSH_INTERVAL마다, 또는 대기 건수가 ALERT_FLUSH_BATCH에 도달하면 저장
+- threats 테이블에 없는 위협(메모리 시뮬레이션 위협)을 참조하는 알림은 threat_id를 비워 저장 (FK)
+- 일시적 저장 실패(DB 연결 등)는 대기열 앞쪽으로 되돌려 다음 주기에 재시도 (ALERT_WRITER_MAX_RETRIES회 초과 시 버림)
+- 행 자체의 오류(중복 id 등 IntegrityError)는 행 단위 INSERT로 다시 저장하고 거부된 행만 버림 (rejected)
+- 조회/읽음 처리는 저장을 기다리지 않음: 대기 중인 알림은 pending_rows()로 DB 결과와 병합하고,
+  읽음 처리는 저장 시 반영 (저장 중이던 알림은 저장 직후 UPDATE)
+"""
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, Iterator, List, Optional, Set
+import asyncio
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from database import AsyncSessionLocal, Alert, Threat
+from config import ALERT_FLUSH_INTERVAL, ALERT_FLUSH_BATCH, ALERT_WRITER_MAX_PENDING, ALERT_WRITER_MAX_RETRIES
+
+
+def _parse_time(value) -> datetime:
+    """ISO 문자열/datetime → naive UTC datetime"""
+    if isinstance(value, datetime):
+        return value
+    if value:
+        return datetime.fromisoformat(value.replace('Z', ''))
+    return datetime.utcnow()
+
+
+def alert_row(alert: Dict, known_threat_ids: set, is_read: bool = False) -> Dict:
+    """알림 dict → alerts 테이블 행 (is_read: 저장 전에 읽음 처리된 알림)"""
+    threat_id = alert.get("threat_id")
+    is_read = is_read or bool(alert.get("is_read"))
+    return {
+        "id": alert["id"],
+        "threat_id": threat_id if threat_id in known_threat_ids else None,
+        "category": alert.get("category"),
+        "level": alert["level"],
+        "title": alert["title"],
+        "message": alert.get("message"),
+        "channels": alert.get("channels") or [],
+        "is_read": is_read,
+        "read_at": datetime.utcnow() if is_read else None,
+        "created_at": _parse_time(alert.get("created_at")),
+    }
+
+
+class AlertWriter:
+    """알림 일괄 저장기"""
+
+    def __init__(
+        self,
+        interval: float = ALERT_FLUSH_INTERVAL,
+        batch_size: int = ALERT_FLUSH_BATCH,
+        max_pending: int = ALERT_WRITER_MAX_PENDING,
+        max_retries: int = ALERT_WRITER_MAX_RETRIES,
+    ):
+        self.interval = interval
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.max_retries = max_retries
+        self._attempts = 0  # 대기열 맨 앞 배치의 연속 실패 횟수
+        self._pending: Deque[Dict] = deque()
+        self._writing: List[Dict] = []  # 저장 중인 배치
+        self._read_ids: Set[str] = set()  # 저장 전에 읽음 처리된 알림 id
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.written = 0
+        self.batches = 0
+        self.failures = 0
+        self.dropped = 0
+        self.rejected = 0
+
+    def enqueue(self, alert: Dict):
+        """저장 대기열에 추가 (대기열이 가득 차면 가장 오래된 알림을 버림)"""
+        if len(self._pending) >= self.max_pending:
+            self._read_ids.discard(self._pending.popleft()["id"])
+            self.dropped += 1
+        self._pending.append(alert)
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    @property
+    def pending(self) -> int:
+        """저장 대기 중인 알림 수"""
+        return len(self._pending)
+
+    def _unsaved(self) -> Iterator[Dict]:
+        """저장되지 않은 알림 (대기열 + 저장 중인 배치, 최신순)"""
+        yield from reversed(self._pending)
+        yield from reversed(self._writing)
+
+    def pending_rows(self) -> Iterator[Dict]:
+        """저장되지 않은 알림의 테이블 행 (최신순, 조회 시 DB 결과와 병합 - await 없이 소비)"""
+        for alert in self._unsaved():
+            yield alert_row(alert, {alert.get("threat_id")}, alert["id"] in self._read_ids)
+
+    def mark_read(self, alert_id: str) -> Optional[bool]:
+        """저장되지 않은 알림 읽음 처리 - 대기 중이 아니면 None, 아니면 읽지 않은 상태였는지"""
+        for alert in self._unsaved():
+            if alert["id"] == alert_id:
+                was_unread = not alert.get("is_read") and alert_id not in self._read_ids
+                self._read_ids.add(alert_id)
+                return was_unread
+        return None
+
+    def mark_all_read(self) -> int:
+        """저장되지 않은 알림 모두 읽음 처리, 읽지 않은 상태였던 수 반환"""
+        count = 0
+        for alert in self._unsaved():
+            if not alert.get("is_read") and alert["id"] not in self._read_ids:
+                self._read_ids.add(alert["id"])
+                count += 1
+        return count
+
+    def start(self):
+        """주기적 저장 태스크 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """저장 태스크 종료 후 남은 알림 저장"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """대기 중인 알림을 batch_size개씩 저장, 저장한 수 반환 (일시적 실패 시 대기열에 되돌림)"""
+        written = 0
+        async with self._lock:
+            while self._pending:
+                batch: List[Dict] = [self._pending.popleft() for _ in range(min(self.batch_size, len(self._pending)))]
+                self._writing = batch
+                try:
+                    saved = await self._write(batch)
+                except Exception as e:
+                    self._writing = []
+                    self.failures += 1
+                    self._attempts += 1
+                    if self._attempts > self.max_retries:
+                        print(f"[AlertWriter] Dropping {len(batch)} alerts after {self._attempts} attempts: {e}")
+                        self._read_ids.difference_update(alert["id"] for alert in batch)
+                        self.dropped += len(batch)
+                        self._attempts = 0
+                    else:
+                        self._pending.extendleft(reversed(batch))
+                        print(f"[AlertWriter] Error writing {len(batch)} alerts (attempt {self._attempts}): {e}")
+                    break
+                self._attempts = 0
+                written += saved
+                self.written += saved
+                self.batches += 1
+        return written
+
+    async def _write(self, batch: List[Dict]) -> int:
+        """한 트랜잭션에서 참조 위협 확인 + multi-row INSERT, 저장한 수 반환 (저장 중 읽음 처리된 알림은 이어서 UPDATE)"""
+        async with AsyncSessionLocal() as session:
+            threat_ids = {alert["threat_id"] for alert in batch if alert.get("threat_id")}
+            known = set()
+            if threat_ids:
+                result = await session.execute(select(Threat.id).where(Threat.id.in_(threat_ids)))
+                known = set(result.scalars())
+            rows = [alert_row(alert, known, alert["id"] in self._read_ids) for alert in batch]
+            try:
+                await session.execute(insert(Alert), rows)
+                await session.commit()
+                saved = rows
+            except IntegrityError:
+                # 재시도해도 실패하는 행이 섞여 있음 - 행 단위로 저장하고 거부된 행만 버림
+                await session.rollback()
+                saved = await self._write_each(session, rows)
+
+            # 커밋 이후의 읽음 처리는 DB로 바로 반영되므로, 행을 만든 뒤 커밋 전까지 들어온 것만 남음
+            late = {row["id"] for row in saved if not row["is_read"]} & self._read_ids
+            self._read_ids.difference_update(row["id"] for row in rows)
+            self._writing = []
+            if late:
+                try:
+                    await session.execute(
+                        update(Alert).where(Alert.id.in_(late)).values(is_read=True, read_at=datetime.utcnow())
+                    )
+                    await session.commit()
+                except Exception as e:
+                    # INSERT는 커밋됐으므로 배치를 되돌리지 않음
+                    print(f"[AlertWriter] Error marking {len(late)} alerts as read: {e}")
+        return len(saved)
+
+    async def _write_each(self, session, rows: List[Dict]) -> List[Dict]:
+        """행 단위 INSERT - IntegrityError 행은 버리고 저장한 행 반환 (그 밖의 오류는 배치 재시도)"""
+        saved = []
+        for row in rows:
+            try:
+                await session.execute(insert(Alert), [row])
+                await session.commit()
+            except IntegrityError as e:
+                await session.rollback()
+                self.rejected += 1
+                print(f"[AlertWriter] Rejected alert {row['id']}: {e.orig}")
+                continue
+            saved.append(row)
+        return saved
+
+    def stats(self) -> Dict:
+        """저장 통계"""
+        return {
+            "pending": len(self._pending),
+            "written": self.written,
+            "batches": self.batches,
+            "failures": self.failures,
+            "dropped": self.dropped,
+            "rejected": self.rejected,
+        }
+
+
+# 싱글톤 인스턴스
+alert_writer = AlertWriter()
@@ -0,0 +1,286 @@
+"""
+ARGUS SKY - Historical Backtest Engine
+저장된 위협을 열(column) 배열로 적재하여 과거 임의 시점의 카테고리/통합 지수를
+한 번의 벡터 연산으로 재계산
+
+CLI:
+    python -m services.backtest --days 90 --step-hours 1 --config overrides.json --output result.json
+"""
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+import argparse
+import asyncio
+import json
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from services.scoring_tables import (
+    DEFAULT_CATEGORY_WEIGHT,
+    DEFAULT_SOURCE_CREDIBILITY,
+    ScoringTables,
+    compile_tables,
+    scoring_config,
+)
+from services.threat_calculator import TEMPORAL_DECAY_BUCKETS
+
+# 감쇠 구간 상한(시간)과 계수 - calculate_temporal_factor와 같은 표를 사용
+DECAY_UPPER_HOURS = np.array([upper for upper, _, _ in TEMPORAL_DECAY_BUCKETS if upper is not None], dtype=np.float64)
+DECAY_FACTORS = np.array([factor for _, factor, _ in TEMPORAL_DECAY_BUCKETS], dtype=np.float64)
+
+# 한 번에 계산하는 (시점 × 위협) 셀 수 상한 - 메모리 사용량 제한
+DEFAULT_CHUNK_CELLS = 4_000_000
+
+# 백테스트에서 제외하는 위협 상태 (오탐은 과거에도 위협이 아니었음)
+EXCLUDED_STATUSES = ("false_positive",)
+
+
+class ThreatColumns:
+    """
+    위협 데이터 열 배열
+
+    - category_codes / source_codes: ScoringTables 코드 (-1 = 미등록)
+    - severity: 심각도
+    - created_at: 생성 시각 (UTC epoch seconds)
+    """
+    __slots__ = ("category_codes", "source_codes", "severity", "created_at")
+
+    def __init__(self, category_codes: np.ndarray, source_codes: np.ndarray, severity: np.ndarray, created_at: np.ndarray):
+        self.category_codes = category_codes
+        self.source_codes = source_codes
+        self.severity = severity
+        self.created_at = created_at
+
+    def __len__(self) -> int:
+        return len(self.severity)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Tuple], tables: ScoringTables) -> "ThreatColumns":
+        """(category, source_type, severity, created_at) 레코드로부터 생성"""
+        category_codes, source_codes, severity, created_at = [], [], [], []
+        for category, source_type, sev, created in records:
+            if created is None:
+                continue
+            category_codes.append(tables.category_codes.get(category, -1))
+            source_codes.append(tables.source_codes.get(source_type, -1))
+            severity.append(sev if sev is not None else 50)
+            created_at.append(_to_epoch(created))
+
+        return cls(
+            np.array(category_codes, dtype=np.int16),
+            np.array(source_codes, dtype=np.int16),
+            np.array(severity, dtype=np.float64),
+            np.array(created_at, dtype=np.float64),
+        )
+
+
+def _to_epoch(value: datetime) -> float:
+    """naive UTC datetime → epoch seconds"""
+    return (value - datetime(1970, 1, 1)).total_seconds()
+
+
+def _from_epoch(value: float) -> datetime:
+    return datetime(1970, 1, 1) + timedelta(seconds=float(value))
+
+
+def weight_arrays(tables: ScoringTables) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (카테고리 가중치, 출처 신뢰도) 배열
+
+    마지막 원소는 미등록 코드(-1)용 기본값입니다.
+    """
+    category_weights = np.array(tables.category_weights + (DEFAULT_CATEGORY_WEIGHT,), dtype=np.float64)
+    source_credibility = np.array(tables.source_credibility + (DEFAULT_SOURCE_CREDIBILITY,), dtype=np.float64)
+    return category_weights, source_credibility
+
+
+def compute_indices(
+    category_codes: np.ndarray,
+    source_codes: np.ndarray,
+    severity: np.ndarray,
+    created_at: np.ndarray,
+    times: np.ndarray,
+    category_weights: np.ndarray,
+    source_credibility: np.ndarray,
+    max_age_hours: Optional[float] = None,
+    empty_category_index: float = 0.0,
+    chunk_cells: int = DEFAULT_CHUNK_CELLS,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    모든 시점의 카테고리/통합 지수 계산
+
+    Args:
+        category_weights / source_credibility: weight_arrays() 형식 (마지막 원소 = 기본값)
+
+    Returns:
+        (category_indices[T, C], category_counts[T, C], total_index[T])
+    """
+    num_categories = len(category_weights) - 1
+    num_times = len(times)
+
+    # 감쇠 전 점수: severity × category_weight × source_credibility × 2
+    raw_scores = severity * category_weights[category_codes] * source_credibility[source_codes] * 2
+
+    # 카테고리 one-hot (미등록 카테고리는 어떤 카테고리 지수에도 포함되지 않음)
+    one_hot = np.zeros((len(severity), num_categories), dtype=np.float64)
+    known = category_codes >= 0
+    one_hot[np.nonzero(known)[0], category_codes[known]] = 1.0
+
+    sums = np.zeros((num_times, num_categories), dtype=np.float64)
+    counts = np.zeros((num_times, num_categories), dtype=np.float64)
+
+    rows_per_chunk = max(1, chunk_cells // max(1, len(severity)))
+    for start in range(0, num_times, rows_per_chunk):
+        chunk_times = times[start:start + rows_per_chunk]
+        hours_ago = (chunk_times[:, None] - created_at[None, :]) / 3600
+
+        active = hours_ago >= 0
+        if max_age_hours is not None:
+            active &= hours_ago < max_age_hours
+
+        # hours_ago < upper 인 첫 구간 = 상한 이하 경계 개수
+        buckets = np.searchsorted(DECAY_UPPER_HOURS, hours_ago, side="right")
+        scores = np.clip(raw_scores[None, :] * DECAY_FACTORS[buckets], 0, 100)
+        scores = np.where(active, scores, 0.0)
+
+        sums[start:start + rows_per_chunk] = scores @ one_hot
+        counts[start:start + rows_per_chunk] = active.astype(np.float64) @ one_hot
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        category_indices = np.where(counts > 0, sums / counts, empty_category_index)
+
+    total_index = np.clip(category_indices @ category_weights[:-1] * 1.5, 0, 100)
+    return category_indices, counts, total_index
+
+
+def classify_levels(total_index: np.ndarray, tables: ScoringTables) -> np.ndarray:
+    """통합 지수 배열 → 레벨 배열 (ScoringTables.classify_level과 동일 규칙)"""
+    positions = np.searchsorted(np.array(tables.level_floors), total_index, side="right") - 1
+    return np.array(tables.levels)[np.clip(positions, 0, None)]
+
+
+def hourly_times(start: datetime, end: datetime, step_hours: float = 1.0) -> np.ndarray:
+    """start~end 구간의 평가 시점 (epoch seconds)"""
+    step = step_hours * 3600
+    return np.arange(_to_epoch(start), _to_epoch(end) + step / 2, step, dtype=np.float64)
+
+
+def run_backtest(
+    columns: ThreatColumns,
+    start: datetime,
+    end: datetime,
+    step_hours: float = 1.0,
+    tables: Optional[ScoringTables] = None,
+    max_age_hours: Optional[float] = None,
+    empty_category_index: float = 0.0,
+) -> Dict:
+    """
+    백테스트 실행
+
+    Returns:
+        시점별 통합 지수, 레벨, 카테고리 지수/위협 수
+    """
+    tables = tables or scoring_config.tables
+    times = hourly_times(start, end, step_hours)
+    category_weights, source_credibility = weight_arrays(tables)
+
+    category_indices, counts, total_index = compute_indices(
+        columns.category_codes,
+        columns.source_codes,
+        columns.severity,
+        columns.created_at,
+        times,
+        category_weights,
+        source_credibility,
+        max_age_hours=max_age_hours,
+        empty_category_index=empty_category_index,
+    )
+    levels = classify_levels(total_index, tables)
+
+    return {
+        "start": start,
+        "end": end,
+        "step_hours": step_hours,
+        "config_version": tables.version,
+        "threats_loaded": len(columns),
+        "timestamps": [_from_epoch(t).isoformat() for t in times],
+        "total_index": np.round(total_index, 2).tolist(),
+        "levels": levels.tolist(),
+        "level_changes": int(np.count_nonzero(np.diff(levels))),
+        "categories": {
+            cat: np.round(category_indices[:, code], 2).tolist()
+            for code, cat in enumerate(tables.category_names)
+        },
+        "threat_counts": {
+            cat: counts[:, code].astype(int).tolist()
+            for code, cat in enumerate(tables.category_names)
+        },
+        "formula": {
+            "threat_score": "clamp(0, 100, severity × category_weight × source_credibility × temporal_factor × 2)",
+            "category_index": "average(active threat scores), 위협 없음 = empty_category_index",
+            "total_index": "clamp(0, 100, Σ(category_index × category_weight) × 1.5)",
+        },
+    }
+
+
+async def load_threat_columns(
+    session: AsyncSession,
+    end: datetime,
+    tables: Optional[ScoringTables] = None,
+    since: Optional[datetime] = None,
+) -> ThreatColumns:
+    """DB에 저장된 위협을 열 배열로 적재"""
+    from database import Threat
+
+    tables = tables or scoring_config.tables
+    query = select(Threat.category, Threat.source_type, Threat.severity, Threat.created_at).where(
+        Threat.created_at <= end,
+        Threat.status.notin_(EXCLUDED_STATUSES),
+    )
+    if since is not None:
+        query = query.where(Threat.created_at >= since)
+
+    result = await session.execute(query)
+    return ThreatColumns.from_records(result.all(), tables)
+
+
+def backtest_window(days: float, max_age_hours: Optional[float] = None) -> Tuple[datetime, datetime, Optional[datetime]]:
+    """(start, end, 적재 시작 시각) - 최대 경과 시간이 없으면 end 이전 전체 위협 적재"""
+    end = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+    start = end - timedelta(days=days)
+    since = start - timedelta(hours=max_age_hours) if max_age_hours is not None else None
+    return start, end, since
+
+
+async def _main(args: argparse.Namespace):
+    from database import AsyncSessionLocal
+
+    tables = scoring_config.tables
+    if args.config:
+        with open(args.config, encoding="utf-8") as f:
+            tables = compile_tables(json.load(f), source_path=args.config)
+
+    start, end, since = backtest_window(args.days, args.max_age_hours)
+    async with AsyncSessionLocal() as session:
+        columns = await load_threat_columns(session, end, tables, since)
+
+    result = run_backtest(columns, start, end, args.step_hours, tables, args.max_age_hours)
+    payload = json.dumps(result, ensure_ascii=False, default=str, indent=2)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload)
+        print(f"[Backtest] {len(columns)} threats, {len(result['timestamps'])} points → {args.output}")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ARGUS SKY 위협 지수 백테스트")
+    parser.add_argument("--days", type=float, default=90, help="재계산 기간 (일)")
+    parser.add_argument("--step-hours", type=float, default=1.0, help="평가 간격 (시간)")
+    parser.add_argument("--max-age-hours", type=float, default=None, help="이 시간보다 오래된 위협 제외 (기본: 제외 안 함)")
+    parser.add_argument("--config", help="점수 설정 덮어쓰기 JSON (SCORING_CONFIG_PATH 형식)")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: 표준 출력)")
+    asyncio.run(_main(parser.parse_args()))
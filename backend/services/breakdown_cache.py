@@ -0,0 +1,90 @@
+"""
+ARGUS SKY - Score Breakdown Cache
+위협 점수 상세 내역 응답을 (threat_id, 감쇠 구간, 설정 버전) 키로 LRU 캐싱
+
+상세 내역은 감쇠 구간이 바뀌거나 점수 설정이 리로드될 때만 달라지므로,
+두 값을 키에 포함하면 별도 무효화 없이 오래된 항목은 조회되지 않고 LRU로 밀려납니다.
+"""
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from config import BREAKDOWN_CACHE_SIZE
+from services.threat_calculator import get_decay_bucket
+
+# (threat_id, decay_bucket, config_version)
+CacheKey = Tuple[str, int, int]
+
+
+class BreakdownCache:
+    """크기 제한 LRU 캐시 + 적중률 통계"""
+
+    def __init__(self, max_size: int = BREAKDOWN_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[CacheKey, Dict]" = OrderedDict()
+        # threat_id → created_at: 적중 시 DB 조회 없이 현재 감쇠 구간 계산
+        self._created_at: "OrderedDict[str, datetime]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def created_at(self, threat_id: str) -> Optional[datetime]:
+        """캐시에 기록된 위협 생성 시각"""
+        return self._created_at.get(threat_id)
+
+    def key_for(self, threat_id: str, config_version: int, now: Optional[datetime] = None) -> Optional[CacheKey]:
+        """현재 시각 기준 캐시 키 (생성 시각을 모르는 위협이면 None)"""
+        created_at = self._created_at.get(threat_id)
+        if created_at is None:
+            return None
+        hours_ago = ((now or datetime.utcnow()) - created_at).total_seconds() / 3600
+        return (threat_id, get_decay_bucket(hours_ago), config_version)
+
+    def get(self, key: Optional[CacheKey]) -> Optional[Dict]:
+        """조회 - 적중 시 최근 사용으로 이동"""
+        payload = self._entries.get(key) if key is not None else None
+        if payload is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._created_at.move_to_end(key[0])
+        self.hits += 1
+        return payload
+
+    def put(self, key: CacheKey, created_at: datetime, payload: Dict):
+        """저장 - 최대 크기 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        self._entries[key] = payload
+        self._entries.move_to_end(key)
+        self._created_at[key[0]] = created_at
+        self._created_at.move_to_end(key[0])
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        while len(self._created_at) > self.max_size:
+            self._created_at.popitem(last=False)
+
+    def clear(self):
+        """전체 비우기 (통계는 유지)"""
+        self._entries.clear()
+        self._created_at.clear()
+
+    def stats(self) -> Dict:
+        """적중률 통계"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# 싱글톤 인스턴스
+breakdown_cache = BreakdownCache()
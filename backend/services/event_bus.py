@@ -0,0 +1,357 @@
+"""
+ARGUS SKY - Event Bus
+워커 프로세스 간 이벤트 전달
+
+- memory: 단일 프로세스 (기본값) - 발행 즉시 같은 프로세스의 핸들러 호출
+- unix: uvicorn --workers N 환경 - 파일 잠금(flock)으로 리더 1개를 선출하고,
+  리더가 Unix 소켓 허브가 되어 모든 워커(팔로워)에 이벤트를 중계
+
+리더만 SimulationScheduler를 실행하며, 팔로워의 발행/명령은 리더로 전달된 뒤
+리더가 전체 워커에 다시 배포합니다. 각 워커는 받은 이벤트를 자신의 WebSocket
+클라이언트에게 전달합니다.
+
+sequence()로 지정한 topic은 리더가 발행 순서대로 일련번호를 붙이므로 모든 워커에서
+같은 이벤트가 같은 번호를 가집니다 (stream_id는 번호 체계 식별자, 리더 교체 시 유지).
+"""
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+import asyncio
+import os
+import uuid
+
+from config import EVENT_BUS_BACKEND, EVENT_BUS_SOCKET_PATH, EVENT_BUS_LOCK_PATH
+from services.serialization import dumps, loads
+
+Handler = Callable[[Dict], Awaitable[None]]
+CommandHandler = Callable[[str, Dict], Awaitable[None]]
+SnapshotProvider = Callable[[], List[Tuple[str, Dict]]]
+LeaderCallback = Callable[[], Awaitable[None]]
+
+# 소켓 프레임(한 줄) 최대 크기 - 스케줄러 스냅샷 포함
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+
+# 팔로워 송신 버퍼가 이 크기를 넘으면 연결을 끊고 재접속(스냅샷 재수신) 유도
+MAX_FOLLOWER_BUFFER = 8 * 1024 * 1024
+
+# 리더 연결 실패 시 재시도 간격 (초)
+RECONNECT_DELAY = 0.5
+
+
+class EventBus:
+    """
+    단일 프로세스 이벤트 버스 (항상 리더)
+
+    topic별 핸들러에 이벤트를 전달하고, 명령은 등록된 명령 핸들러로 바로 실행합니다.
+    """
+
+    backend = "memory"
+
+    def __init__(self):
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._command_handler: Optional[CommandHandler] = None
+        self._snapshot_provider: Optional[SnapshotProvider] = None
+        self.is_leader = True
+        self.published = 0
+        self.delivered = 0
+        self.stream_id = uuid.uuid4().hex[:12]
+        self._sequenced: Dict[str, str] = {}  # topic → 일련번호 필드명
+        self._seqs: Dict[str, int] = {}  # topic → 마지막 일련번호
+
+    def subscribe(self, topic: str, handler: Handler):
+        """topic 이벤트 핸들러 등록"""
+        self._handlers.setdefault(topic, []).append(handler)
+
+    def sequence(self, topic: str, field: str = "seq"):
+        """topic 이벤트에 리더가 일련번호(payload[field])를 붙이도록 지정"""
+        self._sequenced[topic] = field
+    
+    def last_seq(self, topic: str) -> int:
+        """topic의 마지막 일련번호 (발행 전이면 0)"""
+        return self._seqs.get(topic, 0)
+    
+    def set_command_handler(self, handler: CommandHandler):
+        """리더에서 실행할 명령 핸들러 등록"""
+        self._command_handler = handler
+
+    def set_snapshot_provider(self, provider: SnapshotProvider):
+        """새 팔로워에게 보낼 (topic, payload) 목록 제공자 등록"""
+        self._snapshot_provider = provider
+
+    async def start(self, on_leader: Optional[LeaderCallback] = None):
+        """버스 시작 - 리더가 되면 on_leader 실행"""
+        if on_leader is not None:
+            await on_leader()
+
+    async def stop(self):
+        """버스 종료"""
+
+    async def publish(self, topic: str, payload: Dict):
+        """모든 워커에 이벤트 발행"""
+        self.published += 1
+        self._stamp(topic, payload)
+        await self._deliver(topic, payload)
+
+    async def send_command(self, name: str, args: Optional[Dict] = None):
+        """리더에서 명령 실행"""
+        await self._run_command(name, args or {})
+
+    def _stamp(self, topic: str, payload: Dict):
+        """리더에서 다음 일련번호 부여"""
+        field = self._sequenced.get(topic)
+        if field is not None:
+            self._seqs[topic] = self._seqs.get(topic, 0) + 1
+            payload[field] = self._seqs[topic]
+
+    async def _deliver(self, topic: str, payload: Dict):
+        """현재 프로세스의 핸들러 호출"""
+        field = self._sequenced.get(topic)
+        if field is not None and payload.get(field) is not None:
+            # 팔로워도 마지막 번호를 기억해 두었다가 리더로 승격되면 이어서 부여
+            self._seqs[topic] = max(self._seqs.get(topic, 0), payload[field])
+        for handler in self._handlers.get(topic, []):
+            try:
+                await handler(payload)
+                self.delivered += 1
+            except Exception as e:
+                print(f"[EventBus] Handler error on '{topic}': {e}")
+
+    async def _run_command(self, name: str, args: Dict):
+        if self._command_handler is None:
+            print(f"[EventBus] No command handler for '{name}'")
+            return
+        try:
+            await self._command_handler(name, args)
+        except Exception as e:
+            print(f"[EventBus] Command '{name}' failed: {e}")
+
+    def stats(self) -> Dict:
+        """버스 상태"""
+        return {
+            "backend": self.backend,
+            "role": "leader" if self.is_leader else "follower",
+            "pid": os.getpid(),
+            "published": self.published,
+            "delivered": self.delivered,
+            "stream_id": self.stream_id,
+            "seqs": dict(self._seqs),
+        }
+
+
+class UnixSocketEventBus(EventBus):
+    """
+    다중 워커 이벤트 버스 (Unix 소켓 + flock 리더 선출)
+
+    프레임은 줄바꿈으로 구분된 JSON입니다.
+        리더 → 팔로워: {"kind": "event", "topic": ..., "payload": ...}
+                       {"kind": "sequence", "stream_id": ..., "seqs": {...}}  (연결 직후)
+        팔로워 → 리더: {"kind": "publish", ...} / {"kind": "command", "name": ..., "args": ...}
+    리더 프로세스가 종료되면 잠금이 풀리고, 팔로워 중 하나가 새 리더가 됩니다.
+    """
+
+    backend = "unix"
+
+    def __init__(self, socket_path: str = EVENT_BUS_SOCKET_PATH, lock_path: str = EVENT_BUS_LOCK_PATH):
+        super().__init__()
+        self.socket_path = socket_path
+        self.lock_path = lock_path
+        self.is_leader = False
+        self._lock_file = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._followers: Set[asyncio.StreamWriter] = set()
+        self._leader_writer: Optional[asyncio.StreamWriter] = None
+        self._follow_task: Optional[asyncio.Task] = None
+        self._on_leader: Optional[LeaderCallback] = None
+        self._stopping = False
+
+    async def start(self, on_leader: Optional[LeaderCallback] = None):
+        self._on_leader = on_leader
+        self._stopping = False
+        if not await self._try_become_leader():
+            self._follow_task = asyncio.create_task(self._follow())
+
+    async def stop(self):
+        self._stopping = True
+        if self._follow_task is not None:
+            self._follow_task.cancel()
+            try:
+                await self._follow_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._follow_task = None
+
+        for writer in list(self._followers):
+            writer.close()
+        self._followers.clear()
+
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+        if self._lock_file is not None:
+            self._lock_file.close()  # 잠금 해제
+            self._lock_file = None
+        self.is_leader = False
+
+    # =========================================================================
+    # Leader Election
+    # =========================================================================
+
+    def _acquire_lock(self) -> bool:
+        """리더 잠금 시도 (논블로킹) - 프로세스가 종료되면 OS가 자동 해제"""
+        import fcntl
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.lock_path)), exist_ok=True)
+        lock_file = open(self.lock_path, "a+")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        return True
+
+    async def _try_become_leader(self) -> bool:
+        """잠금을 얻으면 소켓 허브를 열고 리더 역할 시작"""
+        if not self._acquire_lock():
+            return False
+
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)  # 이전 리더가 남긴 소켓 파일
+        self._server = await asyncio.start_unix_server(
+            self._serve_follower, path=self.socket_path, limit=MAX_FRAME_BYTES
+        )
+        self.is_leader = True
+        print(f"[EventBus] Elected leader (pid {os.getpid()})")
+
+        if self._on_leader is not None:
+            await self._on_leader()
+        return True
+
+    # =========================================================================
+    # Leader Side
+    # =========================================================================
+
+    async def _serve_follower(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """팔로워 연결 처리 - 스냅샷 전송 후 발행/명령 수신"""
+        self._followers.add(writer)
+        try:
+            writer.write(_frame({"kind": "sequence", "stream_id": self.stream_id, "seqs": self._seqs}))
+            if self._snapshot_provider is not None:
+                for topic, payload in self._snapshot_provider():
+                    writer.write(_frame({"kind": "event", "topic": topic, "payload": payload}))
+
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                frame = loads(line)
+                if frame.get("kind") == "publish":
+                    await self.publish(frame["topic"], frame["payload"])
+                elif frame.get("kind") == "command":
+                    await self._run_command(frame["name"], frame.get("args") or {})
+        except (ConnectionError, ValueError, KeyError) as e:
+            print(f"[EventBus] Follower connection error: {e}")
+        finally:
+            self._followers.discard(writer)
+            writer.close()
+
+    def _fan_out(self, line: bytes):
+        """모든 팔로워에 프레임 기록 (전송 완료를 기다리지 않음)"""
+        for writer in list(self._followers):
+            if writer.transport.get_write_buffer_size() > MAX_FOLLOWER_BUFFER:
+                print("[EventBus] Follower too slow, disconnecting")
+                self._followers.discard(writer)
+                writer.close()
+                continue
+            writer.write(line)
+
+    # =========================================================================
+    # Follower Side
+    # =========================================================================
+
+    async def _follow(self):
+        """리더에 연결해 이벤트 수신 - 연결이 끊기면 리더 선출 재시도"""
+        while not self._stopping:
+            if await self._try_become_leader():
+                return
+
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.socket_path, limit=MAX_FRAME_BYTES)
+            except OSError:
+                await asyncio.sleep(RECONNECT_DELAY)
+                continue
+
+            self._leader_writer = writer
+            print(f"[EventBus] Connected to leader as follower (pid {os.getpid()})")
+            try:
+                while True:
+                    line = await reader.readline()
+                    if not line:
+                        break
+                    frame = loads(line)
+                    if frame.get("kind") == "sequence":
+                        # 리더의 번호 체계를 이어받음
+                        self.stream_id = frame["stream_id"]
+                        for topic, seq in frame["seqs"].items():
+                            self._seqs[topic] = max(self._seqs.get(topic, 0), seq)
+                        continue
+                    await self._deliver(frame["topic"], frame["payload"])
+            except (ConnectionError, ValueError, KeyError) as e:
+                print(f"[EventBus] Leader connection error: {e}")
+            finally:
+                self._leader_writer = None
+                writer.close()
+
+            if not self._stopping:
+                print("[EventBus] Lost leader connection, re-electing...")
+                await asyncio.sleep(RECONNECT_DELAY)
+
+    # =========================================================================
+    # Publish / Command
+    # =========================================================================
+
+    async def publish(self, topic: str, payload: Dict):
+        self.published += 1
+        if self.is_leader:
+            self._stamp(topic, payload)
+            self._fan_out(_frame({"kind": "event", "topic": topic, "payload": payload}))
+            await self._deliver(topic, payload)
+        elif self._leader_writer is not None:
+            # 리더가 전체 워커(이 워커 포함)에 다시 배포
+            self._leader_writer.write(_frame({"kind": "publish", "topic": topic, "payload": payload}))
+        else:
+            # 리더 연결 전에는 이 워커의 클라이언트에만 전달
+            await self._deliver(topic, payload)
+
+    async def send_command(self, name: str, args: Optional[Dict] = None):
+        if self.is_leader:
+            await self._run_command(name, args or {})
+        elif self._leader_writer is not None:
+            self._leader_writer.write(_frame({"kind": "command", "name": name, "args": args or {}}))
+        else:
+            print(f"[EventBus] Not connected to leader, command '{name}' dropped")
+
+    def stats(self) -> Dict:
+        stats = super().stats()
+        stats["followers"] = len(self._followers) if self.is_leader else None
+        stats["connected"] = self.is_leader or self._leader_writer is not None
+        return stats
+
+
+def _frame(message: Dict) -> bytes:
+    """줄바꿈 구분 JSON 프레임 (orjson 출력에는 줄바꿈이 없음)"""
+    return dumps(message) + b"\n"
+
+
+def create_event_bus(backend: str = EVENT_BUS_BACKEND) -> EventBus:
+    """설정에 따른 이벤트 버스 생성"""
+    if backend == "unix":
+        return UnixSocketEventBus()
+    if backend != "memory":
+        print(f"[EventBus] Unknown backend '{backend}', using memory")
+    return EventBus()
+
+
+# 싱글톤 인스턴스
+event_bus = create_event_bus()
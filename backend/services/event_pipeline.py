@@ -0,0 +1,76 @@
+"""
+ARGUS SKY - Event Pipeline
+도메인 이벤트(새 위협, 새 알림 등)를 한 번 만들어 모든 싱크가 같은 객체를 공유
+
+- DomainEvent: 메시지 타입 + 데이터(Encoded) - 데이터는 포맷(JSON / msgpack)마다 최대 한 번만 인코딩
+- 싱크: WebSocket 팬아웃(이벤트 버스), 최근 알림 저장소, DB 저장 대기열, 외부 채널 전송
+- 이벤트 데이터를 포함하는 다른 메시지(demo_event, 이벤트 버스 프레임, 재연결 스냅샷)도
+  캐시된 인코딩을 그대로 이어 붙임
+
+unix 이벤트 버스 팔로워 워커는 리더가 보낸 프레임을 디코딩하므로 워커마다 한 번 다시 인코딩합니다.
+"""
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+
+from services.serialization import JSON, Encoded
+
+Sink = Callable[["DomainEvent"], Optional[Awaitable[None]]]
+
+# 모든 이벤트 타입을 받는 싱크 키
+ALL = "*"
+
+
+class DomainEvent:
+    """도메인 이벤트 1건 (생성 후 data는 바꾸지 않음)"""
+
+    __slots__ = ("type", "data", "extra", "broadcast")
+
+    def __init__(self, event_type: str, data: Dict, broadcast: bool = True, **extra: Any):
+        self.type = event_type
+        self.data = data if isinstance(data, Encoded) else Encoded(data)
+        self.extra = extra  # 메시지 최상위 추가 필드 (demo_event의 event 등)
+        self.broadcast = broadcast  # False면 WebSocket 팬아웃 제외
+
+    def message(self) -> Dict:
+        """WebSocket 메시지 (발행마다 새 dict - seq / timestamp는 이벤트 버스와 워커가 추가)"""
+        return {"type": self.type, "data": self.data, **self.extra}
+
+    def encoded(self, fmt: str = JSON) -> bytes:
+        """데이터의 포맷별 인코딩 (캐시)"""
+        return self.data.encoded(fmt)
+
+
+class EventPipeline:
+    """이벤트 타입별 싱크 목록 - 등록 순서대로 호출 (타입별 싱크 다음에 전체 싱크)"""
+
+    def __init__(self):
+        self._sinks: Dict[str, List[Sink]] = {}
+        self.emitted: Dict[str, int] = {}
+        self.sink_errors = 0
+
+    def add_sink(self, event_type: str, sink: Sink):
+        """싱크 등록 (event_type=ALL이면 모든 이벤트)"""
+        self._sinks.setdefault(event_type, []).append(sink)
+
+    async def emit(self, event: DomainEvent) -> DomainEvent:
+        """이벤트를 모든 싱크에 전달 (한 싱크의 오류가 다른 싱크를 막지 않음)"""
+        self.emitted[event.type] = self.emitted.get(event.type, 0) + 1
+        for sink in self._sinks.get(event.type, []) + self._sinks.get(ALL, []):
+            try:
+                result = sink(event)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self.sink_errors += 1
+                print(f"[Pipeline] Sink error for {event.type}: {e}")
+        return event
+
+    def stats(self) -> Dict:
+        return {
+            "emitted": dict(self.emitted),
+            "sink_errors": self.sink_errors,
+        }
+
+
+# 싱글톤 인스턴스
+pipeline = EventPipeline()
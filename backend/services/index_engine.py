@@ -0,0 +1,230 @@
+"""
+ARGUS SKY - Incremental Category Index Engine
+카테고리별 위협 점수 합계/건수를 누적 관리하여 O(1)로 지수 조회
+감쇠 구간 경계 시각을 힙으로 관리하여 구간 전환 시에만 점수 갱신
+"""
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+import heapq
+
+from services.scoring_tables import scoring_config
+from services.threat_calculator import TEMPORAL_DECAY_BUCKETS, get_decay_bucket
+
+# 지수 집계에서 제외되는 위협 상태
+INACTIVE_STATUSES = {"resolved", "false_positive"}
+
+
+def _to_datetime(value) -> datetime:
+    """ISO 문자열 또는 datetime을 datetime으로 변환"""
+    if isinstance(value, datetime):
+        return value
+    if value:
+        return datetime.fromisoformat(value.replace('Z', ''))
+    return datetime.utcnow()
+
+
+class _IndexEntry:
+    """엔진에 등록된 위협 1건의 점수 상태"""
+    __slots__ = ("threat_id", "category", "raw_score", "created_at", "decay_bucket", "score", "active")
+
+    def __init__(self, threat_id: str, category: str, raw_score: float, created_at: datetime, active: bool):
+        self.threat_id = threat_id
+        self.category = category
+        self.raw_score = raw_score  # severity × category_weight × source_credibility × 2 (감쇠 전)
+        self.created_at = created_at
+        self.decay_bucket = 0
+        self.score = 0.0
+        self.active = active
+
+    def rescore(self, decay_bucket: int) -> float:
+        """감쇠 구간을 적용해 점수를 다시 계산하고 변화량 반환"""
+        old_score = self.score
+        self.decay_bucket = decay_bucket
+        self.score = min(100, max(0, self.raw_score * TEMPORAL_DECAY_BUCKETS[decay_bucket][1]))
+        return self.score - old_score
+
+    def next_boundary(self) -> Optional[datetime]:
+        """현재 감쇠 구간이 끝나는 시각 (마지막 구간이면 None)"""
+        upper = TEMPORAL_DECAY_BUCKETS[self.decay_bucket][0]
+        if upper is None:
+            return None
+        return self.created_at + timedelta(hours=upper)
+
+
+class CategoryIndexEngine:
+    """
+    증분 카테고리 지수 엔진
+
+    위협 추가/제거/상태 변경 시 카테고리별 점수 합계와 건수만 갱신하므로
+    카테고리 지수(평균 점수)는 위협 수와 무관하게 O(1)로 조회됩니다.
+    시간 감쇠는 위협별 다음 구간 경계 시각을 최소 힙에 등록해 두고,
+    경계를 넘은 위협만 변화량을 반영하므로 비용은 O(구간 전환 수)입니다.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _IndexEntry] = {}
+        self._sums: Dict[str, float] = {}
+        self._counts: Dict[str, int] = {}
+        self.config_version = 0  # 점수 계산에 사용된 설정 테이블 버전
+        # (경계 시각, threat_id, 감쇠 구간) - 제거/갱신된 항목은 꺼낼 때 무시
+        self._boundaries: List[Tuple[datetime, str, int]] = []
+        self._stale_boundaries = 0
+        self.clear()
+
+    def _apply(self, category: str, delta_sum: float, delta_count: int):
+        """카테고리 누적값 갱신"""
+        count = self._counts.get(category, 0) + delta_count
+        self._counts[category] = count
+        # 부동소수점 누적 오차 제거
+        self._sums[category] = self._sums.get(category, 0.0) + delta_sum if count else 0.0
+
+    def _push_boundary(self, entry: _IndexEntry):
+        """다음 감쇠 구간 경계 등록"""
+        boundary = entry.next_boundary()
+        if boundary is not None:
+            heapq.heappush(self._boundaries, (boundary, entry.threat_id, entry.decay_bucket))
+
+    def _current_entry(self, item: Tuple[datetime, str, int]) -> Optional[_IndexEntry]:
+        """힙 항목이 아직 유효하면 해당 위협 반환 (제거/재등록된 위협이면 None)"""
+        entry = self._entries.get(item[1])
+        if entry is None or entry.decay_bucket != item[2] or entry.next_boundary() != item[0]:
+            return None
+        return entry
+
+    def _compact_boundaries(self):
+        """제거된 위협의 경계 항목이 많아지면 힙 재구성"""
+        if self._stale_boundaries <= max(64, len(self._entries)):
+            return
+        self._boundaries = [item for item in self._boundaries if self._current_entry(item) is not None]
+        heapq.heapify(self._boundaries)
+        self._stale_boundaries = 0
+
+    def add(self, threat: Dict, now: Optional[datetime] = None):
+        """위협 추가 - O(1)"""
+        threat_id = threat["id"]
+        if threat_id in self._entries:
+            self.remove(threat_id)
+
+        tables = scoring_config.tables
+        category = threat.get("category")
+        raw_score = (
+            threat.get("severity", 0)
+            * tables.category_weight(category)
+            * tables.source_weight(threat.get("source_type"))
+            * 2
+        )
+
+        entry = _IndexEntry(
+            threat_id,
+            category,
+            raw_score,
+            _to_datetime(threat.get("created_at")),
+            threat.get("status") not in INACTIVE_STATUSES,
+        )
+        hours_ago = ((now or datetime.utcnow()) - entry.created_at).total_seconds() / 3600
+        entry.rescore(get_decay_bucket(hours_ago))
+
+        self._entries[threat_id] = entry
+        self._push_boundary(entry)
+        if entry.active:
+            self._apply(category, entry.score, 1)
+
+    def remove(self, threat_id: str) -> bool:
+        """위협 제거 (만료/축출) - O(1)"""
+        entry = self._entries.pop(threat_id, None)
+        if entry is None:
+            return False
+        if entry.active:
+            self._apply(entry.category, -entry.score, -1)
+        if entry.next_boundary() is not None:
+            self._stale_boundaries += 1
+            self._compact_boundaries()
+        return True
+
+    def update_status(self, threat_id: str, status: str) -> bool:
+        """위협 상태 변경 반영 - O(1)"""
+        entry = self._entries.get(threat_id)
+        if entry is None:
+            return False
+
+        active = status not in INACTIVE_STATUSES
+        if active != entry.active:
+            entry.active = active
+            if active:
+                self._apply(entry.category, entry.score, 1)
+            else:
+                self._apply(entry.category, -entry.score, -1)
+        return True
+
+    def refresh_decay(self, now: Optional[datetime] = None) -> int:
+        """
+        경계 시각이 지난 위협만 꺼내 감쇠 구간 변화량을 반영
+
+        Returns:
+            구간이 변경된 위협 수
+        """
+        now = now or datetime.utcnow()
+        boundaries = self._boundaries
+        transitions = 0
+
+        while boundaries and boundaries[0][0] <= now:
+            entry = self._current_entry(heapq.heappop(boundaries))
+            if entry is None:
+                self._stale_boundaries = max(0, self._stale_boundaries - 1)
+                continue
+
+            hours_ago = (now - entry.created_at).total_seconds() / 3600
+            delta = entry.rescore(get_decay_bucket(hours_ago))
+            if entry.active:
+                self._apply(entry.category, delta, 0)
+            self._push_boundary(entry)
+            transitions += 1
+
+        return transitions
+
+    def next_transition_at(self) -> Optional[datetime]:
+        """가장 빠른 감쇠 구간 전환 예정 시각"""
+        while self._boundaries:
+            if self._current_entry(self._boundaries[0]) is not None:
+                return self._boundaries[0][0]
+            heapq.heappop(self._boundaries)
+            self._stale_boundaries = max(0, self._stale_boundaries - 1)
+        return None
+
+    def category_index(self, category: str) -> Optional[float]:
+        """카테고리 평균 점수 - 활성 위협이 없으면 None"""
+        count = self._counts.get(category, 0)
+        if not count:
+            return None
+        return self._sums[category] / count
+
+    def category_count(self, category: str) -> int:
+        """카테고리 활성 위협 수"""
+        return self._counts.get(category, 0)
+
+    def get_indices(self) -> Dict[str, Optional[float]]:
+        """전체 카테고리 지수"""
+        return {cat: self.category_index(cat) for cat in self._counts}
+
+    def clear(self):
+        """모든 위협 제거"""
+        tables = scoring_config.tables
+        self._entries.clear()
+        self._boundaries.clear()
+        self._stale_boundaries = 0
+        self._sums = {cat: 0.0 for cat in tables.category_names}
+        self._counts = {cat: 0 for cat in tables.category_names}
+        self.config_version = tables.version
+
+    def rebuild(self, threats: Iterable[Dict], now: Optional[datetime] = None):
+        """설정 테이블 교체 후 전체 위협 재계산"""
+        now = now or datetime.utcnow()
+        self.clear()
+        for threat in threats:
+            self.add(threat, now)
+
+    def __contains__(self, threat_id: str) -> bool:
+        return threat_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,95 @@
+"""
+ARGUS SKY - Initial State Snapshot
+WebSocket 연결 시 보내는 initial_state 메시지 (대시보드 초기 데이터 묶음)
+
+연결 직후 대시보드가 위협/알림/KPI/분포/트렌드를 REST로 따로 요청하지 않도록
+현재 상태와 함께 설정된 섹션을 한 메시지로 보냅니다.
+메시지는 상태 버전(WS 스트림 seq, 스케줄러 상태 버전, 외부 변경 횟수)마다 한 번만 만들고
+포맷별로 한 번만 인코딩해 모든 연결이 같은 프레임을 공유합니다.
+"""
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import WebSocket
+
+from services.simulation_scheduler import scheduler
+from services.websocket_manager import manager
+from config import (
+    WS_INITIAL_SNAPSHOT_SECTIONS,
+    WS_INITIAL_SNAPSHOT_THREATS,
+    WS_INITIAL_SNAPSHOT_TREND_POINTS,
+)
+
+
+class InitialSnapshot:
+    """상태 버전별 initial_state 메시지 캐시"""
+
+    def __init__(self, sections=WS_INITIAL_SNAPSHOT_SECTIONS):
+        self.sections = list(sections)
+        # 섹션 이름 → 데이터 제공자 (alerts/kpi는 해당 라우터가 register로 등록)
+        self._providers: Dict[str, Callable[[], Any]] = {
+            "threats": lambda: scheduler.get_threats(limit=WS_INITIAL_SNAPSHOT_THREATS)[::-1],
+            "distribution": scheduler.get_category_distribution,
+            "trend": lambda: scheduler.get_trend(WS_INITIAL_SNAPSHOT_TREND_POINTS),
+        }
+        self._revision = 0  # 스케줄러/WS 스트림 밖의 변경 (알림 읽음 처리 등)
+        self._version: Optional[Tuple[int, int, int]] = None
+        self._message: Optional[Dict] = None
+        self._frames: Dict[str, bytes] = {}
+        self.builds = 0
+        self.hits = 0
+
+    def register(self, section: str, provider: Callable[[], Any]):
+        """섹션 데이터 제공자 등록"""
+        self._providers[section] = provider
+        self.invalidate()
+
+    def invalidate(self):
+        """스케줄러/WS 스트림 밖에서 섹션 데이터가 바뀌었을 때 호출"""
+        self._revision += 1
+
+    @property
+    def version(self) -> Tuple[int, int, int]:
+        """현재 상태 버전 - 바뀌면 다음 연결 때 메시지를 다시 생성"""
+        return manager.stream_seq, scheduler.state_version, self._revision
+
+    def message(self) -> Tuple[Dict, Dict[str, bytes]]:
+        """현재 버전의 initial_state 메시지와 포맷별 인코딩 캐시"""
+        version = self.version
+        if version == self._version and self._message is not None:
+            self.hits += 1
+            return self._message, self._frames
+
+        data = scheduler.get_current_state()
+        for section in self.sections:
+            provider = self._providers.get(section)
+            if provider is not None:
+                data[section] = provider()
+
+        self._message = {
+            "type": "initial_state",
+            "data": data,
+            # 재연결 시 {"action": "resume"}에 사용할 스트림 위치
+            **manager.stream_position()
+        }
+        self._frames = {}
+        self._version = version
+        self.builds += 1
+        return self._message, self._frames
+
+    async def send(self, websocket: WebSocket):
+        """연결된 클라이언트에게 initial_state 전송 (공유 프레임)"""
+        message, frames = self.message()
+        await manager.send_to(websocket, message, frames)
+
+    def stats(self) -> Dict:
+        """캐시 통계"""
+        return {
+            "sections": self.sections,
+            "version": list(self._version) if self._version is not None else None,
+            "builds": self.builds,
+            "hits": self.hits,
+        }
+
+
+# 싱글톤 인스턴스
+initial_snapshot = InitialSnapshot()
@@ -0,0 +1,115 @@
+"""
+ARGUS SKY - Load Generator
+부하 테스트용 합성 위협 대량 주입 (/demo/load/start)
+
+- LOAD_GEN_TICK마다 목표 속도에 맞는 개수를 OsintSimulator.generate_threat_batch로 한 번에 생성
+- 생성한 배치는 주입 함수(스케줄러의 활성 위협 저장소 + 이벤트 파이프라인)로 전달
+- 주입이 목표 속도를 따라가지 못하면 밀린 분량은 버리고 skipped로 집계 (달성 속도 = generated / elapsed)
+"""
+from typing import Awaitable, Callable, Dict, List, Optional
+import asyncio
+import time
+
+from services.osint_simulator import simulator
+from config import LOAD_GEN_TICK
+
+Inject = Callable[[List[Dict]], Awaitable[None]]
+
+# 한 주기에 따라잡을 수 있는 최대 분량 (주기 배수) - 초과분은 skipped
+MAX_CATCHUP_TICKS = 4
+
+
+class LoadGenerator:
+    """목표 속도로 위협 배치를 생성해 주입"""
+
+    def __init__(self, tick: float = LOAD_GEN_TICK):
+        self.tick = tick
+        self._task: Optional[asyncio.Task] = None
+        self.rate = 0
+        self.duration: Optional[float] = None
+        self.started_at: Optional[float] = None
+        self.stopped_at: Optional[float] = None
+        self.generated = 0
+        self.skipped = 0
+        self.batches = 0
+        self.generate_seconds = 0.0  # 배치 생성에 쓴 시간
+        self.inject_seconds = 0.0  # 저장소/파이프라인 주입에 쓴 시간
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, inject: Inject, rate: int, duration: Optional[float] = None):
+        """부하 생성 시작 (실행 중이면 새 설정으로 다시 시작, duration 초 후 자동 종료)"""
+        self.stop()
+        self.rate = rate
+        self.duration = duration
+        self.started_at = time.monotonic()
+        self.stopped_at = None
+        self.generated = self.skipped = self.batches = 0
+        self.generate_seconds = self.inject_seconds = 0.0
+        self._task = asyncio.create_task(self._run(inject))
+        print(f"[LoadGen] Started: {rate} threats/s" + (f" for {duration:g}s" if duration else ""))
+
+    def stop(self):
+        """부하 생성 중지"""
+        if self._task is None:
+            return
+        if not self._task.done():
+            self._task.cancel()
+            self.stopped_at = time.monotonic()
+            print(f"[LoadGen] Stopped: {self.generated} threats generated")
+        self._task = None
+
+    async def _run(self, inject: Inject):
+        produced = 0  # generated + skipped
+        max_batch = max(1, int(self.rate * self.tick * MAX_CATCHUP_TICKS))
+        try:
+            while True:
+                elapsed = time.monotonic() - self.started_at
+                if self.duration and elapsed >= self.duration:
+                    break
+                due = int(self.rate * elapsed) - produced
+                if due > max_batch:
+                    self.skipped += due - max_batch
+                    produced += due - max_batch
+                    due = max_batch
+                if due > 0:
+                    started = time.perf_counter()
+                    threats = simulator.generate_threat_batch(due)
+                    generated = time.perf_counter()
+                    await inject(threats)
+                    self.generate_seconds += generated - started
+                    self.inject_seconds += time.perf_counter() - generated
+                    self.generated += due
+                    self.batches += 1
+                    produced += due
+                await asyncio.sleep(self.tick)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[LoadGen] Error injecting threats: {e}")
+        self.stopped_at = time.monotonic()
+        print(f"[LoadGen] Finished: {self.generated} threats generated")
+
+    def stats(self) -> Dict:
+        """목표/달성 속도와 단계별 소요 시간"""
+        if self.started_at is None:
+            return {"running": False}
+        elapsed = (self.stopped_at or time.monotonic()) - self.started_at
+        return {
+            "running": self.running,
+            "target_rate": self.rate,
+            "achieved_rate": round(self.generated / elapsed, 1) if elapsed > 0 else 0.0,
+            "duration": self.duration,
+            "elapsed": round(elapsed, 1),
+            "generated": self.generated,
+            "skipped": self.skipped,
+            "batches": self.batches,
+            "generate_seconds": round(self.generate_seconds, 3),
+            "inject_seconds": round(self.inject_seconds, 3),
+        }
+
+
+# 싱글톤 인스턴스
+load_generator = LoadGenerator()
@@ -3,11 +3,16 @@ ARGUS SKY - OSINT Data Simulator
 데모용 현실감 있는 위협 데이터 생성
 AI 추론 과정 시뮬레이션 포함
 """
+import os
 import random
 import time
+import uuid
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Tuple
-import uuid
+
+import numpy as np
+
+from services.randomness import make_rng, new_id
 
 # 인천공항 중심 좌표
 INCHEON_AIRPORT_CENTER = (37.4602, 126.4407)
@@ -110,6 +115,20 @@ AIRPORT_LOCATIONS = [
     {"name": "항공기 격납고", "lat": 37.4478, "lng": 126.4567},
 ]
 
+# 부하 생성용 템플릿 풀 - 카테고리별로 미리 만들어 두는 키워드/개체 조합 수
+LOAD_POOL_SIZE = 64
+
+# 출처별 기본 신뢰도 (±0.1 노이즈 추가)
+BASE_CREDIBILITY = {
+    "government": 0.9,
+    "news_major": 0.8,
+    "news_general": 0.65,
+    "social_verified": 0.55,
+    "social_general": 0.4,
+    "darkweb": 0.35,
+    "internal": 0.85,
+}
+
 # AI 분석 모델 정보
 AI_MODELS = {
     "ARGUS-THREAT-v1": {
@@ -277,42 +296,44 @@ MITIGATING_FACTORS = {
 class OsintSimulator:
     """OSINT 데이터 시뮬레이터"""
     
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
         self.templates = THREAT_TEMPLATES
+        self.rng = rng or make_rng("simulator")
+        self._load_pools: Optional[Dict] = None  # 부하 생성용 템플릿 풀 (첫 배치 생성 시 구성)
     
     def generate_threat(self, category: Optional[str] = None) -> Dict:
         """위협 데이터 생성"""
         if category is None:
-            category = random.choice(list(self.templates.keys()))
+            category = self.rng.choice(list(self.templates.keys()))
         
         templates = self.templates.get(category, self.templates["terror"])
-        template = random.choice(templates)
+        template = self.rng.choice(templates)
         
-        severity = random.randint(*template["severity"])
+        severity = self.rng.randint(*template["severity"])
         source_type = template["source"]
         
         # 위치 생성
-        if random.random() > 0.4:
+        if self.rng.random() > 0.4:
             # 공항 내 특정 위치
-            location_info = random.choice(AIRPORT_LOCATIONS)
-            lat = location_info["lat"] + random.uniform(-0.002, 0.002)
-            lng = location_info["lng"] + random.uniform(-0.002, 0.002)
+            location_info = self.rng.choice(AIRPORT_LOCATIONS)
+            lat = location_info["lat"] + self.rng.uniform(-0.002, 0.002)
+            lng = location_info["lng"] + self.rng.uniform(-0.002, 0.002)
             location = location_info["name"]
         else:
             # 공항 주변 랜덤 위치
-            lat = INCHEON_AIRPORT_CENTER[0] + random.uniform(-COORD_VARIANCE, COORD_VARIANCE)
-            lng = INCHEON_AIRPORT_CENTER[1] + random.uniform(-COORD_VARIANCE, COORD_VARIANCE)
+            lat = INCHEON_AIRPORT_CENTER[0] + self.rng.uniform(-COORD_VARIANCE, COORD_VARIANCE)
+            lng = INCHEON_AIRPORT_CENTER[1] + self.rng.uniform(-COORD_VARIANCE, COORD_VARIANCE)
             location = "인천공항 인근"
         
         return {
-            "id": str(uuid.uuid4()),
+            "id": new_id(),
             "title": template["title"],
             "description": self._generate_description(template["title"], category),
             "category": category,
             "severity": severity,
             "credibility": self._generate_credibility(source_type),
             "source_type": source_type,
-            "source_name": random.choice(SOURCE_NAMES.get(source_type, ["알 수 없음"])),
+            "source_name": self.rng.choice(SOURCE_NAMES.get(source_type, ["알 수 없음"])),
             "location": location,
             "latitude": round(lat, 6),
             "longitude": round(lng, 6),
@@ -337,22 +358,13 @@ class OsintSimulator:
     
     def _generate_credibility(self, source_type: str) -> float:
         """신뢰도 생성"""
-        base_credibility = {
-            "government": 0.9,
-            "news_major": 0.8,
-            "news_general": 0.65,
-            "social_verified": 0.55,
-            "social_general": 0.4,
-            "darkweb": 0.35,
-            "internal": 0.85,
-        }
-        base = base_credibility.get(source_type, 0.5)
-        return round(base + random.uniform(-0.1, 0.1), 2)
+        base = BASE_CREDIBILITY.get(source_type, 0.5)
+        return round(base + self.rng.uniform(-0.1, 0.1), 2)
     
     def _generate_keywords(self, category: str) -> List[str]:
         """키워드 생성"""
         keywords = CATEGORY_KEYWORDS.get(category, ["위협", "보안"])
-        return random.sample(keywords, min(4, len(keywords)))
+        return self.rng.sample(keywords, min(4, len(keywords)))
     
     def _generate_entities(self, category: str) -> Dict:
         """관련 개체 생성"""
@@ -363,11 +375,11 @@ class OsintSimulator:
         }
         
         if category == "terror":
-            entities["organizations"] = random.sample(["IS", "알카에다", "불명 조직"], k=random.randint(0, 1))
+            entities["organizations"] = self.rng.sample(["IS", "알카에다", "불명 조직"], k=self.rng.randint(0, 1))
         elif category == "cyber":
-            entities["organizations"] = random.sample(["라자루스", "APT38", "불명 해커"], k=random.randint(0, 1))
+            entities["organizations"] = self.rng.sample(["라자루스", "APT38", "불명 해커"], k=self.rng.randint(0, 1))
         elif category == "geopolitical":
-            entities["locations"].append(random.choice(["북한", "중국", "일본"]))
+            entities["locations"].append(self.rng.choice(["북한", "중국", "일본"]))
         
         return entities
     
@@ -377,11 +389,135 @@ class OsintSimulator:
         categories = list(self.templates.keys())
         
         for _ in range(count):
-            category = random.choice(categories)
+            category = self.rng.choice(categories)
             threats.append(self.generate_threat(category))
         
         return threats
     
+    # =========================================================================
+    # 부하 생성 (대량 배치)
+    # =========================================================================
+    
+    def _build_load_pools(self) -> Dict:
+        """
+        배치 생성용 풀 구성
+        
+        템플릿은 평탄화해 열(column) 배열로, 설명/키워드/개체는 미리 만들어 둔 값 중에서
+        고르도록 합니다. 풀의 리스트/dict는 여러 위협이 공유하므로 수정하지 않습니다.
+        """
+        rng = make_rng("simulator_load")
+        categories = list(self.templates.keys())
+        templates = []
+        starts, counts = [], []
+        for category in categories:
+            starts.append(len(templates))
+            counts.append(len(self.templates[category]))
+            templates.extend((category, template) for template in self.templates[category])
+        
+        keyword_pools = {}
+        entity_pools = {}
+        for category in categories:
+            keywords = CATEGORY_KEYWORDS.get(category, ["위협", "보안"])
+            keyword_pools[category] = [rng.sample(keywords, min(4, len(keywords))) for _ in range(LOAD_POOL_SIZE)]
+            entity_pools[category] = [self._generate_entities(category) for _ in range(LOAD_POOL_SIZE)]
+        
+        return {
+            "numpy_rng": np.random.default_rng(rng.getrandbits(64)),
+            "categories": categories,
+            "category_starts": np.array(starts),
+            "category_counts": np.array(counts),
+            "category": [category for category, _ in templates],
+            "title": [template["title"] for _, template in templates],
+            "description": [self._generate_description(template["title"], category) for category, template in templates],
+            "source_type": [template["source"] for _, template in templates],
+            "source_names": [SOURCE_NAMES.get(template["source"], ["알 수 없음"]) for _, template in templates],
+            "severity_low": np.array([template["severity"][0] for _, template in templates]),
+            "severity_high": np.array([template["severity"][1] for _, template in templates]),
+            "credibility": np.array([BASE_CREDIBILITY.get(template["source"], 0.5) for _, template in templates]),
+            "keywords": keyword_pools,
+            "entities": entity_pools,
+            "location_names": [location["name"] for location in AIRPORT_LOCATIONS],
+            "location_lat": np.array([location["lat"] for location in AIRPORT_LOCATIONS]),
+            "location_lng": np.array([location["lng"] for location in AIRPORT_LOCATIONS]),
+        }
+    
+    def generate_threat_batch(self, count: int) -> List[Dict]:
+        """
+        부하 테스트용 위협 대량 생성 (generate_threat과 같은 분포/필드)
+        
+        난수는 필드마다 numpy로 한 번에 생성하고, 문자열은 미리 만든 풀에서 고릅니다.
+        한 배치의 위협은 같은 created_at을 가집니다.
+        """
+        if count <= 0:
+            return []
+        if self._load_pools is None:
+            self._load_pools = self._build_load_pools()
+        pools = self._load_pools
+        gen = pools["numpy_rng"]
+        
+        # 카테고리 → 카테고리 내 템플릿 (generate_threat과 같은 2단계 균등 선택)
+        category_index = gen.integers(0, len(pools["categories"]), count)
+        template_index = pools["category_starts"][category_index] + gen.integers(0, pools["category_counts"][category_index])
+        
+        severity = gen.integers(pools["severity_low"][template_index], pools["severity_high"][template_index], endpoint=True)
+        credibility = np.round(pools["credibility"][template_index] + gen.uniform(-0.1, 0.1, count), 2)
+        
+        # 위치: 60%는 공항 내 지점 근처, 나머지는 공항 주변 임의 위치
+        at_airport = gen.random(count) > 0.4
+        location_index = gen.integers(0, len(AIRPORT_LOCATIONS), count)
+        near = gen.uniform(-0.002, 0.002, (2, count))
+        around = gen.uniform(-COORD_VARIANCE, COORD_VARIANCE, (2, count))
+        lat = np.round(np.where(at_airport, pools["location_lat"][location_index] + near[0], INCHEON_AIRPORT_CENTER[0] + around[0]), 6)
+        lng = np.round(np.where(at_airport, pools["location_lng"][location_index] + near[1], INCHEON_AIRPORT_CENTER[1] + around[1]), 6)
+        
+        picks = gen.integers(0, 1 << 30, (3, count))  # 출처 이름 / 키워드 / 개체 풀 인덱스
+        ids = os.urandom(16 * count)  # 레코드 id는 시드와 무관하게 고유 (new_id와 동일)
+        created_at = datetime.utcnow().isoformat()
+        
+        # 파이썬 기본 타입으로 변환 (직렬화 시 numpy 타입 변환 없음)
+        template_index = template_index.tolist()
+        severity = severity.tolist()
+        credibility = credibility.tolist()
+        at_airport = at_airport.tolist()
+        location_index = location_index.tolist()
+        lat = lat.tolist()
+        lng = lng.tolist()
+        source_pick, keyword_pick, entity_pick = picks.tolist()
+        
+        categories = pools["category"]
+        titles = pools["title"]
+        descriptions = pools["description"]
+        source_types = pools["source_type"]
+        source_names = pools["source_names"]
+        keywords = pools["keywords"]
+        entities = pools["entities"]
+        location_names = pools["location_names"]
+        
+        threats = []
+        for i in range(count):
+            t = template_index[i]
+            category = categories[t]
+            names = source_names[t]
+            threats.append({
+                "id": str(uuid.UUID(bytes=ids[16 * i:16 * i + 16], version=4)),
+                "title": titles[t],
+                "description": descriptions[t],
+                "category": category,
+                "severity": severity[i],
+                "credibility": credibility[i],
+                "source_type": source_types[t],
+                "source_name": names[source_pick[i] % len(names)],
+                "location": location_names[location_index[i]] if at_airport[i] else "인천공항 인근",
+                "latitude": lat[i],
+                "longitude": lng[i],
+                "keywords": keywords[category][keyword_pick[i] % LOAD_POOL_SIZE],
+                "entities": entities[category][entity_pick[i] % LOAD_POOL_SIZE],
+                "language": "ko",
+                "status": "new",
+                "created_at": created_at,
+            })
+        return threats
+    
     def generate_alert_from_threat(self, threat: Dict) -> Dict:
         """위협으로부터 알림 생성"""
         severity = threat.get("severity", 50)
@@ -399,7 +535,7 @@ class OsintSimulator:
             level = 1
         
         return {
-            "id": str(uuid.uuid4()),
+            "id": new_id(),
             "threat_id": threat.get("id"),
             "level": level,
             "title": f"[{threat.get('category', 'unknown').upper()}] {threat.get('title', '새 위협 탐지')}",
@@ -438,7 +574,7 @@ class OsintSimulator:
         raw_data = self._generate_raw_input_data(threat)
         
         return {
-            "id": str(uuid.uuid4()),
+            "id": new_id(),
             "source_type": source_type,
             "source_name": source_name,
             "collection_method": collection_methods.get(source_type, "api"),
@@ -452,13 +588,13 @@ class OsintSimulator:
             "status": "success",
             "items_collected": 1,
             "items_processed": 1,
-            "items_filtered": random.randint(0, 3),
+            "items_filtered": self.rng.randint(0, 3),
             "response_status_code": 200,
             "response_sample": raw_data[:1000],
             "raw_data": raw_data,
             "started_at": datetime.utcnow().isoformat(),
             "completed_at": datetime.utcnow().isoformat(),
-            "duration_ms": random.randint(50, 500),
+            "duration_ms": self.rng.randint(50, 500),
             "created_at": datetime.utcnow().isoformat()
         }
     
@@ -472,7 +608,7 @@ class OsintSimulator:
             return f"""
 [정부 보안 경보 API 응답]
 {{
-  "alert_id": "GOV-2024-{random.randint(10000, 99999)}",
+  "alert_id": "GOV-2024-{self.rng.randint(10000, 99999)}",
   "classification": "RESTRICTED",
   "timestamp": "{datetime.utcnow().isoformat()}Z",
   "source_agency": "{threat.get('source_name', '정부기관')}",
@@ -489,7 +625,7 @@ class OsintSimulator:
         elif source_type in ["news_major", "news_general"]:
             return f"""
 [뉴스 크롤링 결과]
-URL: https://news.example.com/article/{random.randint(100000, 999999)}
+URL: https://news.example.com/article/{self.rng.randint(100000, 999999)}
 수집 시간: {datetime.utcnow().isoformat()}
 ---
 제목: {title}
@@ -511,11 +647,11 @@ URL: https://news.example.com/article/{random.randint(100000, 999999)}
 Platform: Twitter
 Collection Time: {datetime.utcnow().isoformat()}
 ---
-@{random.choice(['security_analyst', 'airport_watch', 'news_alert', 'safety_monitor'])}
+@{self.rng.choice(['security_analyst', 'airport_watch', 'news_alert', 'safety_monitor'])}
 "{title[:100]}..."
 🚨 #인천공항 #보안 #{threat.get('keywords', ['경보'])[0]}
 ---
-Engagement: {random.randint(50, 500)} likes, {random.randint(10, 100)} retweets
+Engagement: {self.rng.randint(50, 500)} likes, {self.rng.randint(10, 100)} retweets
 Verified: {'Yes' if source_type == 'social_verified' else 'No'}
 Location: South Korea (inferred)
 """
@@ -523,11 +659,11 @@ Location: South Korea (inferred)
             return f"""
 [다크웹 모니터링 - TOR 네트워크]
 Forum: [REDACTED]
-Thread ID: {random.randint(10000, 99999)}
+Thread ID: {self.rng.randint(10000, 99999)}
 Captured: {datetime.utcnow().isoformat()}
 ---
 Subject: {title}
-Author: [Anonymous User #{random.randint(1000, 9999)}]
+Author: [Anonymous User #{self.rng.randint(1000, 9999)}]
 ---
 [Original post content - translated from English]
 {threat.get('description', '')}
@@ -539,8 +675,8 @@ Credibility assessment: MEDIUM-LOW
         elif source_type == "internal":
             return f"""
 [내부 보안 시스템 이벤트]
-System: {random.choice(['CCTV_Monitor', 'Access_Control', 'Intrusion_Detection', 'Security_Alert'])}
-Event ID: INT-{datetime.utcnow().strftime('%Y%m%d')}-{random.randint(1000, 9999)}
+System: {self.rng.choice(['CCTV_Monitor', 'Access_Control', 'Intrusion_Detection', 'Security_Alert'])}
+Event ID: INT-{datetime.utcnow().strftime('%Y%m%d')}-{self.rng.randint(1000, 9999)}
 Timestamp: {datetime.utcnow().isoformat()}
 ---
 Event Type: {category.upper()}_ALERT
@@ -550,9 +686,9 @@ Severity: {threat.get('severity', 50)}/100
 Description: {threat.get('description', '')}
 ---
 Sensor Data:
-- Detection confidence: {random.randint(75, 99)}%
+- Detection confidence: {self.rng.randint(75, 99)}%
 - Alert threshold: 70%
-- Previous alerts (24h): {random.randint(0, 5)}
+- Previous alerts (24h): {self.rng.randint(0, 5)}
 """
         else:
             return f"""
@@ -591,19 +727,19 @@ Keywords: {', '.join(threat.get('keywords', []))}
         }
         
         # 위협 지표 선택
-        indicators = random.sample(
+        indicators = self.rng.sample(
             THREAT_INDICATORS.get(category, ["일반 위협 탐지"]),
             min(3, len(THREAT_INDICATORS.get(category, [])))
         )
         
         # 위험 요소 선택
-        risk_factors = random.sample(
+        risk_factors = self.rng.sample(
             RISK_FACTORS.get(category, ["일반 위험 요소"]),
             min(2, len(RISK_FACTORS.get(category, [])))
         )
         
         # 완화 요소 선택
-        mitigating = random.sample(
+        mitigating = self.rng.sample(
             MITIGATING_FACTORS.get(category, ["일반 보안 조치"]),
             min(2, len(MITIGATING_FACTORS.get(category, [])))
         )
@@ -622,12 +758,12 @@ Keywords: {', '.join(threat.get('keywords', []))}
         
         # 신뢰도 점수
         base_confidence = threat.get("credibility", 0.5)
-        confidence_score = min(0.95, base_confidence + random.uniform(0, 0.1))
+        confidence_score = min(0.95, base_confidence + self.rng.uniform(0, 0.1))
         
-        processing_time = int((time.time() - start_time) * 1000) + random.randint(100, 500)
+        processing_time = int((time.time() - start_time) * 1000) + self.rng.randint(100, 500)
         
         return {
-            "id": str(uuid.uuid4()),
+            "id": new_id(),
             "threat_id": threat.get("id"),
             "collection_log_id": collection_log.get("id") if collection_log else None,
             "raw_input": raw_input,
@@ -649,7 +785,7 @@ Keywords: {', '.join(threat.get('keywords', []))}
             "recommendation": recommendation,
             "confidence_score": round(confidence_score, 3),
             "processing_time_ms": processing_time,
-            "tokens_used": random.randint(500, 2000),
+            "tokens_used": self.rng.randint(500, 2000),
             "created_at": datetime.utcnow().isoformat()
         }
     
@@ -664,7 +800,7 @@ Keywords: {', '.join(threat.get('keywords', []))}
                 "description": "원시 데이터를 수신하고 분석 가능한 형태로 전처리",
                 "input": f"Raw data from {threat.get('source_name', 'unknown')} ({len(raw_input)} chars)",
                 "output": "Cleaned and normalized text data",
-                "duration_ms": random.randint(10, 50),
+                "duration_ms": self.rng.randint(10, 50),
                 "model_used": "ARGUS-NLP-v1"
             },
             {
@@ -673,7 +809,7 @@ Keywords: {', '.join(threat.get('keywords', []))}
                 "description": "텍스트에서 조직, 장소, 인물 등 주요 개체 추출",
                 "input": "Preprocessed text",
                 "output": f"Extracted entities: {threat.get('entities', {})}",
-                "duration_ms": random.randint(30, 100),
+                "duration_ms": self.rng.randint(30, 100),
                 "model_used": "ARGUS-NLP-v1"
             },
             {
@@ -682,7 +818,7 @@ Keywords: {', '.join(threat.get('keywords', []))}
                 "description": "위협 관련 핵심 키워드 식별",
                 "input": "Preprocessed text",
                 "output": f"Keywords: {threat.get('keywords', [])}",
-                "duration_ms": random.randint(20, 80),
+                "duration_ms": self.rng.randint(20, 80),
                 "model_used": "ARGUS-NLP-v1"
             },
             {
@@ -691,7 +827,7 @@ Keywords: {', '.join(threat.get('keywords', []))}
                 "description": f"머신러닝 분류기를 통해 위협 유형 결정",
                 "input": "Entities + Keywords + Context",
                 "output": f"Category: {category} (confidence: {round(threat.get('credibility', 0.5) + 0.1, 2)})",
-                "duration_ms": random.randint(50, 150),
+                "duration_ms": self.rng.randint(50, 150),
                 "model_used": "ARGUS-THREAT-v1"
             },
             {
@@ -700,7 +836,7 @@ Keywords: {', '.join(threat.get('keywords', []))}
                 "description": "다중 요인 분석을 통한 심각도 점수 계산",
                 "input": f"Category: {category}, Source credibility: {threat.get('credibility', 0.5)}",
                 "output": f"Severity: {threat.get('severity', 50)}/100",
-                "duration_ms": random.randint(30, 100),
+                "duration_ms": self.rng.randint(30, 100),
                 "model_used": "ARGUS-RISK-v1"
             },
             {
@@ -709,7 +845,7 @@ Keywords: {', '.join(threat.get('keywords', []))}
                 "description": "현재 상황에서의 추가적인 위험 요소 식별",
                 "input": "Threat context + Current environment",
                 "output": f"Risk factors identified: {len(RISK_FACTORS.get(category, []))}",
-                "duration_ms": random.randint(40, 120),
+                "duration_ms": self.rng.randint(40, 120),
                 "model_used": "ARGUS-RISK-v1"
             },
             {
@@ -718,7 +854,7 @@ Keywords: {', '.join(threat.get('keywords', []))}
                 "description": "종합 분석 결과를 바탕으로 최종 평가 및 대응 권고 생성",
                 "input": "All previous analysis results",
                 "output": "Final assessment and recommendations generated",
-                "duration_ms": random.randint(50, 150),
+                "duration_ms": self.rng.randint(50, 150),
                 "model_used": "ARGUS-THREAT-v1"
             }
         ]
@@ -817,7 +953,7 @@ Keywords: {', '.join(threat.get('keywords', []))}
 4. **위험 요소** (Risk Factors): +{len(risk_factors) * 2}
    - {', '.join(risk_factors[:2])} 등 {len(risk_factors)}개 요소
    
-5. **시간적 요소** (Temporal Factor): ±{random.randint(1, 5)}
+5. **시간적 요소** (Temporal Factor): ±{self.rng.randint(1, 5)}
    - 현재 시점 기준 긴급성 반영
 
 **최종 계산:**
@@ -0,0 +1,31 @@
+"""
+ARGUS SKY - Random Number Sources
+시뮬레이션/계산 노이즈용 난수 생성기 (RANDOM_SEED 설정 시 결정적 모드)
+"""
+from typing import Optional
+import random
+import uuid
+
+from config import RANDOM_SEED
+
+
+def make_rng(stream: str, seed: Optional[int] = RANDOM_SEED) -> random.Random:
+    """
+    구성 요소별 독립 난수 생성기 생성
+
+    시드가 주어지면 (seed, stream) 조합으로 초기화되어 실행마다 같은 값을 생성하고,
+    구성 요소끼리는 서로의 호출 횟수에 영향을 받지 않습니다.
+    """
+    if seed is None:
+        return random.Random()
+    return random.Random(f"{seed}:{stream}")
+
+
+def new_id() -> str:
+    """
+    레코드 id (UUID4 문자열) - RANDOM_SEED와 무관하게 항상 고유
+
+    id는 시뮬레이션 값이 아니라 DB/저장소의 키이므로 시드 스트림에서 뽑지 않습니다.
+    (같은 시드로 재시작해도 기존 행과 충돌하지 않음)
+    """
+    return str(uuid.uuid4())
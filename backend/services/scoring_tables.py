@@ -0,0 +1,201 @@
+"""
+ARGUS SKY - Compiled Scoring Tables
+점수 계산 설정(카테고리 가중치, 출처 신뢰도, 위협 레벨)을 조회 전용 테이블로 컴파일
+설정 파일 변경 시 서버 재시작 없이 원자적으로 교체
+"""
+from bisect import bisect_right
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
+import copy
+import json
+import os
+
+from config import CATEGORY_WEIGHTS, DATA_SOURCES, THREAT_LEVELS, SCORING_CONFIG_PATH
+
+DEFAULT_CATEGORY_WEIGHT = 0.1
+DEFAULT_SOURCE_CREDIBILITY = 0.5
+
+
+class ScoringTables:
+    """
+    컴파일된 점수 계산 테이블 (생성 후 변경 불가)
+
+    - 카테고리/출처는 정수 코드로 매핑되고 가중치는 코드 순서의 튜플로 보관
+    - 위협 레벨은 구간 하한 목록에 대한 이진 탐색(bisect)으로 분류
+    """
+    __slots__ = (
+        "version",
+        "loaded_at",
+        "source_path",
+        "category_names",
+        "category_codes",
+        "category_weights",
+        "source_names",
+        "source_codes",
+        "source_credibility",
+        "levels",
+        "level_floors",
+        "level_names",
+        "category_config",
+        "source_config",
+        "level_config",
+    )
+
+    def __init__(
+        self,
+        category_weights: Dict,
+        data_sources: Dict,
+        threat_levels: Dict,
+        version: int = 1,
+        source_path: Optional[str] = None,
+    ):
+        set_attr = super().__setattr__
+        set_attr("version", version)
+        set_attr("loaded_at", datetime.utcnow())
+        set_attr("source_path", source_path)
+
+        category_names = tuple(category_weights.keys())
+        set_attr("category_names", category_names)
+        set_attr("category_codes", MappingProxyType({name: code for code, name in enumerate(category_names)}))
+        set_attr("category_weights", tuple(float(category_weights[name]["weight"]) for name in category_names))
+
+        source_names = tuple(data_sources.keys())
+        set_attr("source_names", source_names)
+        set_attr("source_codes", MappingProxyType({name: code for code, name in enumerate(source_names)}))
+        set_attr("source_credibility", tuple(float(data_sources[name]["credibility"]) for name in source_names))
+
+        ordered_levels = sorted(threat_levels.items(), key=lambda item: item[1]["min"])
+        set_attr("levels", tuple(int(level) for level, _ in ordered_levels))
+        set_attr("level_floors", tuple(float(config["min"]) for _, config in ordered_levels))
+        set_attr("level_names", MappingProxyType({int(level): config["name"] for level, config in ordered_levels}))
+
+        # 근거 조회 API용 원본 설정 (읽기 전용)
+        set_attr("category_config", MappingProxyType(copy.deepcopy(category_weights)))
+        set_attr("source_config", MappingProxyType(copy.deepcopy(data_sources)))
+        set_attr("level_config", MappingProxyType({int(level): copy.deepcopy(config) for level, config in ordered_levels}))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ScoringTables is immutable")
+
+    def category_weight(self, category: str) -> float:
+        """카테고리 가중치"""
+        code = self.category_codes.get(category)
+        return self.category_weights[code] if code is not None else DEFAULT_CATEGORY_WEIGHT
+
+    def source_weight(self, source_type: str) -> float:
+        """출처 신뢰도"""
+        code = self.source_codes.get(source_type)
+        return self.source_credibility[code] if code is not None else DEFAULT_SOURCE_CREDIBILITY
+
+    def classify_level(self, index: float) -> int:
+        """
+        위협 지수 → 레벨
+
+        각 레벨의 하한 이상, 다음 레벨 하한 미만이면 해당 레벨 (29.5 → LOW)
+        """
+        position = bisect_right(self.level_floors, index) - 1
+        return self.levels[max(0, position)]
+
+    def level_range(self, level: int) -> Tuple[float, float]:
+        """레벨의 (min, max) 범위"""
+        config = self.level_config[level]
+        return config["min"], config["max"]
+
+
+def _merge_section(defaults: Dict, overrides: Optional[Dict]) -> Dict:
+    """기본 설정에 파일의 항목별 설정을 덮어씀"""
+    merged = copy.deepcopy(defaults)
+    for key, value in (overrides or {}).items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key].update(value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def compile_tables(overrides: Optional[Dict] = None, version: int = 1, source_path: Optional[str] = None) -> ScoringTables:
+    """
+    설정 dict를 테이블로 컴파일
+
+    overrides 형식 (모든 섹션 선택):
+        {"category_weights": {"cyber": {"weight": 0.3}},
+         "data_sources": {"darkweb": {"credibility": 0.4}},
+         "threat_levels": {"3": {"min": 45}}}
+    """
+    overrides = overrides or {}
+    threat_levels = {int(k): v for k, v in overrides.get("threat_levels", {}).items()}
+
+    try:
+        return ScoringTables(
+            _merge_section(CATEGORY_WEIGHTS, overrides.get("category_weights")),
+            _merge_section(DATA_SOURCES, overrides.get("data_sources")),
+            _merge_section(THREAT_LEVELS, threat_levels),
+            version=version,
+            source_path=source_path,
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid scoring configuration: {e}") from e
+
+
+class ScoringConfig:
+    """컴파일된 테이블 보관 및 핫 리로드 관리"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._mtime: Optional[float] = None
+        self.tables = compile_tables()
+        if path and os.path.exists(path):
+            try:
+                self.reload()
+            except ValueError as e:
+                print(f"[ScoringConfig] {e} - using built-in defaults")
+
+    @property
+    def version(self) -> int:
+        return self.tables.version
+
+    def reload(self, path: Optional[str] = None) -> ScoringTables:
+        """설정 파일을 다시 읽어 테이블을 원자적으로 교체"""
+        path = path or self.path
+        if not path:
+            raise ValueError("No scoring configuration file configured")
+
+        try:
+            mtime = os.path.getmtime(path)
+            with open(path, encoding="utf-8") as f:
+                overrides = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"Cannot load scoring configuration {path}: {e}") from e
+
+        tables = compile_tables(overrides, version=self.tables.version + 1, source_path=path)
+
+        # 참조 교체 한 번으로 반영 - 진행 중인 계산은 이전 테이블을 끝까지 사용
+        self.tables = tables
+        self.path = path
+        self._mtime = mtime
+        print(f"[ScoringConfig] Loaded {path} (version {tables.version})")
+        return tables
+
+    def reload_if_changed(self) -> bool:
+        """설정 파일이 변경되었을 때만 리로드"""
+        if not self.path:
+            return False
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return False
+        if mtime == self._mtime:
+            return False
+
+        try:
+            self.reload()
+            return True
+        except ValueError as e:
+            self._mtime = mtime  # 같은 잘못된 파일을 반복해서 읽지 않음
+            print(f"[ScoringConfig] {e}")
+            return False
+
+
+# 싱글톤 인스턴스
+scoring_config = ScoringConfig(SCORING_CONFIG_PATH)
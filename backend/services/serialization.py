@@ -0,0 +1,166 @@
+"""
+ARGUS SKY - Fast JSON Serialization
+orjson 기반 직렬화 (datetime / dict / list는 orjson이 네이티브로 처리)
+WebSocket msgpack 서브프로토콜용 MessagePack 인코딩 (msgpack 설치 시)
+
+Encoded(포맷별 인코딩을 캐시하는 dict)는 다른 메시지 안에 값으로 들어가면
+다시 인코딩하지 않고 캐시된 bytes를 그대로 이어 붙입니다.
+"""
+from datetime import date, datetime
+from typing import Any, Dict, List
+
+import orjson
+
+try:
+    import msgpack
+except ImportError:  # msgpack 미설치 시 JSON만 지원
+    msgpack = None
+
+# int 키 dict(레벨 설정 등)도 표준 json처럼 문자열 키로 직렬화
+# 내장 타입의 하위 클래스는 default 훅으로 전달 (Encoded의 캐시된 bytes 사용)
+DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_SUBCLASS
+
+
+def _builtin(obj: Any) -> Any:
+    """내장 타입 하위 클래스 → 내장 타입 (해당 없으면 None)"""
+    if isinstance(obj, dict):
+        return dict(obj)
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return list(obj)
+    if isinstance(obj, str):
+        return str.__str__(obj)
+    if isinstance(obj, int):
+        return int(obj)
+    if isinstance(obj, float):
+        return float(obj)
+    return None
+
+
+def _default(obj: Any) -> Any:
+    """orjson이 처리하지 못하는 타입 변환 (ORM 객체, set 등)"""
+    if isinstance(obj, Encoded):
+        return orjson.Fragment(obj.encoded(JSON))
+    converted = _builtin(obj)
+    if converted is not None:
+        return converted
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if hasattr(obj, "__dict__"):
+        # SQLAlchemy 모델 등 - 내부 상태(_sa_instance_state 등) 제외
+        return {k: v for k, v in obj.__dict__.items() if not k.startswith("_")}
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj: Any) -> bytes:
+    """UTF-8 JSON bytes로 인코딩"""
+    return orjson.dumps(obj, default=_default, option=DUMPS_OPTIONS)
+
+
+def dumps_text(obj: Any) -> str:
+    """JSON 문자열로 인코딩 (WebSocket 텍스트 프레임용)"""
+    return orjson.dumps(obj, default=_default, option=DUMPS_OPTIONS).decode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    """JSON bytes/str 디코딩"""
+    return orjson.loads(data)
+
+
+# =============================================================================
+# WebSocket Frame Formats
+# =============================================================================
+JSON = "json"
+MSGPACK = "msgpack"
+
+
+def available_formats() -> List[str]:
+    """사용 가능한 프레임 포맷 (msgpack은 패키지 설치 시)"""
+    return [JSON, MSGPACK] if msgpack is not None else [JSON]
+
+
+class _EncodedValue(Exception):
+    """msgpack 인코딩 중 Encoded 값 발견 - 이어 붙이기 인코딩으로 전환"""
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """msgpack이 처리하지 못하는 타입 변환 (JSON과 같은 표현)"""
+    if isinstance(obj, Encoded):
+        raise _EncodedValue
+    converted = _builtin(obj)
+    if converted is not None:
+        return converted
+    return _default(obj)
+
+
+def _packb(obj: Any) -> bytes:
+    # datetime은 ISO 문자열로 (JSON 프레임과 동일한 값)
+    # strict_types: 하위 클래스(Encoded 등)도 default 훅으로 전달
+    return msgpack.packb(obj, default=_msgpack_default, use_bin_type=True, datetime=False, strict_types=True)
+
+
+def _pack_spliced(obj: Any, packer: Any) -> bytes:
+    """
+    Encoded 값을 포함한 객체의 msgpack 인코딩
+
+    msgpack default 훅은 원시 bytes를 반환할 수 없으므로, Encoded가 들어 있는
+    dict/배열은 헤더를 직접 쓰고 Encoded는 캐시된 bytes를 그대로 이어 붙입니다.
+    """
+    if isinstance(obj, Encoded):
+        return obj.encoded(MSGPACK)
+    try:
+        return _packb(obj)
+    except _EncodedValue:
+        pass
+    if isinstance(obj, dict):
+        parts = [packer.pack_map_header(len(obj))]
+        for key, value in obj.items():
+            parts.append(_pack_spliced(key, packer))
+            parts.append(_pack_spliced(value, packer))
+        return b"".join(parts)
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return packer.pack_array_header(len(obj)) + b"".join(_pack_spliced(value, packer) for value in obj)
+    return _pack_spliced(_msgpack_default(obj), packer)
+
+
+def encode(obj: Any, fmt: str = JSON) -> bytes:
+    """포맷별 프레임 인코딩"""
+    if fmt == MSGPACK:
+        try:
+            return _packb(obj)
+        except _EncodedValue:
+            return _pack_spliced(obj, msgpack.Packer())
+    return dumps(obj)
+
+
+def encode_batch(frames: List[bytes], fmt: str = JSON) -> bytes:
+    """인코딩된 메시지 여러 개를 배열 프레임 하나로 결합 (재인코딩 없음)"""
+    if fmt == MSGPACK:
+        return msgpack.Packer().pack_array_header(len(frames)) + b"".join(frames)
+    return b"[" + b",".join(frames) + b"]"
+
+
+def frame_for(frames: Dict[str, bytes], message: Any, fmt: str) -> bytes:
+    """포맷별 인코딩 캐시 - 같은 메시지는 포맷마다 한 번만 인코딩"""
+    frame = frames.get(fmt)
+    if frame is None:
+        frame = frames[fmt] = encode(message, fmt)
+    return frame
+
+
+class Encoded(dict):
+    """
+    포맷별 인코딩을 캐시하는 dict (도메인 이벤트 데이터)
+
+    포맷마다 최대 한 번만 인코딩하고, 다른 메시지에 값으로 포함되면 캐시된 bytes를
+    그대로 사용합니다 (JSON: orjson.Fragment, msgpack: 원시 bytes 이어 붙이기).
+    첫 인코딩 이후에는 내용을 바꾸지 않아야 합니다.
+    """
+    __slots__ = ("frames",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.frames: Dict[str, bytes] = {}
+
+    def encoded(self, fmt: str = JSON) -> bytes:
+        """포맷별 인코딩 (캐시)"""
+        return frame_for(self.frames, dict(self), fmt)
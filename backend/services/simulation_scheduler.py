@@ -2,26 +2,66 @@
 ARGUS SKY - Simulation Scheduler
 데모용 실시간 데이터 시뮬레이션 스케줄러
 AI 추론 로그 기록 포함
+
+다중 워커(이벤트 버스 unix 백엔드)에서는 리더 워커만 시뮬레이션을 실행하고,
+팔로워 워커는 리더가 발행한 scheduler 이벤트로 상태를 미러링합니다.
 """
 import asyncio
+import functools
+import math
 import random
-from datetime import datetime
-from typing import Optional
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, Dict, List, Optional, Tuple
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
 from services.threat_calculator import calculator
+from services.index_engine import CategoryIndexEngine
+from services.randomness import make_rng
+from services.scoring_tables import scoring_config
 from services.osint_simulator import simulator
 from services.websocket_manager import manager
 from services.alert_service import alert_service
-from config import THREAT_UPDATE_INTERVAL, NEW_THREAT_INTERVAL, DEMO_MODE
+from services.event_bus import event_bus
+from services.event_pipeline import DomainEvent, pipeline
+from services.load_generator import load_generator
+from config import (
+    THREAT_UPDATE_INTERVAL, NEW_THREAT_INTERVAL, DEMO_MODE, SCORING_CONFIG_RELOAD_INTERVAL, WS_RESUME_SNAPSHOT_LIMIT,
+    THREAT_HISTORY_SIZE,
+)
+
+# 팔로워 워커가 리더에게 실행을 요청할 수 있는 명령
+LEADER_COMMANDS = (
+    "trigger_cyber_attack",
+    "trigger_missile_alert",
+    "trigger_drone_intrusion",
+    "trigger_stabilization",
+    "restart",
+    "update_threat_status",
+    "start_load",
+    "stop_load",
+)
+
+
+def leader_command(method):
+    """팔로워 워커에서 호출되면 리더 워커에게 명령으로 전달 (키워드 인자만 전달)"""
+    @functools.wraps(method)
+    async def wrapper(self, **kwargs):
+        if not event_bus.is_leader:
+            await event_bus.send_command(method.__name__, kwargs)
+            return None
+        return await method(self, **kwargs)
+    return wrapper
 
 
 class SimulationScheduler:
     """실시간 시뮬레이션 스케줄러"""
     
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
         self.scheduler = AsyncIOScheduler()
+        self.rng = rng or make_rng("scheduler")
         self._current_index: float = 45.0  # 초기 위협 지수
         self._category_indices: dict = {
             "terror": 35.0,
@@ -32,10 +72,18 @@ class SimulationScheduler:
             "geopolitical": 40.0,
         }
         self._active_threats: list = []
+        self._index_engine = CategoryIndexEngine()  # 활성 위협 기반 카테고리 점수
+        self._next_decay_at: Optional[datetime] = None  # 예약된 감쇠 구간 전환 시각
         self._collection_logs: list = []  # 데이터 수집 로그
         self._ai_reasoning_logs: list = []  # AI 추론 로그
         self._is_running: bool = False
         self._demo_mode_active: bool = False
+        self._last_threat_index: Optional[dict] = None  # 마지막 브로드캐스트 지수 (팔로워 스냅샷용)
+        self._leader_running: bool = False  # 팔로워: 리더의 시뮬레이션 실행 여부
+        self._mirrored: bool = False  # 팔로워로 리더 상태를 미러링한 적 있음
+        # 위협 지수 히스토리 (timestamp, total_index, categories) - 지수 업데이트마다 기록
+        self._history: Deque[Tuple[str, float, Dict[str, float]]] = deque(maxlen=THREAT_HISTORY_SIZE)
+        self.state_version: int = 0  # 상태가 바뀔 때마다 증가 (initial_state 캐시 키)
     
     async def start(self):
         """스케줄러 시작"""
@@ -44,8 +92,17 @@ class SimulationScheduler:
         
         print("[Scheduler] Starting simulation scheduler...")
         
-        # 초기 위협 데이터 생성
-        await self._initialize_threats()
+        if self._mirrored:
+            # 팔로워에서 리더로 승격 - 이전 리더의 위협/로그를 이어받음
+            self._mirrored = False
+            self._next_decay_at = None
+            self._schedule_decay_transition()
+        else:
+            # 초기 위협 데이터 생성
+            await self._initialize_threats()
+            # 알림 테이블이 비어 있으면 데모 알림 생성
+            if DEMO_MODE:
+                await alert_service.seed_demo_alerts()
         
         # 위협 지수 업데이트 (10초마다)
         self.scheduler.add_job(
@@ -71,27 +128,47 @@ class SimulationScheduler:
             replace_existing=True
         )
         
+        # 점수 설정 파일 변경 감지 (핫 리로드)
+        self.scheduler.add_job(
+            self._reload_scoring_config,
+            IntervalTrigger(seconds=SCORING_CONFIG_RELOAD_INTERVAL),
+            id='reload_scoring_config',
+            replace_existing=True
+        )
+        
         self.scheduler.start()
         self._is_running = True
         print("[Scheduler] Simulation scheduler started!")
+        
+        # 이미 연결된 팔로워 워커에 전체 상태 전달
+        await self._publish("snapshot", **self._snapshot())
     
     def stop(self):
         """스케줄러 정지"""
+        load_generator.stop()
         if self._is_running:
             self.scheduler.shutdown(wait=False)
             self._is_running = False
             print("[Scheduler] Simulation scheduler stopped.")
     
+    @leader_command
+    async def restart(self):
+        """스케줄러 재시작 (데모 초기화)"""
+        self.stop()
+        # AsyncIOScheduler는 다음 루프 반복에서 종료 상태로 전환됨
+        await asyncio.sleep(0)
+        await self.start()
+    
     async def _initialize_threats(self):
         """초기 위협 데이터 생성 (AI 추론 로그 포함)"""
         print("[Scheduler] Initializing threat data with AI reasoning logs...")
         
         # 카테고리별 2-3개씩 위협 생성
         for category in self._category_indices.keys():
-            count = random.randint(2, 3)
+            count = self.rng.randint(2, 3)
             for _ in range(count):
                 threat = simulator.generate_threat(category)
-                self._active_threats.append(threat)
+                self._add_threat(threat)
                 
                 # 데이터 수집 로그 생성
                 collection_log = simulator.generate_data_collection_log(threat)
@@ -108,39 +185,112 @@ class SimulationScheduler:
         print(f"[Scheduler] Created {len(self._active_threats)} initial threats")
         print(f"[Scheduler] Generated {len(self._ai_reasoning_logs)} AI reasoning logs")
     
+    def _add_threat(self, threat: dict):
+        """활성 위협 추가 후 다음 감쇠 구간 전환 예약"""
+        self._track_threat(threat)
+        self._schedule_decay_transition()
+    
+    def _track_threat(self, threat: dict):
+        """활성 위협 목록/지수 엔진에 추가 (최대 50개 유지, 축출된 위협은 지수 엔진에서 제거)"""
+        self._active_threats.append(threat)
+        self._index_engine.add(threat)
+        
+        if len(self._active_threats) > 50:
+            for evicted in self._active_threats[:-50]:
+                self._index_engine.remove(evicted["id"])
+            self._active_threats = self._active_threats[-50:]
+    
+    def _schedule_decay_transition(self):
+        """다음 감쇠 구간 전환 시각에 단발성 작업 예약"""
+        next_at = self._index_engine.next_transition_at()
+        if next_at is None:
+            return
+        if self._next_decay_at is not None and self._next_decay_at <= next_at:
+            return
+        
+        self._next_decay_at = next_at
+        self.scheduler.add_job(
+            self._apply_decay_transitions,
+            DateTrigger(run_date=max(next_at, datetime.utcnow()), timezone=timezone.utc),
+            id='decay_transition',
+            replace_existing=True,
+            misfire_grace_time=None
+        )
+    
+    async def _apply_decay_transitions(self):
+        """감쇠 구간 경계를 넘은 위협 점수 반영"""
+        try:
+            self._next_decay_at = None
+            transitions = self._index_engine.refresh_decay()
+            if transitions:
+                print(f"[Scheduler] Applied {transitions} decay transitions")
+            self._schedule_decay_transition()
+        except Exception as e:
+            print(f"[Scheduler] Error applying decay transitions: {e}")
+    
+    async def _reload_scoring_config(self):
+        """점수 설정 파일이 변경되었으면 테이블 교체 후 지수 엔진 재계산"""
+        try:
+            if scoring_config.reload_if_changed():
+                self.sync_scoring_config()
+                await self.publish_scoring_config()
+        except Exception as e:
+            print(f"[Scheduler] Error reloading scoring config: {e}")
+    
+    def sync_scoring_config(self):
+        """현재 설정 테이블 버전으로 지수 엔진 재계산"""
+        if self._index_engine.config_version != scoring_config.version:
+            self._index_engine.rebuild(self._active_threats)
+            self._next_decay_at = None
+            self._schedule_decay_transition()
+    
+    async def publish_scoring_config(self):
+        """다른 워커에 점수 설정 파일 재확인 요청"""
+        await self._publish("scoring_config", version=scoring_config.version)
+    
     async def _update_threat_index(self):
         """위협 지수 업데이트 및 브로드캐스트"""
         try:
             # 카테고리별 자연스러운 변동
             for category in self._category_indices.keys():
                 current = self._category_indices[category]
-                change = random.uniform(-2.5, 2.5)
+                change = self.rng.uniform(-2.5, 2.5)
                 new_value = max(10, min(95, current + change))
                 self._category_indices[category] = round(new_value, 1)
             
             # 통합 지수 계산
-            from services.threat_calculator import CATEGORY_WEIGHTS
+            tables = scoring_config.tables
             total = sum(
-                self._category_indices[cat] * weight
-                for cat, weight in CATEGORY_WEIGHTS.items()
+                self._category_indices.get(cat, 0) * weight
+                for cat, weight in zip(tables.category_names, tables.category_weights)
             )
             self._current_index = round(min(100, max(0, total * 1.8)), 1)
             
             # 레벨 계산
-            level = calculator.get_threat_level(self._current_index)
+            level = calculator.classify_level(self._current_index)
             
             # 24시간 변화율 (시뮬레이션)
-            change_24h = round(random.uniform(-5, 5), 1)
+            change_24h = round(self.rng.uniform(-5, 5), 1)
             
-            # WebSocket 브로드캐스트
-            await manager.send_threat_index({
+            self._last_threat_index = {
                 "total_index": self._current_index,
                 "level": level,
                 "level_name": calculator.get_level_name(level),
                 "categories": self._category_indices.copy(),
                 "change_24h": change_24h,
                 "timestamp": datetime.utcnow().isoformat()
-            })
+            }
+            
+            self._history.append((self._last_threat_index["timestamp"], self._current_index, self._category_indices.copy()))
+            
+            # 팔로워 워커 상태 미러링 + WebSocket 브로드캐스트
+            await self._publish(
+                "index",
+                total_index=self._current_index,
+                categories=self._category_indices.copy(),
+                timestamp=self._last_threat_index["timestamp"]
+            )
+            await manager.send_threat_index(self._last_threat_index)
             
         except Exception as e:
             print(f"[Scheduler] Error updating threat index: {e}")
@@ -149,12 +299,12 @@ class SimulationScheduler:
         """새 위협 생성 및 알림 (AI 추론 로그 포함)"""
         try:
             # 20% 확률로 새 위협 생성
-            if random.random() > 0.2:
+            if self.rng.random() > 0.2:
                 return
             
             # 위협 생성
             threat = simulator.generate_threat()
-            self._active_threats.append(threat)
+            self._add_threat(threat)
             
             # 데이터 수집 로그 생성
             collection_log = simulator.generate_data_collection_log(threat)
@@ -164,16 +314,20 @@ class SimulationScheduler:
             ai_log = simulator.generate_ai_reasoning_log(threat, collection_log)
             self._ai_reasoning_logs.append(ai_log)
             
-            # 최대 50개 유지
-            if len(self._active_threats) > 50:
-                self._active_threats = self._active_threats[-50:]
+            # 최대 100개 로그 유지
             if len(self._collection_logs) > 100:
                 self._collection_logs = self._collection_logs[-100:]
             if len(self._ai_reasoning_logs) > 100:
                 self._ai_reasoning_logs = self._ai_reasoning_logs[-100:]
             
+            # 새 위협 이벤트 (팔로워 미러링 프레임과 WebSocket 전송이 같은 인코딩 공유)
+            event = DomainEvent("new_threat", threat)
+            
+            # 팔로워 워커 상태 미러링
+            await self._publish("threat_added", threat=event.data, collection_log=collection_log, ai_log=ai_log)
+            
             # WebSocket으로 새 위협 전송
-            await manager.send_new_threat(threat)
+            await pipeline.emit(event)
             
             # 심각도가 높으면 알림도 생성
             if threat.get("severity", 0) >= 50:
@@ -200,6 +354,50 @@ class SimulationScheduler:
     
     # ============ Demo Scenario Methods ============
     
+    # =========================================================================
+    # 부하 생성 모드
+    # =========================================================================
+    
+    @leader_command
+    async def start_load(self, rate: int, duration: Optional[float] = None, alerts: bool = False):
+        """부하 생성 시작 (alerts=True면 심각도 50 이상 위협의 알림도 생성)"""
+        load_generator.start(functools.partial(self.inject_threats, alerts=alerts), rate, duration)
+    
+    @leader_command
+    async def stop_load(self):
+        """부하 생성 중지"""
+        load_generator.stop()
+    
+    async def inject_threats(self, threats: List[Dict], alerts: bool = False):
+        """
+        생성된 위협 배치 주입
+        
+        모든 위협을 new_threat 이벤트로 발행하고, 활성 위협 저장소에는 유지 개수(50개)만큼
+        마지막 위협만 추가합니다 (앞쪽 위협은 추가되자마자 축출되므로).
+        """
+        if not threats:
+            return
+        
+        events = [DomainEvent("new_threat", threat) for threat in threats]
+        for threat in threats[-50:]:
+            self._track_threat(threat)
+        self._schedule_decay_transition()
+        await self._publish("threats_added", threats=[event.data for event in events[-50:]])
+        
+        for event in events:
+            await pipeline.emit(event)
+        
+        if alerts:
+            for threat in threats:
+                if threat["severity"] >= 50:
+                    await alert_service.create_alert_for_threat(
+                        threat_id=threat["id"],
+                        title=threat["title"],
+                        severity=threat["severity"],
+                        category=threat["category"]
+                    )
+    
+    @leader_command
     async def trigger_cyber_attack(self):
         """시나리오 A: 사이버 공격 탐지"""
         print("[Demo] Triggering cyber attack scenario...")
@@ -210,7 +408,7 @@ class SimulationScheduler:
         
         # 위협 생성
         threat = {
-            "id": str(random.randint(100000, 999999)),
+            "id": str(self.rng.randint(100000, 999999)),
             "title": "공항 중앙 시스템 대상 대규모 DDoS 공격 탐지",
             "description": "인천국제공항 중앙 관제 시스템을 대상으로 한 대규모 분산 서비스 거부(DDoS) 공격이 탐지되었습니다. 현재 방어 시스템이 가동 중이며, 공격 원점 추적이 진행되고 있습니다.",
             "category": "cyber",
@@ -226,7 +424,7 @@ class SimulationScheduler:
             "created_at": datetime.utcnow().isoformat(),
         }
         
-        await manager.send_new_threat(threat)
+        threat_event = await manager.send_new_threat(threat)
         await self._update_threat_index()
         
         alert = await alert_service.create_alert_for_threat(
@@ -238,9 +436,10 @@ class SimulationScheduler:
         
         await manager.send_demo_event("cyber_attack", {
             "message": "사이버 공격 시나리오가 실행되었습니다",
-            "threat": threat
+            "threat": threat_event.data
         })
     
+    @leader_command
     async def trigger_missile_alert(self):
         """시나리오 B: 북한 미사일 발사"""
         print("[Demo] Triggering missile alert scenario...")
@@ -250,7 +449,7 @@ class SimulationScheduler:
         self._current_index = 92.0
         
         threat = {
-            "id": str(random.randint(100000, 999999)),
+            "id": str(self.rng.randint(100000, 999999)),
             "title": "북한 탄도미사일 발사 - 전국 항공 경보 발령",
             "description": "북한이 동해상으로 탄도미사일을 발사했습니다. 국토부는 전국 공항에 항공 경보를 발령하였으며, 일부 항공편 운항이 일시 중단될 수 있습니다. 상황을 지속 모니터링 중입니다.",
             "category": "geopolitical",
@@ -266,7 +465,7 @@ class SimulationScheduler:
             "created_at": datetime.utcnow().isoformat(),
         }
         
-        await manager.send_new_threat(threat)
+        threat_event = await manager.send_new_threat(threat)
         await self._update_threat_index()
         
         alert = await alert_service.create_alert_for_threat(
@@ -278,10 +477,11 @@ class SimulationScheduler:
         
         await manager.send_demo_event("missile_alert", {
             "message": "북한 미사일 발사 시나리오가 실행되었습니다",
-            "threat": threat,
+            "threat": threat_event.data,
             "critical_overlay": True
         })
     
+    @leader_command
     async def trigger_drone_intrusion(self):
         """시나리오 C: 드론 침입"""
         print("[Demo] Triggering drone intrusion scenario...")
@@ -290,7 +490,7 @@ class SimulationScheduler:
         self._current_index = 65.0
         
         threat = {
-            "id": str(random.randint(100000, 999999)),
+            "id": str(self.rng.randint(100000, 999999)),
             "title": "인천공항 활주로 인근 불법 드론 침입 탐지",
             "description": "인천국제공항 33L 활주로 인근에서 미확인 드론이 탐지되었습니다. 드론 탐지 시스템이 가동 중이며, 대응팀이 출동했습니다. 해당 활주로 이착륙이 일시 중단되었습니다.",
             "category": "drone",
@@ -306,7 +506,7 @@ class SimulationScheduler:
             "created_at": datetime.utcnow().isoformat(),
         }
         
-        await manager.send_new_threat(threat)
+        threat_event = await manager.send_new_threat(threat)
         await self._update_threat_index()
         
         alert = await alert_service.create_alert_for_threat(
@@ -319,7 +519,7 @@ class SimulationScheduler:
         # 드론 이동 시뮬레이션을 위한 추가 데이터
         await manager.send_demo_event("drone_intrusion", {
             "message": "드론 침입 시나리오가 실행되었습니다",
-            "threat": threat,
+            "threat": threat_event.data,
             "drone_path": [
                 {"lat": 37.4512, "lng": 126.4235, "time": 0},
                 {"lat": 37.4520, "lng": 126.4250, "time": 5},
@@ -328,6 +528,7 @@ class SimulationScheduler:
             ]
         })
     
+    @leader_command
     async def trigger_stabilization(self):
         """시나리오 D: 점진적 안정화"""
         print("[Demo] Triggering stabilization scenario...")
@@ -335,7 +536,7 @@ class SimulationScheduler:
         # 모든 지수 점진적 하락
         for category in self._category_indices.keys():
             current = self._category_indices[category]
-            self._category_indices[category] = max(20, current - random.uniform(15, 25))
+            self._category_indices[category] = max(20, current - self.rng.uniform(15, 25))
         
         self._current_index = 35.0
         
@@ -353,16 +554,127 @@ class SimulationScheduler:
     
     def get_current_state(self) -> dict:
         """현재 시뮬레이션 상태 반환"""
-        level = calculator.get_threat_level(self._current_index)
+        level = calculator.classify_level(self._current_index)
         return {
             "total_index": self._current_index,
             "level": level,
             "level_name": calculator.get_level_name(level),
             "categories": self._category_indices.copy(),
             "active_threats_count": len(self._active_threats),
-            "is_running": self._is_running
+            "is_running": self._is_running if event_bus.is_leader else self._leader_running
+        }
+    
+    def get_category_scores(self) -> dict:
+        """활성 위협 점수 기반 카테고리 지수 (증분 엔진에서 O(1) 조회)"""
+        if not self._is_running:
+            # 감쇠 전환 작업이 예약되지 않는 팔로워 워커는 조회 시점에 반영
+            self._index_engine.refresh_decay()
+        
+        categories = {}
+        for category, index in self._index_engine.get_indices().items():
+            categories[category] = {
+                "index": round(index, 2) if index is not None else None,
+                "threat_count": self._index_engine.category_count(category),
+            }
+        
+        total_index, _ = calculator.calculate_total_index(
+            {cat: data["index"] or 0 for cat, data in categories.items()},
+            include_details=False
+        )
+        
+        return {
+            "total_index": round(total_index, 2),
+            "categories": categories,
+            "active_threats_count": len(self._active_threats),
+        }
+    
+    def get_category_distribution(self) -> list:
+        """활성 위협의 카테고리별 분포 (건수 내림차순)"""
+        threats = self.get_threats(limit=100)
+        total = len(threats)
+        
+        category_counts = {}
+        for threat in threats:
+            cat = threat.get("category", "unknown")
+            category_counts[cat] = category_counts.get(cat, 0) + 1
+        
+        distribution = [
+            {
+                "category": cat,
+                "count": count,
+                "percentage": round(count / total * 100, 1) if total > 0 else 0,
+            }
+            for cat, count in category_counts.items()
+        ]
+        distribution.sort(key=lambda x: x["count"], reverse=True)
+        return distribution
+    
+    def get_kpi(self) -> dict:
+        """활성 위협 기반 KPI (시뮬레이션 값 제외)"""
+        threats = self.get_threats(limit=100)
+        total_threats = len(threats)
+        resolved = sum(1 for t in threats if t.get("status") == "resolved")
+        confirmed = sum(1 for t in threats if t.get("status") == "confirmed")
+        
+        severities = [t.get("severity", 0) for t in threats]
+        avg_severity = sum(severities) / len(severities) if severities else 0
+        
+        return {
+            "avg_threat_index": self._current_index,
+            "total_threats_detected": total_threats,
+            "resolved_rate": round(resolved / total_threats * 100, 1) if total_threats > 0 else 0,
+            "confirmed_threats": confirmed,
+            "avg_severity": round(avg_severity, 1),
         }
     
+    def get_trend(self, points: int) -> list:
+        """
+        기록된 위협 지수 히스토리를 최대 points개 구간 평균으로 다운샘플링
+        
+        각 포인트의 timestamp는 구간의 마지막 샘플 시각입니다 (오래된 순).
+        """
+        history = list(self._history)
+        if not history or points <= 0:
+            return []
+        
+        size = math.ceil(len(history) / points)
+        trend = []
+        for start in range(0, len(history), size):
+            bucket = history[start:start + size]
+            categories: Dict[str, float] = {}
+            for _, _, values in bucket:
+                for cat, value in values.items():
+                    categories[cat] = categories.get(cat, 0) + value
+            trend.append({
+                "timestamp": bucket[-1][0],
+                "total": round(sum(total for _, total, _ in bucket) / len(bucket), 1),
+                **{cat: round(value / len(bucket), 1) for cat, value in categories.items()}
+            })
+        return trend
+    
+    async def update_threat_status(self, threat_id: str, status: str) -> Optional[dict]:
+        """위협 상태 변경 및 브로드캐스트 (팔로워 워커는 미러 반영 후 리더에게 전달)"""
+        threat = self._set_threat_status(threat_id, status)
+        if threat is None:
+            return None
+        
+        if not event_bus.is_leader:
+            await event_bus.send_command("update_threat_status", {"threat_id": threat_id, "status": status})
+            return threat
+        
+        await self._publish("threat_status", threat_id=threat_id, status=status)
+        await manager.send_threat_update(threat_id, status, threat.get("category"))
+        return threat
+    
+    def _set_threat_status(self, threat_id: str, status: str) -> Optional[dict]:
+        """활성 위협 상태/지수 엔진 갱신"""
+        for threat in self._active_threats:
+            if threat.get("id") == threat_id:
+                threat["status"] = status
+                self._index_engine.update_status(threat_id, status)
+                return threat
+        return None
+    
     def get_threats(self, limit: int = 50) -> list:
         """현재 활성 위협 목록 반환"""
         return self._active_threats[-limit:]
@@ -391,8 +703,91 @@ class SimulationScheduler:
             if log.get("id") == log_id:
                 return log
         return None
+    
+    # ============ Multi-worker (Event Bus) ============
+    
+    async def _publish(self, kind: str, **data):
+        """scheduler 토픽으로 상태 변경 발행"""
+        self.state_version += 1
+        await event_bus.publish("scheduler", {"kind": kind, **data})
+    
+    def _snapshot(self) -> dict:
+        """팔로워 워커가 미러링할 전체 상태"""
+        return {
+            "threats": self._active_threats,
+            "collection_logs": self._collection_logs,
+            "ai_logs": self._ai_reasoning_logs,
+            "total_index": self._current_index,
+            "categories": self._category_indices.copy(),
+            "history": list(self._history),
+            "is_running": self._is_running,
+        }
+    
+    def snapshot_events(self) -> List[Tuple[str, Dict]]:
+        """새로 연결된 팔로워 워커에 보낼 이벤트 (상태 스냅샷 + 마지막 위협 지수)"""
+        events = [("scheduler", {"kind": "snapshot", **self._snapshot()})]
+        if self._last_threat_index is not None:
+            events.append(("ws", {"type": "threat_index", "data": self._last_threat_index}))
+        return events
+    
+    def resume_snapshot(self) -> dict:
+        """재연결 클라이언트가 놓친 이벤트를 재전송할 수 없을 때 보낼 현재 상태와 최근 위협"""
+        return {
+            "state": self.get_current_state(),
+            "threats": self.get_threats(limit=WS_RESUME_SNAPSHOT_LIMIT),
+        }
+    
+    async def handle_command(self, name: str, args: Dict):
+        """팔로워 워커가 요청한 명령 실행 (리더 워커)"""
+        if name not in LEADER_COMMANDS:
+            print(f"[Scheduler] Ignoring unknown command: {name}")
+            return
+        await getattr(self, name)(**args)
+    
+    async def apply_event(self, event: Dict):
+        """리더가 발행한 상태 변경을 팔로워 워커 상태에 반영"""
+        kind = event.get("kind")
+        
+        if kind == "scoring_config":
+            # 설정 파일은 워커마다 읽으므로 모든 워커에서 재확인
+            if scoring_config.reload_if_changed():
+                self.sync_scoring_config()
+            return
+        
+        if event_bus.is_leader:
+            return
+        
+        self.state_version += 1
+        if kind == "snapshot":
+            self._active_threats = list(event["threats"])
+            self._index_engine.rebuild(self._active_threats)
+            self._collection_logs = list(event["collection_logs"])
+            self._ai_reasoning_logs = list(event["ai_logs"])
+            self._current_index = event["total_index"]
+            self._category_indices = dict(event["categories"])
+            self._history.clear()
+            self._history.extend(tuple(sample) for sample in event["history"])
+            self._leader_running = event["is_running"]
+            self._mirrored = True
+        elif kind == "threat_added":
+            self._track_threat(event["threat"])
+            self._collection_logs = (self._collection_logs + [event["collection_log"]])[-100:]
+            self._ai_reasoning_logs = (self._ai_reasoning_logs + [event["ai_log"]])[-100:]
+        elif kind == "threats_added":
+            for threat in event["threats"]:
+                self._track_threat(threat)
+        elif kind == "index":
+            self._current_index = event["total_index"]
+            self._category_indices = dict(event["categories"])
+            self._history.append((event["timestamp"], self._current_index, self._category_indices.copy()))
+        elif kind == "threat_status":
+            self._set_threat_status(event["threat_id"], event["status"])
 
 
 # 싱글톤 인스턴스
 scheduler = SimulationScheduler()
+event_bus.subscribe("scheduler", scheduler.apply_event)
+event_bus.set_command_handler(scheduler.handle_command)
+event_bus.set_snapshot_provider(scheduler.snapshot_events)
+manager.set_snapshot_provider(scheduler.resume_snapshot)
 
@@ -6,15 +6,123 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 import random
 
-from config import CATEGORY_WEIGHTS, DATA_SOURCES, THREAT_LEVELS
+from services.randomness import make_rng
+from services.scoring_tables import scoring_config
 
 # =============================================================================
 # Constants
 # =============================================================================
 
-SOURCE_CREDIBILITY = {k: v["credibility"] for k, v in DATA_SOURCES.items()}
+# 시간 감쇠 구간: (구간 상한 시간, 감쇠 계수, 사유) - 마지막 구간은 상한 없음
+TEMPORAL_DECAY_BUCKETS = (
+    (1, 1.0, "1시간 이내 - 최대 가중치"),
+    (6, 0.9, "1-6시간 - 높은 가중치"),
+    (24, 0.7, "6-24시간 - 중간 가중치"),
+    (72, 0.5, "1-3일 - 감소된 가중치"),
+    (168, 0.3, "3-7일 - 낮은 가중치"),
+    (None, 0.1, "7일 이상 - 최소 가중치"),
+)
+
+SCORE_FORMULA = "min(100, max(0, severity × category_weight × source_credibility × temporal_factor × 2))"
+
+
+def get_decay_bucket(hours_ago: float) -> int:
+    """경과 시간이 속한 감쇠 구간 인덱스 반환"""
+    for bucket, (upper, _, _) in enumerate(TEMPORAL_DECAY_BUCKETS):
+        if upper is None or hours_ago < upper:
+            return bucket
+    return len(TEMPORAL_DECAY_BUCKETS) - 1
+
+
+# =============================================================================
+# Score Result
+# =============================================================================
+
+class ThreatScore:
+    """
+    개별 위협 점수 결과
+
+    대량 계산 시에는 숫자만 보관하고, 사람이 읽는 계산 설명은
+    explain() 호출 시점(근거 조회 API 등)에만 생성합니다.
+    """
+    __slots__ = (
+        "threat",
+        "category_weight",
+        "source_credibility",
+        "hours_ago",
+        "decay_bucket",
+        "temporal_factor",
+        "base_score",
+        "score",
+    )
+
+    def __init__(
+        self,
+        threat,
+        category_weight: float,
+        source_credibility: float,
+        hours_ago: float,
+        decay_bucket: int,
+    ):
+        self.threat = threat
+        self.category_weight = category_weight
+        self.source_credibility = source_credibility
+        self.hours_ago = hours_ago
+        self.decay_bucket = decay_bucket
+        self.temporal_factor = TEMPORAL_DECAY_BUCKETS[decay_bucket][1]
+        self.base_score = threat.severity * category_weight * source_credibility * self.temporal_factor
+        self.score = min(100, max(0, self.base_score * 2))  # Scale to 0-100
+
+    def __float__(self) -> float:
+        return float(self.score)
+
+    def explain(self) -> dict:
+        """계산 과정 상세 설명 생성"""
+        threat = self.threat
+        severity = threat.severity
+        category_weight = self.category_weight
+        source_credibility = self.source_credibility
+        temporal_factor = self.temporal_factor
+        base_score = self.base_score
+        final_score = self.score
+
+        tables = scoring_config.tables
+        category_config = tables.category_config.get(threat.category, {"weight": 0.1, "name": "Unknown"})
+        source_info = tables.source_config.get(threat.source_type, {})
+
+        return {
+            "input": {
+                "severity": severity,
+                "category": threat.category,
+                "source_type": threat.source_type,
+                "created_at": threat.created_at.isoformat() if threat.created_at else None
+            },
+            "weights": {
+                "category_weight": category_weight,
+                "category_name": category_config["name"],
+                "source_credibility": source_credibility,
+                "source_name": source_info.get("name", "Unknown"),
+                "source_description": source_info.get("description", ""),
+                "temporal_factor": temporal_factor
+            },
+            "temporal_details": {
+                "hours_ago": round(self.hours_ago, 2),
+                "factor": temporal_factor,
+                "reason": TEMPORAL_DECAY_BUCKETS[self.decay_bucket][2],
+                "formula": "decay_curve(hours_ago)"
+            },
+            "calculation_steps": [
+                f"1. 기본 점수: severity({severity})",
+                f"2. 카테고리 가중치 적용: {severity} × {category_weight} = {severity * category_weight:.2f}",
+                f"3. 출처 신뢰도 적용: {severity * category_weight:.2f} × {source_credibility} = {severity * category_weight * source_credibility:.2f}",
+                f"4. 시간 감쇠 적용: {severity * category_weight * source_credibility:.2f} × {temporal_factor} = {base_score:.2f}",
+                f"5. 스케일 조정 (×2): {base_score:.2f} × 2 = {base_score * 2:.2f}",
+                f"6. 범위 제한 (0-100): {final_score:.2f}"
+            ],
+            "formula": SCORE_FORMULA,
+            "final_score": round(final_score, 2)
+        }
 
-LEVEL_NAMES = {level: config["name"] for level, config in THREAT_LEVELS.items()}
 
 # =============================================================================
 # Threat Calculator Class
@@ -23,6 +131,9 @@ LEVEL_NAMES = {level: config["name"] for level, config in THREAT_LEVELS.items()}
 class ThreatCalculator:
     """위협 점수 계산기 - 상세 계산 로그 포함"""
     
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng or make_rng("calculator")
+    
     def calculate_temporal_factor(self, created_at: datetime) -> Tuple[float, dict]:
         """
         시간 경과에 따른 위협 감쇠 계수 계산
@@ -34,24 +145,7 @@ class ThreatCalculator:
         hours_ago = (now - created_at).total_seconds() / 3600
         
         # Decay curve
-        if hours_ago < 1:
-            factor = 1.0
-            reason = "1시간 이내 - 최대 가중치"
-        elif hours_ago < 6:
-            factor = 0.9
-            reason = "1-6시간 - 높은 가중치"
-        elif hours_ago < 24:
-            factor = 0.7
-            reason = "6-24시간 - 중간 가중치"
-        elif hours_ago < 72:
-            factor = 0.5
-            reason = "1-3일 - 감소된 가중치"
-        elif hours_ago < 168:
-            factor = 0.3
-            reason = "3-7일 - 낮은 가중치"
-        else:
-            factor = 0.1
-            reason = "7일 이상 - 최소 가중치"
+        _, factor, reason = TEMPORAL_DECAY_BUCKETS[get_decay_bucket(hours_ago)]
         
         details = {
             "hours_ago": round(hours_ago, 2),
@@ -62,6 +156,23 @@ class ThreatCalculator:
         
         return factor, details
     
+    def score_threat(self, threat, now: Optional[datetime] = None) -> ThreatScore:
+        """
+        개별 위협의 점수 계산 (설명 문자열 없이 숫자만)
+        
+        공식: score = severity × category_weight × source_credibility × temporal_factor × 2
+        """
+        tables = scoring_config.tables
+        hours_ago = ((now or datetime.utcnow()) - threat.created_at).total_seconds() / 3600
+        
+        return ThreatScore(
+            threat,
+            tables.category_weight(threat.category),
+            tables.source_weight(threat.source_type),
+            hours_ago,
+            get_decay_bucket(hours_ago),
+        )
+    
     def calculate_threat_score(self, threat, include_details: bool = True) -> Tuple[float, dict]:
         """
         개별 위협의 점수 계산
@@ -71,49 +182,8 @@ class ThreatCalculator:
         Returns:
             (score, calculation_details)
         """
-        # Get weights and factors
-        category_config = CATEGORY_WEIGHTS.get(threat.category, {"weight": 0.1, "name": "Unknown"})
-        category_weight = category_config["weight"]
-        
-        source_credibility = SOURCE_CREDIBILITY.get(threat.source_type, 0.5)
-        source_info = DATA_SOURCES.get(threat.source_type, {})
-        
-        temporal_factor, temporal_details = self.calculate_temporal_factor(threat.created_at)
-        
-        # Calculate score
-        base_score = threat.severity * category_weight * source_credibility * temporal_factor
-        final_score = min(100, max(0, base_score * 2))  # Scale to 0-100
-        
-        # Build calculation details
-        details = {
-            "input": {
-                "severity": threat.severity,
-                "category": threat.category,
-                "source_type": threat.source_type,
-                "created_at": threat.created_at.isoformat() if threat.created_at else None
-            },
-            "weights": {
-                "category_weight": category_weight,
-                "category_name": category_config["name"],
-                "source_credibility": source_credibility,
-                "source_name": source_info.get("name", "Unknown"),
-                "source_description": source_info.get("description", ""),
-                "temporal_factor": temporal_factor
-            },
-            "temporal_details": temporal_details,
-            "calculation_steps": [
-                f"1. 기본 점수: severity({threat.severity})",
-                f"2. 카테고리 가중치 적용: {threat.severity} × {category_weight} = {threat.severity * category_weight:.2f}",
-                f"3. 출처 신뢰도 적용: {threat.severity * category_weight:.2f} × {source_credibility} = {threat.severity * category_weight * source_credibility:.2f}",
-                f"4. 시간 감쇠 적용: {threat.severity * category_weight * source_credibility:.2f} × {temporal_factor} = {base_score:.2f}",
-                f"5. 스케일 조정 (×2): {base_score:.2f} × 2 = {base_score * 2:.2f}",
-                f"6. 범위 제한 (0-100): {final_score:.2f}"
-            ],
-            "formula": "min(100, max(0, severity × category_weight × source_credibility × temporal_factor × 2))",
-            "final_score": round(final_score, 2)
-        }
-        
-        return final_score, details if include_details else {}
+        result = self.score_threat(threat)
+        return result.score, result.explain() if include_details else {}
     
     def calculate_category_index(
         self, 
@@ -128,11 +198,13 @@ class ThreatCalculator:
             (index, calculation_details)
         """
         category_threats = [t for t in threats if t.category == category]
-        category_config = CATEGORY_WEIGHTS.get(category, {"weight": 0.1, "name": "Unknown"})
+        category_config = scoring_config.tables.category_config.get(category, {"weight": 0.1, "name": "Unknown"})
         
         if not category_threats:
             # Base noise for empty categories
-            base_index = random.uniform(15, 35)
+            base_index = self.rng.uniform(15, 35)
+            if not include_details:
+                return base_index, {}
             details = {
                 "category": category,
                 "category_name": category_config["name"],
@@ -143,26 +215,30 @@ class ThreatCalculator:
             }
             return base_index, details
         
-        # Calculate individual scores
-        scores_with_details = [self.calculate_threat_score(t) for t in category_threats]
-        scores = [s[0] for s in scores_with_details]
+        # Calculate individual scores (숫자만 계산, 설명은 생성하지 않음)
+        now = datetime.utcnow()
+        scores = [self.score_threat(t, now).score for t in category_threats]
         
-        base_score = sum(scores) / len(scores)
+        sum_of_scores = sum(scores)
+        base_score = sum_of_scores / len(scores)
         
         # Add variation
-        noise = random.uniform(-3, 3)
+        noise = self.rng.uniform(-3, 3)
         final_index = min(100, max(0, base_score + noise))
         
+        if not include_details:
+            return final_index, {}
+        
         details = {
             "category": category,
             "category_name": category_config["name"],
             "threat_count": len(category_threats),
             "threat_ids": [t.id for t in category_threats],
-            "individual_scores": [{"threat_id": t.id, "score": s[0], "title": t.title[:50]} 
-                                 for t, s in zip(category_threats, scores_with_details)],
+            "individual_scores": [{"threat_id": t.id, "score": score, "title": t.title[:50]} 
+                                 for t, score in zip(category_threats, scores)],
             "method": "average_with_noise",
             "calculation": {
-                "sum_of_scores": round(sum(scores), 2),
+                "sum_of_scores": round(sum_of_scores, 2),
                 "average": round(base_score, 2),
                 "noise_applied": round(noise, 2),
                 "final_before_clamp": round(base_score + noise, 2)
@@ -186,27 +262,31 @@ class ThreatCalculator:
         Returns:
             (total_index, calculation_details)
         """
+        tables = scoring_config.tables
         weighted_sum = 0
         weight_breakdown = []
         
-        for cat, config in CATEGORY_WEIGHTS.items():
+        for cat, weight in zip(tables.category_names, tables.category_weights):
             cat_index = category_indices.get(cat, 0)
-            weight = config["weight"]
             contribution = cat_index * weight
             weighted_sum += contribution
             
-            weight_breakdown.append({
-                "category": cat,
-                "category_name": config["name"],
-                "index": round(cat_index, 2),
-                "weight": weight,
-                "contribution": round(contribution, 2)
-            })
+            if include_details:
+                weight_breakdown.append({
+                    "category": cat,
+                    "category_name": tables.category_config[cat]["name"],
+                    "index": round(cat_index, 2),
+                    "weight": weight,
+                    "contribution": round(contribution, 2)
+                })
         
         # Scale up
         scaled_total = weighted_sum * 1.5
         final_index = min(100, max(0, scaled_total))
         
+        if not include_details:
+            return final_index, {}
+        
         details = {
             "category_indices": category_indices,
             "weight_breakdown": weight_breakdown,
@@ -222,6 +302,10 @@ class ThreatCalculator:
         
         return final_index, details
     
+    def classify_level(self, index: float) -> int:
+        """위협 지수에서 레벨 번호만 결정 (이진 탐색)"""
+        return scoring_config.tables.classify_level(index)
+    
     def get_threat_level(self, index: float) -> Tuple[int, dict]:
         """
         위협 지수에서 레벨 결정
@@ -229,28 +313,26 @@ class ThreatCalculator:
         Returns:
             (level, level_details)
         """
-        for level, config in THREAT_LEVELS.items():
-            if config["min"] <= index <= config["max"]:
-                details = {
-                    "index": round(index, 2),
-                    "level": level,
-                    "level_name": config["name"],
-                    "level_range": f"{config['min']}-{config['max']}",
-                    "level_color": config["color"],
-                    "level_description": config["description"]
-                }
-                return level, details
-        
-        # Default to level 1
-        return 1, {"index": round(index, 2), "level": 1, "level_name": "LOW"}
+        tables = scoring_config.tables
+        level = tables.classify_level(index)
+        config = tables.level_config[level]
+        details = {
+            "index": round(index, 2),
+            "level": level,
+            "level_name": config["name"],
+            "level_range": f"{config['min']}-{config['max']}",
+            "level_color": config["color"],
+            "level_description": config["description"]
+        }
+        return level, details
     
     def get_level_name(self, level: int) -> str:
         """레벨 이름 반환"""
-        return LEVEL_NAMES.get(level, "UNKNOWN")
+        return scoring_config.tables.level_names.get(level, "UNKNOWN")
     
     def get_source_info(self, source_type: str) -> dict:
         """데이터 출처 정보 반환"""
-        return DATA_SOURCES.get(source_type, {
+        return scoring_config.tables.source_config.get(source_type, {
             "name": "Unknown",
             "credibility": 0.5,
             "description": "알 수 없는 출처",
@@ -260,7 +342,7 @@ class ThreatCalculator:
     
     def get_category_info(self, category: str) -> dict:
         """카테고리 정보 반환"""
-        config = CATEGORY_WEIGHTS.get(category, {"weight": 0.1, "name": "Unknown", "description": ""})
+        config = scoring_config.tables.category_config.get(category, {"weight": 0.1, "name": "Unknown", "description": ""})
         return {
             "category": category,
             "name": config["name"],
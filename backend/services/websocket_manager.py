@@ -3,117 +3,781 @@ ARGUS SKY - WebSocket Manager
 실시간 통신을 위한 WebSocket 연결 관리
 """
 from fastapi import WebSocket
-from typing import List, Dict, Any
-import json
+from typing import Any, Callable, Deque, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from collections import deque
 from datetime import datetime
 import asyncio
+import time
+
+from config import (
+    WS_SEND_QUEUE_SIZE,
+    WS_SLOW_CONSUMER_POLICY,
+    WS_THREAT_INDEX_DELTA,
+    WS_KEYFRAME_INTERVAL,
+    WS_BATCH_WINDOW_MS,
+    WS_BATCH_BYPASS_LEVEL,
+    WS_REPLAY_BUFFER_SIZE,
+    WS_RESUME_SNAPSHOT_LIMIT,
+    WS_HEARTBEAT_INTERVAL,
+    WS_IDLE_TIMEOUT,
+)
+from services.event_bus import event_bus
+from services.event_pipeline import ALL as ALL_EVENTS, DomainEvent, pipeline
+from services.scoring_tables import scoring_config
+from services.serialization import JSON, MSGPACK, available_formats, encode, encode_batch, frame_for, loads
+
+SLOW_CONSUMER_POLICIES = ("drop_oldest", "coalesce", "disconnect")
+
+# 구독 가능한 메시지 타입
+MESSAGE_TYPES = ("threat_index", "new_threat", "new_alert", "threat_update", "demo_event")
+
+# 라우팅 테이블의 "전체 구독" 키
+ALL = "*"
+
+# 구독 라우팅 시 다른 타입으로 취급하는 메시지 (변경분은 threat_index 구독자에게 전송)
+ROUTING_TYPES = {"threat_index_delta": "threat_index"}
+
+# threat_index 변경 비교에서 제외하는 필드 (매번 바뀌는 메타데이터)
+DELTA_IGNORED_FIELDS = ("timestamp", "seq")
+
+# 재연결 시 재전송(replay)하지 않는 메시지 - 상태 메시지는 연결 시 전체 상태로 복구
+REPLAY_EXCLUDED_TYPES = ("threat_index",)
+
+# 느린 클라이언트 강제 종료 코드 (1008 = Policy Violation)
+SLOW_CONSUMER_CLOSE_CODE = 1008
+
+# 응답 없는 클라이언트 종료 코드 (1001 = Going Away)와 close 대기 시간 (초)
+IDLE_CLOSE_CODE = 1001
+IDLE_CLOSE_TIMEOUT = 1.0
+
+# RTT 이동 평균 가중치
+RTT_EWMA_ALPHA = 0.2
+
+
+class Subscription:
+    """
+    클라이언트 구독 조건
+    
+    - types / categories: None이면 전체
+    - min_level: 이 레벨 미만의 알림(new_alert)은 전송하지 않음
+    """
+    __slots__ = ("types", "categories", "min_level")
+    
+    def __init__(self):
+        self.types: Optional[Set[str]] = None
+        self.categories: Optional[Set[str]] = None
+        self.min_level = 1
+    
+    def matches(self, message_type: str, category: Optional[str], level: Optional[int]) -> bool:
+        """메시지가 구독 조건에 맞는지 (라우팅 테이블과 같은 규칙)"""
+        if self.types is not None and message_type not in self.types:
+            return False
+        if category is not None and self.categories is not None and category not in self.categories:
+            return False
+        return level is None or self.min_level <= level
+    
+    @property
+    def category_key(self) -> Optional[FrozenSet[str]]:
+        """같은 카테고리 조건을 가진 클라이언트 묶음 키"""
+        return frozenset(self.categories) if self.categories is not None else None
+    
+    def to_dict(self) -> Dict:
+        return {
+            "types": sorted(self.types) if self.types is not None else [ALL],
+            "categories": sorted(self.categories) if self.categories is not None else [ALL],
+            "min_level": self.min_level,
+        }
+
+
+def _diff_threat_index(previous: Dict, current: Dict) -> Dict:
+    """표시 정밀도(이미 반올림된 값) 기준으로 바뀐 필드만 추출"""
+    changes = {}
+    for key, value in current.items():
+        if key in DELTA_IGNORED_FIELDS:
+            continue
+        if key == "categories" and isinstance(value, dict):
+            previous_categories = previous.get("categories") or {}
+            changed = {cat: v for cat, v in value.items() if previous_categories.get(cat) != v}
+            if changed:
+                changes["categories"] = changed
+        elif previous.get(key) != value:
+            changes[key] = value
+    return changes
+
+
+def _project_categories(message: Dict, category_key: FrozenSet[str]) -> Dict:
+    """구독한 카테고리의 지수만 남긴 메시지 사본"""
+    data = message["data"]
+    if message["type"] == "threat_index_delta":
+        changes = data["changes"]
+        if "categories" not in changes:
+            return message
+        changes = dict(changes)
+        categories = {k: v for k, v in changes.pop("categories").items() if k in category_key}
+        if categories:
+            changes["categories"] = categories
+        return {**message, "data": {**data, "changes": changes}}
+    categories = {k: v for k, v in data["categories"].items() if k in category_key}
+    return {**message, "data": {**data, "categories": categories}}
+
+
+def _route_of(message: Dict) -> Tuple[str, Optional[str], Optional[int]]:
+    """라우팅 기준 (메시지 타입, 카테고리, 알림 레벨)"""
+    message_type = message.get("type", "")
+    data = message.get("data") or {}
+    category = data.get("category") or (data.get("threat") or {}).get("category")
+    level = data.get("level") if message_type == "new_alert" else None
+    return ROUTING_TYPES.get(message_type, message_type), category, level
+
+
+def _updated_selection(current: Optional[Set[str]], values: Iterable[str], universe: Iterable[str], add: bool) -> Optional[Set[str]]:
+    """구독/해제 요청을 현재 선택에 반영 (None = 전체)"""
+    values = set(values)
+    if ALL in values:
+        return None if add else set()
+    if add:
+        # 기본(전체) 상태에서 처음 구독하면 해당 항목만 받도록 좁힘
+        return values if current is None else current | values
+    base = set(universe) if current is None else current
+    return base - values
+
+
+class ClientConnection:
+    """
+    클라이언트 1개의 송신 큐 + 전용 writer 태스크
+    
+    broadcast는 큐에 넣기만 하고, 실제 네트워크 전송은 클라이언트별 writer가
+    수행하므로 느린 클라이언트가 다른 클라이언트 전송을 지연시키지 않습니다.
+    
+    배칭 윈도우가 설정되면 윈도우 동안 쌓인 메시지를 배열 프레임 하나로 보내며,
+    긴급(urgent) 메시지가 들어오면 윈도우를 기다리지 않고 즉시 전송합니다.
+    
+    fmt는 연결 시 협상한 프레임 포맷 (json | msgpack)입니다.
+    """
+    
+    def __init__(
+        self,
+        websocket: WebSocket,
+        on_closed: Callable[[WebSocket], None],
+        max_queue: int = WS_SEND_QUEUE_SIZE,
+        policy: str = WS_SLOW_CONSUMER_POLICY,
+        batch_window_ms: int = WS_BATCH_WINDOW_MS,
+        fmt: str = JSON,
+    ):
+        self.websocket = websocket
+        self.fmt = fmt
+        self.max_queue = max_queue
+        self.batch_window = batch_window_ms / 1000
+        self.policy = policy if policy in SLOW_CONSUMER_POLICIES else "drop_oldest"
+        self.queue: Deque[Tuple[str, bytes]] = deque()  # (message type, encoded frame)
+        self.connected_at = datetime.utcnow()
+        self.connected_seq = 0  # 연결 시점의 스트림 일련번호 (이후 이벤트는 실시간 수신)
+        self.last_seen = time.monotonic()  # 마지막 수신 시각 (클라이언트 메시지/pong)
+        self.answers_ping = False  # pong을 보낸 적 있는 클라이언트만 유휴 정리 대상
+        self.ping_id = 0
+        self.ping_sent_at: Optional[float] = None
+        self.rtt_ms: Optional[float] = None
+        self.rtt_avg_ms: Optional[float] = None
+        self.sent = 0
+        self.frames_sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.closing = False
+        self.subscription = Subscription()
+        self._on_closed = on_closed
+        self._wakeup = asyncio.Event()
+        self._urgent = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self):
+        """writer 태스크 시작"""
+        self._task = asyncio.create_task(self._writer())
+    
+    async def stop(self):
+        """writer 태스크 중지"""
+        self.closing = True
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+    
+    def enqueue(self, message_type: str, frame: bytes, urgent: bool = False):
+        """송신 큐에 추가 (네트워크 I/O 없음) - 큐가 가득 차면 정책 적용"""
+        if self.closing:
+            return
+        
+        if len(self.queue) >= self.max_queue:
+            if self.policy == "disconnect":
+                print(f"[WS] Slow consumer: queue full ({self.max_queue}), disconnecting")
+                self.closing = True
+                self.queue.clear()
+                self._wakeup.set()
+                return
+            
+            if self.policy == "coalesce" and self._coalesce(message_type, frame):
+                return
+            
+            # drop_oldest (coalesce 대상이 없는 경우 포함)
+            self.queue.popleft()
+            self.dropped += 1
+        
+        self.queue.append((message_type, frame))
+        if urgent:
+            self._urgent.set()
+        self._wakeup.set()
+    
+    def ping(self):
+        """heartbeat ping 전송 - 클라이언트는 {"action": "pong", "id": ...}로 응답"""
+        self.ping_id += 1
+        self.ping_sent_at = time.monotonic()
+        self.enqueue("ping", encode({"type": "ping", "data": {"id": self.ping_id}}, self.fmt), urgent=True)
+    
+    def pong(self, ping_id: Optional[int]):
+        """pong 수신 - 마지막 ping에 대한 응답이면 RTT 갱신"""
+        now = time.monotonic()
+        self.last_seen = now
+        self.answers_ping = True
+        if ping_id != self.ping_id or self.ping_sent_at is None:
+            return
+        
+        self.rtt_ms = round((now - self.ping_sent_at) * 1000, 2)
+        self.rtt_avg_ms = self.rtt_ms if self.rtt_avg_ms is None else round(
+            (1 - RTT_EWMA_ALPHA) * self.rtt_avg_ms + RTT_EWMA_ALPHA * self.rtt_ms, 2
+        )
+        self.ping_sent_at = None
+    
+    def _coalesce(self, message_type: str, frame: bytes) -> bool:
+        """같은 타입의 대기 메시지를 최신 메시지로 교체"""
+        for position, (queued_type, _) in enumerate(self.queue):
+            if queued_type == message_type:
+                del self.queue[position]
+                self.queue.append((message_type, frame))
+                self.coalesced += 1
+                return True
+        return False
+    
+    async def _writer(self):
+        """큐에 쌓인 메시지를 순서대로 전송"""
+        try:
+            while not self.closing:
+                if not self.queue:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                
+                if not self.batch_window:
+                    _, frame = self.queue.popleft()
+                    await self.websocket.send_bytes(frame)
+                    self.sent += 1
+                    self.frames_sent += 1
+                    continue
+                
+                # 배칭 윈도우 동안 대기 (긴급 메시지가 들어오면 즉시 깨어남)
+                if not self._urgent.is_set():
+                    try:
+                        await asyncio.wait_for(self._urgent.wait(), self.batch_window)
+                    except asyncio.TimeoutError:
+                        pass
+                self._urgent.clear()
+                if self.closing or not self.queue:
+                    continue
+                
+                frames = [frame for _, frame in self.queue]
+                self.queue.clear()
+                await self.websocket.send_bytes(frames[0] if len(frames) == 1 else encode_batch(frames, self.fmt))
+                self.sent += len(frames)
+                self.frames_sent += 1
+            
+            # disconnect 정책으로 종료
+            await self.websocket.close(code=SLOW_CONSUMER_CLOSE_CODE, reason="slow consumer")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[WS] Error sending to client: {e}")
+        finally:
+            self.closing = True
+            self._on_closed(self.websocket)
+    
+    def stats(self) -> Dict:
+        """연결별 송신 통계"""
+        return {
+            "connected_at": self.connected_at.isoformat(),
+            "format": self.fmt,
+            "last_seen_seconds_ago": round(time.monotonic() - self.last_seen, 1),
+            "rtt_ms": self.rtt_ms,
+            "rtt_avg_ms": self.rtt_avg_ms,
+            "queued": len(self.queue),
+            "sent": self.sent,
+            "frames_sent": self.frames_sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
 
 
 class WebSocketManager:
     """WebSocket 연결 관리자"""
     
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self._clients: Dict[WebSocket, ClientConnection] = {}
         self._lock = asyncio.Lock()
+        # 라우팅 테이블: 메시지 타입 / 카테고리 → 구독 클라이언트 (ALL = 전체 구독)
+        self._type_routes: Dict[str, Set[ClientConnection]] = {}
+        self._category_routes: Dict[str, Set[ClientConnection]] = {}
+        # threat_index 변경분 인코딩 상태 (마지막 전송 상태 + 일련번호)
+        self._threat_index_state: Optional[Dict] = None
+        self._threat_index_seq = 0
+        # 재연결 재전송 버퍼: (스트림 seq, 메시지, 포맷별 인코딩 캐시) - 이 워커가 받은 이벤트만 보관
+        self._replay: Deque[Tuple[int, Dict, Dict[str, bytes]]] = deque(maxlen=WS_REPLAY_BUFFER_SIZE)
+        self._replay_floor: Optional[int] = None  # 이 seq 이하는 버퍼에 없음
+        self._snapshot_provider: Optional[Callable[[], Dict]] = None
+        # heartbeat / 유휴 연결 정리
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self.reaped = 0
+    
+    @property
+    def active_connections(self) -> List[WebSocket]:
+        """현재 연결된 WebSocket 목록"""
+        return list(self._clients)
     
     async def connect(self, websocket: WebSocket):
-        """새 WebSocket 연결 수락"""
-        await websocket.accept()
+        """
+        새 WebSocket 연결 수락
+        
+        클라이언트가 Sec-WebSocket-Protocol로 msgpack을 요청하면 MessagePack 바이너리
+        프레임으로, 그 외에는 UTF-8 JSON 프레임으로 전송합니다.
+        """
+        requested = websocket.scope.get("subprotocols") or []
+        fmt = MSGPACK if MSGPACK in requested and MSGPACK in available_formats() else JSON
+        await websocket.accept(subprotocol=fmt if fmt in requested else None)
+        client = ClientConnection(websocket, self._discard, fmt=fmt)
+        client.connected_seq = self.stream_seq
         async with self._lock:
-            self.active_connections.append(websocket)
-        print(f"[WS] Client connected. Total: {len(self.active_connections)}")
+            self._clients[websocket] = client
+            self._add_routes(client)
+        client.start()
+        print(f"[WS] Client connected. Total: {len(self._clients)}")
     
     async def disconnect(self, websocket: WebSocket):
         """WebSocket 연결 해제"""
         async with self._lock:
-            if websocket in self.active_connections:
-                self.active_connections.remove(websocket)
-        print(f"[WS] Client disconnected. Total: {len(self.active_connections)}")
+            client = self._clients.pop(websocket, None)
+            if client is not None:
+                self._remove_routes(client)
+        if client is not None:
+            await client.stop()
+        print(f"[WS] Client disconnected. Total: {len(self._clients)}")
+    
+    def _discard(self, websocket: WebSocket):
+        """writer 종료(전송 실패/강제 종료) 시 연결 목록에서 제거"""
+        client = self._clients.pop(websocket, None)
+        if client is not None:
+            self._remove_routes(client)
     
-    def _serialize(self, obj: Any) -> Any:
-        """JSON 직렬화를 위한 변환"""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif hasattr(obj, '__dict__'):
-            return {k: self._serialize(v) for k, v in obj.__dict__.items() if not k.startswith('_')}
-        elif isinstance(obj, dict):
-            return {k: self._serialize(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._serialize(item) for item in obj]
-        return obj
+    # =========================================================================
+    # Heartbeat
+    # =========================================================================
     
-    async def broadcast(self, message: Dict):
-        """모든 연결된 클라이언트에게 메시지 전송"""
-        if not self.active_connections:
+    def start_heartbeat(self, interval: float = WS_HEARTBEAT_INTERVAL, idle_timeout: float = WS_IDLE_TIMEOUT):
+        """ping 전송 + 유휴 연결 정리 태스크 시작 (interval 0 = 비활성)"""
+        if interval <= 0 or self._heartbeat_task is not None:
             return
+        self._heartbeat_task = asyncio.create_task(self._heartbeat(interval, idle_timeout))
+    
+    async def stop_heartbeat(self):
+        """heartbeat 태스크 중지"""
+        if self._heartbeat_task is None:
+            return
+        self._heartbeat_task.cancel()
+        try:
+            await self._heartbeat_task
+        except asyncio.CancelledError:
+            pass
+        self._heartbeat_task = None
+    
+    async def _heartbeat(self, interval: float, idle_timeout: float):
+        """
+        interval마다 모든 연결에 ping 전송
         
-        # 메시지에 타임스탬프 추가
-        message["timestamp"] = datetime.utcnow().isoformat()
+        pong으로 응답해 온 클라이언트가 idle_timeout 동안 아무 메시지(pong 포함)도 보내지 않으면
+        끊어진 것으로 보고 브로드캐스트 대상에서 즉시 제거한 뒤 close합니다.
+        pong을 보내지 않는 클라이언트(이전 대시보드 빌드, 외부 /ws 연동)는 정리하지 않고
+        uvicorn의 프로토콜 수준 ping(--ws-ping-interval / --ws-ping-timeout)으로 연결 상태를 확인합니다.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                now = time.monotonic()
+                for websocket, client in list(self._clients.items()):
+                    if idle_timeout > 0 and client.answers_ping and now - client.last_seen > idle_timeout:
+                        await self._reap(websocket, client)
+                    else:
+                        client.ping()
+            except Exception as e:
+                print(f"[WS] Heartbeat error: {e}")
+    
+    async def _reap(self, websocket: WebSocket, client: ClientConnection):
+        """응답 없는 연결 정리"""
+        async with self._lock:
+            if self._clients.pop(websocket, None) is None:
+                return
+            self._remove_routes(client)
+        await client.stop()
+        self.reaped += 1
+        print(f"[WS] Reaped idle client (no response for {time.monotonic() - client.last_seen:.0f}s). Total: {len(self._clients)}")
         
-        # JSON 직렬화
-        data = json.dumps(self._serialize(message), ensure_ascii=False)
+        try:
+            await asyncio.wait_for(websocket.close(code=IDLE_CLOSE_CODE, reason="idle timeout"), IDLE_CLOSE_TIMEOUT)
+        except Exception:
+            pass  # 이미 끊어진 소켓
+    
+    # =========================================================================
+    # Subscriptions
+    # =========================================================================
+    
+    def _add_routes(self, client: ClientConnection):
+        """클라이언트 구독 조건을 라우팅 테이블에 등록"""
+        subscription = client.subscription
+        for message_type in (subscription.types if subscription.types is not None else [ALL]):
+            self._type_routes.setdefault(message_type, set()).add(client)
+        for category in (subscription.categories if subscription.categories is not None else [ALL]):
+            self._category_routes.setdefault(category, set()).add(client)
+    
+    def _remove_routes(self, client: ClientConnection):
+        """라우팅 테이블에서 클라이언트 제거"""
+        for routes in (self._type_routes, self._category_routes):
+            for key in list(routes):
+                routes[key].discard(client)
+                if not routes[key]:
+                    del routes[key]
+    
+    async def handle_client_message(self, websocket: WebSocket, raw: Any):
+        """
+        클라이언트 메시지 처리 (구독 프로토콜)
         
-        # 연결 해제된 클라이언트 추적
-        disconnected = []
+        {"action": "subscribe", "types": ["new_alert"], "categories": ["cyber"], "min_level": 3}
+        {"action": "unsubscribe", "types": ["demo_event"], "categories": ["drone"]}
+        {"action": "get_subscription"}
+        {"action": "resync"}  - threat_index 전체 상태 재요청 (delta 누락 감지 시)
+        {"action": "resume", "stream": "...", "last_seq": 120}  - 재연결 전 마지막 seq 이후 이벤트 재전송
+        {"action": "pong", "id": 3}  - heartbeat ping 응답
         
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(data)
-            except Exception as e:
-                print(f"[WS] Error sending to client: {e}")
-                disconnected.append(connection)
+        types / categories에 "*"를 지정하면 전체, 처음 subscribe하면 지정한 항목만 수신합니다.
+        """
+        client = self._clients.get(websocket)
+        if client is None:
+            return
+        client.last_seen = time.monotonic()
         
-        # 연결 해제된 클라이언트 제거
-        async with self._lock:
-            for conn in disconnected:
-                if conn in self.active_connections:
-                    self.active_connections.remove(conn)
+        try:
+            request = loads(raw)
+            action = request.get("action")
+            types = request.get("types") or []
+            categories = request.get("categories") or []
+            min_level = int(request["min_level"]) if request.get("min_level") is not None else None
+            last_seq = int(request["last_seq"]) if request.get("last_seq") is not None else None
+            if not isinstance(types, list) or not isinstance(categories, list):
+                raise ValueError("types and categories must be lists")
+        except (ValueError, TypeError, AttributeError) as e:
+            await self.send_to(websocket, {"type": "error", "data": {"message": f"Invalid message: {e}"}})
+            return
+        
+        if action == "pong":
+            client.pong(request.get("id"))
+            return
+        
+        if action == "resync":
+            await self.send_threat_index_snapshot(websocket)
+            return
+        
+        if action == "resume":
+            await self.resume(websocket, request.get("stream"), last_seq)
+            return
+        
+        if action not in ("subscribe", "unsubscribe", "get_subscription"):
+            await self.send_to(websocket, {"type": "error", "data": {"message": f"Unknown action: {action}"}})
+            return
+        
+        category_names = scoring_config.tables.category_names
+        unknown = [t for t in types if t != ALL and t not in MESSAGE_TYPES]
+        unknown += [c for c in categories if c != ALL and c not in category_names]
+        if unknown:
+            await self.send_to(websocket, {"type": "error", "data": {"message": f"Unknown type or category: {', '.join(map(str, unknown))}"}})
+            return
+        
+        if action != "get_subscription":
+            add = action == "subscribe"
+            subscription = client.subscription
+            self._remove_routes(client)
+            if types:
+                subscription.types = _updated_selection(subscription.types, types, MESSAGE_TYPES, add)
+            if categories:
+                subscription.categories = _updated_selection(subscription.categories, categories, category_names, add)
+            if add and min_level is not None:
+                subscription.min_level = min_level
+            self._add_routes(client)
+        
+        await self.send_to(websocket, {"type": "subscription", "data": client.subscription.to_dict()})
+    
+    def _audience(self, message_type: str, category: Optional[str], level: Optional[int]) -> List[ClientConnection]:
+        """라우팅 테이블로 메시지 수신 대상 결정"""
+        audience = self._type_routes.get(message_type, set()) | self._type_routes.get(ALL, set())
+        if category is not None:
+            audience &= self._category_routes.get(category, set()) | self._category_routes.get(ALL, set())
+        if level is not None:
+            audience = {client for client in audience if client.subscription.min_level <= level}
+        return list(audience)
+    
+    async def send_to(self, websocket: WebSocket, message: Dict, frames: Optional[Dict[str, bytes]] = None):
+        """특정 클라이언트에게만 메시지 전송 (frames: 여러 클라이언트가 공유하는 포맷별 인코딩 캐시)"""
+        frames = {} if frames is None else frames
+        client = self._clients.get(websocket)
+        if client is None:
+            await websocket.send_bytes(frame_for(frames, message, JSON))
+            return
+        client.enqueue(message.get("type", ""), frame_for(frames, message, client.fmt), urgent=True)
+    
+    async def broadcast(self, message: Dict, frames: Optional[Dict[str, bytes]] = None):
+        """
+        구독 중인 클라이언트의 송신 큐에 메시지 추가 (전송 완료를 기다리지 않음)
+        
+        같은 내용을 받는 클라이언트 묶음마다 포맷별로 한 번만 직렬화합니다.
+        frames는 포맷별 인코딩 캐시로, 재전송 버퍼와 공유합니다.
+        """
+        if not self._clients:
+            return
+        
+        message_type = message.get("type", "")
+        route_type, category, level = _route_of(message)
+        urgent = level is not None and level >= WS_BATCH_BYPASS_LEVEL
+        
+        audience = self._audience(route_type, category, level)
+        if not audience:
+            return
+        
+        # 메시지에 타임스탬프 추가 (dispatch에서 이미 붙인 경우 유지)
+        message.setdefault("timestamp", datetime.utcnow().isoformat())
+        
+        if message_type in ("threat_index", "threat_index_delta"):
+            # 카테고리 구독 조건별로 해당 카테고리 지수만 포함
+            groups: Dict[Optional[FrozenSet[str]], List[ClientConnection]] = {}
+            for client in audience:
+                groups.setdefault(client.subscription.category_key, []).append(client)
+            for category_key, clients in groups.items():
+                payload = message if category_key is None else _project_categories(message, category_key)
+                group_frames: Dict[str, bytes] = {}
+                for client in clients:
+                    client.enqueue(message_type, frame_for(group_frames, payload, client.fmt))
+            return
+        
+        # 포맷별로 한 번만 직렬화 (datetime/ORM 객체는 default 훅에서 처리)
+        # 클라이언트마다 다시 인코딩하지 않도록 바이너리 프레임으로 그대로 전송
+        frames = {} if frames is None else frames
+        for client in audience:
+            client.enqueue(message_type, frame_for(frames, message, client.fmt), urgent)
+    
+    async def publish(self, message: Dict):
+        """
+        이벤트 버스로 메시지 발행
+        
+        모든 워커가 같은 메시지를 받아 각자의 클라이언트에게 dispatch합니다.
+        """
+        await event_bus.publish("ws", message)
+    
+    async def publish_event(self, event: DomainEvent):
+        """
+        이벤트 파이프라인의 WebSocket 싱크
+        
+        메시지의 data는 이벤트의 Encoded 객체 그대로이므로 이벤트 버스 프레임과
+        클라이언트 프레임 모두 캐시된 인코딩을 이어 붙입니다.
+        """
+        if event.broadcast:
+            await self.publish(event.message())
+    
+    async def dispatch(self, message: Dict):
+        """이벤트 버스에서 받은 메시지를 이 워커의 클라이언트에게 전송"""
+        seq = message.get("seq")
+        if seq is not None and self._replay_floor is None:
+            # 이 워커가 처음 받은 이벤트 - 이전 이벤트는 재전송할 수 없음
+            self._replay_floor = seq - 1
+        
+        if message.get("type") == "threat_index":
+            await self._dispatch_threat_index(message["data"])
+            return
+        
+        frames: Dict[str, bytes] = {}
+        if seq is not None and message.get("type") not in REPLAY_EXCLUDED_TYPES:
+            message["timestamp"] = datetime.utcnow().isoformat()
+            self._remember(seq, message, frames)
+        await self.broadcast(message, frames)
+    
+    # =========================================================================
+    # Resume (replay buffer)
+    # =========================================================================
+    
+    @property
+    def stream_seq(self) -> int:
+        """현재 스트림 일련번호 (initial_state로 클라이언트에 전달)"""
+        return event_bus.last_seq("ws")
+    
+    def stream_position(self) -> Dict:
+        """클라이언트가 재연결 시 resume에 사용할 위치"""
+        return {"stream": event_bus.stream_id, "seq": self.stream_seq}
+    
+    def set_snapshot_provider(self, provider: Callable[[], Dict]):
+        """재전송 불가 시 보낼 스냅샷 데이터 제공자 등록 (최근 위협 등)"""
+        self._snapshot_provider = provider
+    
+    def _remember(self, seq: int, message: Dict, frames: Dict[str, bytes]):
+        """재전송 버퍼에 추가 - 가득 차면 가장 오래된 이벤트의 seq가 하한이 됨"""
+        if len(self._replay) == self._replay.maxlen:
+            self._replay_floor = self._replay[0][0]
+        self._replay.append((seq, message, frames))
+    
+    async def resume(self, websocket: WebSocket, stream: Optional[str], last_seq: Optional[int]):
+        """
+        재연결 클라이언트에게 놓친 이벤트 재전송
+        
+        last_seq 이후 ~ 연결 시점까지의 이벤트를 구독 조건에 맞춰 순서대로 보내고
+        (연결 이후 이벤트는 이미 실시간으로 수신), 버퍼에서 밀려났거나 다른 스트림
+        (서버 재시작)이면 최근 상태 스냅샷을 대신 보냅니다.
+        """
+        client = self._clients.get(websocket)
+        if client is None:
+            return
+        
+        until = client.connected_seq
+        floor = self._replay_floor if self._replay_floor is not None else self.stream_seq
+        if stream != event_bus.stream_id or last_seq is None or not floor <= last_seq <= until:
+            await self.send_resume_snapshot(websocket)
+            return
+        
+        subscription = client.subscription
+        replayed = 0
+        for seq, message, frames in self._replay:
+            if seq <= last_seq or seq > until:
+                continue
+            if not subscription.matches(*_route_of(message)):
+                continue
+            client.enqueue(message["type"], frame_for(frames, message, client.fmt), urgent=True)
+            replayed += 1
+        
+        await self.send_to(websocket, {
+            "type": "resumed",
+            "data": {"from_seq": last_seq, "to_seq": until, "replayed": replayed},
+            **self.stream_position()
+        })
+    
+    async def send_resume_snapshot(self, websocket: WebSocket):
+        """재전송할 수 없을 때 최근 위협/알림 스냅샷 전송"""
+        client = self._clients.get(websocket)
+        if client is None:
+            return
+        
+        data = self._snapshot_provider() if self._snapshot_provider is not None else {}
+        subscription = client.subscription
+        alerts = [
+            message["data"] for _, message, _ in self._replay
+            if message["type"] == "new_alert" and subscription.matches(*_route_of(message))
+        ]
+        data["alerts"] = alerts[-WS_RESUME_SNAPSHOT_LIMIT:]
+        await self.send_to(websocket, {
+            "type": "snapshot",
+            "data": data,
+            **self.stream_position()
+        })
     
     async def send_threat_index(self, threat_index: Dict):
         """위협 지수 업데이트 전송"""
-        await self.broadcast({
+        await self.publish({
             "type": "threat_index",
             "data": threat_index
         })
     
-    async def send_new_threat(self, threat: Dict):
+    async def _dispatch_threat_index(self, threat_index: Dict):
+        """
+        위협 지수 업데이트를 변경분/전체 상태로 인코딩해 전송
+        
+        seq와 변경분은 워커(클라이언트가 연결된 프로세스)마다 계산합니다.
+        매 업데이트마다 seq를 증가시키고, 바뀐 필드만 threat_index_delta로 전송합니다.
+        WS_KEYFRAME_INTERVAL회마다(또는 첫 업데이트) 전체 상태를 threat_index로 전송하며,
+        표시 값이 하나도 바뀌지 않은 업데이트는 전송하지 않습니다.
+        """
+        previous = self._threat_index_state
+        changes = _diff_threat_index(previous, threat_index) if previous is not None else None
+        if previous is not None and not changes and WS_THREAT_INDEX_DELTA:
+            return
+        
+        self._threat_index_seq += 1
+        seq = self._threat_index_seq
+        self._threat_index_state = {**threat_index, "seq": seq}
+        
+        if not WS_THREAT_INDEX_DELTA or changes is None or seq % WS_KEYFRAME_INTERVAL == 0:
+            await self.broadcast({
+                "type": "threat_index",
+                "data": dict(self._threat_index_state)
+            })
+        else:
+            await self.broadcast({
+                "type": "threat_index_delta",
+                "data": {
+                    "seq": seq,
+                    "changes": changes
+                }
+            })
+    
+    async def send_threat_index_snapshot(self, websocket: WebSocket):
+        """특정 클라이언트에게 최신 threat_index 전체 상태 전송 (연결 직후/resync)"""
+        client = self._clients.get(websocket)
+        if client is None or self._threat_index_state is None:
+            return
+        
+        message = {
+            "type": "threat_index",
+            "data": dict(self._threat_index_state),
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        category_key = client.subscription.category_key
+        if category_key is not None:
+            message = _project_categories(message, category_key)
+        client.enqueue("threat_index", encode(message, client.fmt), urgent=True)
+    
+    async def send_new_threat(self, threat: Dict) -> DomainEvent:
         """새 위협 알림 전송"""
-        await self.broadcast({
-            "type": "new_threat",
-            "data": threat
-        })
+        return await pipeline.emit(DomainEvent("new_threat", threat))
     
-    async def send_new_alert(self, alert: Dict):
-        """새 알림 전송"""
-        await self.broadcast({
-            "type": "new_alert",
-            "data": alert
-        })
+    async def send_new_alert(self, alert: Dict) -> DomainEvent:
+        """새 알림 전송 (저장소 / DB 저장 / 외부 채널 싱크도 함께 처리)"""
+        return await pipeline.emit(DomainEvent("new_alert", alert))
     
-    async def send_threat_update(self, threat_id: str, status: str):
+    async def send_threat_update(self, threat_id: str, status: str, category: Optional[str] = None) -> DomainEvent:
         """위협 상태 업데이트 전송"""
-        await self.broadcast({
-            "type": "threat_update",
-            "data": {
-                "threat_id": threat_id,
-                "status": status
-            }
-        })
+        return await pipeline.emit(DomainEvent("threat_update", {
+            "threat_id": threat_id,
+            "status": status,
+            "category": category
+        }))
     
-    async def send_demo_event(self, event_type: str, data: Dict):
-        """데모 이벤트 전송"""
-        await self.broadcast({
-            "type": "demo_event",
-            "event": event_type,
-            "data": data
-        })
+    async def send_demo_event(self, event_type: str, data: Dict) -> DomainEvent:
+        """데모 이벤트 전송 (data에 다른 이벤트의 data를 넣으면 인코딩 재사용)"""
+        return await pipeline.emit(DomainEvent("demo_event", data, event=event_type))
     
     @property
     def connection_count(self) -> int:
         """현재 연결 수"""
-        return len(self.active_connections)
+        return len(self._clients)
+    
+    def get_connection_stats(self) -> List[Dict]:
+        """연결별 송신 큐 통계"""
+        return [
+            {**client.stats(), "subscription": client.subscription.to_dict()}
+            for client in self._clients.values()
+        ]
 
 
 # 싱글톤 인스턴스
 manager = WebSocketManager()
-
+event_bus.sequence("ws")
+event_bus.subscribe("ws", manager.dispatch)
+pipeline.add_sink(ALL_EVENTS, manager.publish_event)
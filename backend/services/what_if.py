@@ -0,0 +1,239 @@
+"""
+ARGUS SKY - What-if Weight Simulation
+후보 가중치 세트별 과거 지수 곡선을 프로세스 풀에서 병렬 계산
+
+과거 위협 열 배열은 공유 메모리 블록 하나에 복사하여 워커에 이름만 전달하므로
+후보 수와 무관하게 대용량 배열을 피클링하지 않습니다.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import multiprocessing
+import os
+
+import numpy as np
+
+from config import WHAT_IF_WORKERS
+from services.backtest import ThreatColumns, _from_epoch, compute_indices, hourly_times, weight_arrays
+from services.scoring_tables import ScoringTables, compile_tables, scoring_config
+
+# 공유 메모리 배치: (배열 이름, dtype, 길이, 시작 오프셋)
+Layout = List[Tuple[str, str, int, int]]
+
+
+# =============================================================================
+# Shared Memory
+# =============================================================================
+
+def _share_arrays(arrays: Dict[str, np.ndarray]) -> Tuple[shared_memory.SharedMemory, Layout]:
+    """배열들을 8바이트 정렬로 공유 메모리 블록 하나에 복사"""
+    layout: Layout = []
+    offset = 0
+    for key, array in arrays.items():
+        layout.append((key, array.dtype.str, len(array), offset))
+        offset += -(-array.nbytes // 8) * 8
+
+    block = shared_memory.SharedMemory(create=True, size=max(offset, 8))
+    for (key, dtype, length, start) in layout:
+        np.ndarray((length,), dtype=dtype, buffer=block.buf, offset=start)[:] = arrays[key]
+    return block, layout
+
+
+def _attach_arrays(block_name: str, layout: Layout) -> Tuple[shared_memory.SharedMemory, Dict[str, np.ndarray]]:
+    """워커에서 공유 메모리 블록을 복사 없이 배열 뷰로 연결"""
+    # 블록 해제(unlink)는 생성한 부모 프로세스 담당 - 워커는 close만 수행
+    block = shared_memory.SharedMemory(name=block_name)
+    arrays = {
+        key: np.ndarray((length,), dtype=dtype, buffer=block.buf, offset=start)
+        for (key, dtype, length, start) in layout
+    }
+    return block, arrays
+
+
+# =============================================================================
+# Worker
+# =============================================================================
+
+def _evaluate_candidate(
+    block_name: str,
+    layout: Layout,
+    category_weights: List[float],
+    source_credibility: List[float],
+    level_floors: List[float],
+    levels: List[int],
+    max_age_hours: Optional[float],
+    include_categories: bool,
+) -> Dict:
+    """워커 프로세스: 후보 가중치 세트 1개의 곡선 계산"""
+    block, arrays = _attach_arrays(block_name, layout)
+    try:
+        category_indices, _, total_index = compute_indices(
+            arrays["category_codes"],
+            arrays["source_codes"],
+            arrays["severity"],
+            arrays["created_at"],
+            arrays["times"],
+            np.array(category_weights, dtype=np.float64),
+            np.array(source_credibility, dtype=np.float64),
+            max_age_hours=max_age_hours,
+        )
+        level_values = np.array(levels)[
+            np.clip(np.searchsorted(np.array(level_floors), total_index, side="right") - 1, 0, None)
+        ]
+        result = {
+            "total_index": np.round(total_index, 2).tolist(),
+            "levels": level_values.tolist(),
+            "level_changes": int(np.count_nonzero(np.diff(level_values))),
+        }
+        if include_categories:
+            result["category_indices"] = np.round(category_indices, 2).T.tolist()
+        return result
+    finally:
+        # 뷰를 모두 해제한 뒤 닫아야 버퍼 export 오류가 나지 않음
+        del arrays
+        block.close()
+
+
+# =============================================================================
+# What-if Evaluator
+# =============================================================================
+
+def candidate_tables(
+    category_weights: Dict[str, float],
+    source_credibility: Dict[str, float],
+    base: Optional[ScoringTables] = None,
+) -> ScoringTables:
+    """
+    현재 설정에 후보 가중치를 덮어쓴 테이블 생성
+
+    Raises:
+        ValueError: 등록되지 않은 카테고리/출처 또는 잘못된 값
+    """
+    base = base or scoring_config.tables
+    unknown = [c for c in category_weights if c not in base.category_codes]
+    unknown += [s for s in source_credibility if s not in base.source_codes]
+    if unknown:
+        raise ValueError(f"Unknown category or source: {', '.join(unknown)}")
+    for value in list(category_weights.values()) + list(source_credibility.values()):
+        if not 0 <= value <= 10:
+            raise ValueError(f"Weight out of range (0-10): {value}")
+
+    overrides = {
+        "category_weights": {
+            cat: {**base.category_config[cat], "weight": category_weights.get(cat, weight)}
+            for cat, weight in zip(base.category_names, base.category_weights)
+        },
+        "data_sources": {
+            src: {**base.source_config[src], "credibility": source_credibility.get(src, credibility)}
+            for src, credibility in zip(base.source_names, base.source_credibility)
+        },
+        "threat_levels": {level: dict(config) for level, config in base.level_config.items()},
+    }
+    return compile_tables(overrides, version=base.version)
+
+
+class WhatIfEvaluator:
+    """What-if 시뮬레이션 프로세스 풀 관리"""
+
+    def __init__(self, max_workers: int = WHAT_IF_WORKERS):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """첫 요청 시 풀 생성 (spawn - 이벤트 루프/스케줄러 스레드 상태를 복제하지 않음)"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            print(f"[WhatIf] Process pool started ({self.max_workers} workers)")
+        return self._pool
+
+    async def evaluate(
+        self,
+        columns: ThreatColumns,
+        start: datetime,
+        end: datetime,
+        candidates: List[Tuple[str, ScoringTables]],
+        step_hours: float = 1.0,
+        max_age_hours: Optional[float] = None,
+        include_categories: bool = False,
+    ) -> Dict:
+        """
+        후보별 곡선을 병렬 계산 (이벤트 루프는 결과 대기만 수행)
+
+        모든 후보는 같은 카테고리/출처 코드 체계를 공유해야 합니다 (candidate_tables 사용).
+        """
+        times = hourly_times(start, end, step_hours)
+        block, layout = _share_arrays({
+            "category_codes": columns.category_codes,
+            "source_codes": columns.source_codes,
+            "severity": columns.severity,
+            "created_at": columns.created_at,
+            "times": times,
+        })
+
+        try:
+            loop = asyncio.get_running_loop()
+            pool = self._get_pool()
+            futures = []
+            for _, tables in candidates:
+                category_weights, source_credibility = weight_arrays(tables)
+                futures.append(loop.run_in_executor(
+                    pool,
+                    _evaluate_candidate,
+                    block.name,
+                    layout,
+                    category_weights.tolist(),
+                    source_credibility.tolist(),
+                    list(tables.level_floors),
+                    list(tables.levels),
+                    max_age_hours,
+                    include_categories,
+                ))
+            results = await asyncio.gather(*futures)
+        except BrokenProcessPool:
+            # 워커가 비정상 종료된 풀은 재사용할 수 없으므로 다음 요청에서 새로 생성
+            self._pool = None
+            raise
+        finally:
+            block.close()
+            block.unlink()
+
+        curves = []
+        for (name, tables), result in zip(candidates, results):
+            curve = {
+                "name": name,
+                "category_weights": dict(zip(tables.category_names, tables.category_weights)),
+                "source_credibility": dict(zip(tables.source_names, tables.source_credibility)),
+                "total_index": result["total_index"],
+                "levels": result["levels"],
+                "level_changes": result["level_changes"],
+            }
+            if include_categories:
+                curve["categories"] = dict(zip(tables.category_names, result["category_indices"]))
+            curves.append(curve)
+
+        return {
+            "start": start,
+            "end": end,
+            "step_hours": step_hours,
+            "config_version": scoring_config.version,
+            "threats_loaded": len(columns),
+            "timestamps": [_from_epoch(t).isoformat() for t in times],
+            "candidates": curves,
+        }
+
+    def shutdown(self):
+        """프로세스 풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            print("[WhatIf] Process pool stopped")
+
+
+# 싱글톤 인스턴스
+what_if = WhatIfEvaluator()
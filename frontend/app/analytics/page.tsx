@@ -4,6 +4,7 @@ import { useState, useMemo } from 'react';
 import { useQuery } from '@tanstack/react-query';
 import { api } from '@/lib/api';
 import { useAnalytics, useTrend } from '@/hooks/useArgusAPI';
+import { useInitialQueryOptions } from '@/hooks/useInitialState';
 import { TrendChart } from '@/components/dashboard/TrendChart';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Badge } from '@/components/ui/badge';
@@ -31,7 +32,7 @@ import {
   Cell,
 } from 'recharts';
 import { CATEGORY_CONFIG, ACTIVE_BACKEND } from '@/lib/constants';
-import { ThreatCategory } from '@/types';
+import { ThreatCategory, KPIMetrics, TrendDataPoint, CategoryDistribution } from '@/types';
 
 const COLORS = ['#D32F2F', '#7B1FA2', '#1976D2', '#00796B', '#F57C00', '#5D4037'];
 
@@ -54,26 +55,33 @@ export default function AnalyticsPage() {
   
   const useNodeBackend = ACTIVE_BACKEND === 'node';
 
-  // Python 백엔드 데이터
+  // Python 백엔드 데이터 (KPI/트렌드/분포는 연결 시 initial_state로 채워짐)
+  const kpiOptions = useInitialQueryOptions<KPIMetrics>(['kpi']);
+  const trendOptions = useInitialQueryOptions<TrendDataPoint[]>(['trend', hours]);
+  const distributionOptions = useInitialQueryOptions<CategoryDistribution[]>(['distribution']);
+
   const { data: pythonKpi, isLoading: pythonKpiLoading } = useQuery({
+    ...kpiOptions,
     queryKey: ['kpi'],
     queryFn: api.getKPI,
     staleTime: 30000,
-    enabled: !useNodeBackend,
+    enabled: kpiOptions.enabled && !useNodeBackend,
   });
 
   const { data: pythonTrend = [], isLoading: pythonTrendLoading } = useQuery({
+    ...trendOptions,
     queryKey: ['trend', hours],
     queryFn: () => api.getTrend(hours),
     staleTime: 60000,
-    enabled: !useNodeBackend,
+    enabled: trendOptions.enabled && !useNodeBackend,
   });
 
   const { data: pythonDistribution = [], isLoading: pythonDistLoading } = useQuery({
+    ...distributionOptions,
     queryKey: ['distribution'],
     queryFn: api.getCategoryDistribution,
     staleTime: 60000,
-    enabled: !useNodeBackend,
+    enabled: distributionOptions.enabled && !useNodeBackend,
   });
 
   const { data: pythonSourceStats = [], isLoading: pythonSourceLoading } = useQuery({
@@ -3,11 +3,18 @@
 import { QueryClient, QueryClientProvider } from '@tanstack/react-query';
 import { ReactQueryDevtools } from '@tanstack/react-query-devtools';
 import { useState, ReactNode } from 'react';
+import { useInitialStateSync } from '@/hooks/useInitialState';
 
 interface ProvidersProps {
   children: ReactNode;
 }
 
+// WebSocket initial_state로 대시보드 쿼리 캐시 채우기
+function InitialStateSync() {
+  useInitialStateSync();
+  return null;
+}
+
 export function Providers({ children }: ProvidersProps) {
   const [queryClient] = useState(
     () =>
@@ -24,6 +31,7 @@ export function Providers({ children }: ProvidersProps) {
 
   return (
     <QueryClientProvider client={queryClient}>
+      <InitialStateSync />
       {children}
       {process.env.NODE_ENV === 'development' && (
         <ReactQueryDevtools initialIsOpen={false} />
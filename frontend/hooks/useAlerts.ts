@@ -3,6 +3,7 @@
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { api } from '@/lib/api';
 import { useWebSocket } from './useWebSocket';
+import { useInitialQueryOptions } from './useInitialState';
 import { AlertResponse } from '@/types';
 import { useCallback, useMemo } from 'react';
 
@@ -18,14 +19,17 @@ interface UseAlertsReturn {
 export function useAlerts(limit: number = 20): UseAlertsReturn {
   const queryClient = useQueryClient();
   const { newAlerts } = useWebSocket();
+  const queryKey = ['alerts', limit];
+  const initialOptions = useInitialQueryOptions<AlertResponse[]>(queryKey);
 
-  // API에서 알림 목록 가져오기
+  // API에서 알림 목록 가져오기 (연결 시 initial_state로 채워짐)
   const { 
     data: apiAlerts = [], 
     isLoading, 
     error 
   } = useQuery({
-    queryKey: ['alerts', limit],
+    ...initialOptions,
+    queryKey,
     queryFn: () => api.getAlerts({ limit }),
     staleTime: 10000,
     refetchInterval: 30000,
@@ -48,13 +52,15 @@ export function useAlerts(limit: number = 20): UseAlertsReturn {
   });
 
   // WebSocket 알림과 API 알림 병합
+  // 읽음 상태는 API 쪽이 최신이므로 (읽음 처리 후 다시 조회) 같은 알림은 API 알림 사용
   const alerts = useMemo(() => {
-    const merged = [...newAlerts];
+    const merged = [...apiAlerts];
+    const ids = new Set(apiAlerts.map(a => a.id));
     
-    // API 알림 중 중복되지 않는 것만 추가
-    for (const apiAlert of apiAlerts) {
-      if (!merged.some(a => a.id === apiAlert.id)) {
-        merged.push(apiAlert);
+    // WebSocket 알림 중 API 목록에 아직 없는 것만 추가
+    for (const wsAlert of newAlerts) {
+      if (!ids.has(wsAlert.id)) {
+        merged.push(wsAlert);
       }
     }
     
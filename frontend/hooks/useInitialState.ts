@@ -0,0 +1,68 @@
+'use client';
+
+import { useEffect, useSyncExternalStore } from 'react';
+import { QueryKey, useQueryClient } from '@tanstack/react-query';
+import { wsClient } from '@/lib/websocket';
+import {
+  INITIAL_STATE_WAIT_MS,
+  initialDataFor,
+  initialStateReceivedAt,
+  isInitialStateSettled,
+  onInitialStateSettled,
+  seedQueryCache,
+  settleInitialState,
+} from '@/lib/initialState';
+import { WebSocketInitialState } from '@/types';
+
+/**
+ * initial_state 수신 시 쿼리 캐시 채우기 (앱에서 한 번, QueryClientProvider 안에서 사용)
+ * 재연결 때 받는 initial_state로도 캐시를 갱신합니다.
+ */
+export function useInitialStateSync(): void {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    wsClient.connect().catch(console.error);
+
+    const unsubInitial = wsClient.subscribe('initial_state', (data) => {
+      if (data) {
+        seedQueryCache(queryClient, data as WebSocketInitialState);
+      }
+    });
+
+    // 연결 실패/지연 시 REST로 진행
+    const unsubConnection = wsClient.onConnectionChange((connected) => {
+      if (!connected) {
+        settleInitialState();
+      }
+    });
+    const timer = setTimeout(settleInitialState, INITIAL_STATE_WAIT_MS);
+
+    return () => {
+      unsubInitial();
+      unsubConnection();
+      clearTimeout(timer);
+    };
+  }, [queryClient]);
+}
+
+/** initial_state를 받았거나 대기 시간이 지났는지 */
+export function useInitialStateReady(): boolean {
+  return useSyncExternalStore(onInitialStateSettled, isInitialStateSettled, () => false);
+}
+
+/**
+ * initial_state로 채울 수 있는 쿼리의 공통 옵션
+ *
+ * 스냅샷 수신 전에는 요청을 미루고, 이미 받은 스냅샷이 있으면 initialData로 사용합니다.
+ * (initialDataUpdatedAt 기준으로 staleTime이 지나면 평소처럼 REST로 갱신)
+ */
+export function useInitialQueryOptions<T>(queryKey: QueryKey) {
+  const ready = useInitialStateReady();
+
+  return {
+    enabled: ready,
+    initialData: () => initialDataFor(queryKey) as T | undefined,
+    initialDataUpdatedAt: initialStateReceivedAt,
+  };
+}
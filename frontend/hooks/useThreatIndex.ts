@@ -3,6 +3,7 @@
 import { useQuery } from '@tanstack/react-query';
 import { api } from '@/lib/api';
 import { useWebSocket } from './useWebSocket';
+import { useInitialQueryOptions } from './useInitialState';
 import { ThreatIndexResponse, TrendDataPoint, ThreatCategory } from '@/types';
 import { CATEGORY_CONFIG } from '@/lib/constants';
 
@@ -25,13 +26,16 @@ interface UseThreatIndexReturn {
 
 export function useThreatIndex(trendHours: number = 24): UseThreatIndexReturn {
   const { threatIndex: realtimeIndex, isConnected } = useWebSocket();
+  const indexOptions = useInitialQueryOptions<ThreatIndexResponse>(['threatIndex']);
+  const trendOptions = useInitialQueryOptions<TrendDataPoint[]>(['trend', trendHours]);
 
-  // 초기 위협 지수 (API)
+  // 초기 위협 지수 (연결 시 initial_state로 채워지고, 이후 API로 갱신)
   const { 
     data: initialIndex, 
     isLoading: indexLoading, 
     error: indexError 
   } = useQuery({
+    ...indexOptions,
     queryKey: ['threatIndex'],
     queryFn: api.getThreatIndex,
     staleTime: 10000,
@@ -43,6 +47,7 @@ export function useThreatIndex(trendHours: number = 24): UseThreatIndexReturn {
     data: trend = [], 
     isLoading: trendLoading 
   } = useQuery({
+    ...trendOptions,
     queryKey: ['trend', trendHours],
     queryFn: () => api.getTrend(trendHours),
     staleTime: 60000,
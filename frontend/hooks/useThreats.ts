@@ -3,6 +3,7 @@
 import { useQuery } from '@tanstack/react-query';
 import { api } from '@/lib/api';
 import { useWebSocket } from './useWebSocket';
+import { useInitialQueryOptions } from './useInitialState';
 import { ThreatResponse, ThreatCategory, ThreatStatus } from '@/types';
 import { useMemo } from 'react';
 
@@ -23,6 +24,8 @@ interface UseThreatsReturn {
 export function useThreats(options: UseThreatsOptions = {}): UseThreatsReturn {
   const { category, status, level, limit = 50 } = options;
   const { newThreats } = useWebSocket();
+  const queryKey = ['threats', category, status, level, limit];
+  const initialOptions = useInitialQueryOptions<ThreatResponse[]>(queryKey);
 
   const { 
     data: apiThreats = [], 
@@ -30,7 +33,8 @@ export function useThreats(options: UseThreatsOptions = {}): UseThreatsReturn {
     error,
     refetch,
   } = useQuery({
-    queryKey: ['threats', category, status, level, limit],
+    ...initialOptions,
+    queryKey,
     queryFn: () => api.getThreats({ category, status, level, limit }),
     staleTime: 10000,
     refetchInterval: 30000,
@@ -2,7 +2,7 @@
 
 import { useEffect, useState, useCallback, useRef } from 'react';
 import { wsClient } from '@/lib/websocket';
-import { ThreatIndexResponse, ThreatResponse, AlertResponse } from '@/types';
+import { ThreatIndexResponse, ThreatResponse, AlertResponse, WebSocketResumeSnapshot } from '@/types';
 
 interface UseWebSocketReturn {
   isConnected: boolean;
@@ -33,25 +33,7 @@ export function useWebSocket(): UseWebSocketReturn {
       }
     });
 
-    // 초기 상태 리스너
-    const unsubInitial = wsClient.subscribe('initial_state', (data) => {
-      if (mountedRef.current && data) {
-        const state = data as {
-          total_index: number;
-          level: number;
-          level_name: string;
-          categories: ThreatIndexResponse['categories'];
-        };
-        setThreatIndex({
-          total_index: state.total_index,
-          level: state.level,
-          level_name: state.level_name,
-          categories: state.categories,
-          change_24h: 0,
-          timestamp: new Date().toISOString(),
-        });
-      }
-    });
+    // initial_state는 useInitialStateSync가 쿼리 캐시에 기록 (훅마다 상태로 보관하지 않음)
 
     // 위협 지수 리스너
     const unsubThreatIndex = wsClient.subscribe('threat_index', (data) => {
@@ -74,6 +56,15 @@ export function useWebSocket(): UseWebSocketReturn {
       }
     });
 
+    // 재연결 스냅샷 리스너 (놓친 이벤트를 재전송할 수 없는 경우)
+    const unsubSnapshot = wsClient.subscribe('snapshot', (data) => {
+      if (mountedRef.current && data) {
+        const snapshot = data as WebSocketResumeSnapshot;
+        setNewThreats([...snapshot.threats].reverse().slice(0, 20));
+        setNewAlerts([...snapshot.alerts].reverse().slice(0, 30));
+      }
+    });
+
     // 데모 이벤트 리스너
     const unsubDemo = wsClient.subscribe('demo_event', (data) => {
       if (mountedRef.current) {
@@ -85,10 +76,10 @@ export function useWebSocket(): UseWebSocketReturn {
     return () => {
       mountedRef.current = false;
       unsubConnection();
-      unsubInitial();
       unsubThreatIndex();
       unsubNewThreat();
       unsubNewAlert();
+      unsubSnapshot();
       unsubDemo();
     };
   }, []);
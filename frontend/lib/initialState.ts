@@ -0,0 +1,128 @@
+import { QueryClient, QueryKey } from '@tanstack/react-query';
+import { ThreatIndexResponse, ThreatResponse, WebSocketInitialState } from '@/types';
+
+/**
+ * WebSocket initial_state → react-query 캐시
+ *
+ * 연결 시 서버가 보내는 initial_state(최근 위협/알림, KPI, 분포, 트렌드)로
+ * 대시보드 쿼리 캐시를 채워 첫 REST 요청을 대신합니다.
+ * 쿼리는 initial_state를 받거나 대기 시간이 지날 때까지 요청을 미루고(useInitialStateReady),
+ * 캐시에 데이터가 있으면 staleTime 동안 다시 요청하지 않습니다.
+ */
+
+// initial_state를 기다리는 최대 시간 - 연결 실패 시 REST로 진행
+export const INITIAL_STATE_WAIT_MS = 3000;
+
+// initial_state 트렌드(기록된 지수 히스토리)로 채우는 트렌드 범위 (시간)
+const SNAPSHOT_TREND_HOURS = 24;
+
+// 위협 레벨별 심각도 범위 (/threats 필터와 동일)
+const LEVEL_SEVERITY_RANGES: Record<number, [number, number]> = {
+  1: [0, 29],
+  2: [30, 49],
+  3: [50, 69],
+  4: [70, 89],
+  5: [90, 100],
+};
+
+let latest: WebSocketInitialState | null = null;
+let receivedAt = 0;
+let settled = false;
+const readyListeners: Set<() => void> = new Set();
+
+/** 쿼리가 요청을 시작해도 되는지 (initial_state 수신 또는 대기 시간 경과) */
+export function isInitialStateSettled(): boolean {
+  return settled;
+}
+
+export function settleInitialState(): void {
+  if (settled) return;
+  settled = true;
+  readyListeners.forEach((listener) => listener());
+}
+
+export function onInitialStateSettled(listener: () => void): () => void {
+  readyListeners.add(listener);
+  return () => {
+    readyListeners.delete(listener);
+  };
+}
+
+/** 마지막 initial_state 수신 시각 (initialDataUpdatedAt) */
+export function initialStateReceivedAt(): number | undefined {
+  return latest ? receivedAt : undefined;
+}
+
+function threatsFor(state: WebSocketInitialState, key: QueryKey): ThreatResponse[] | undefined {
+  const [, category, status, level, limit = 50] = key as [string, string?, string?, number?, number?];
+  const threats = state.threats;
+  if (!threats) return undefined;
+
+  // 스냅샷이 활성 위협 전체를 담고 있어야 필터 결과가 /threats와 같음
+  const complete = threats.length >= state.active_threats_count;
+  if (!complete && (category || status || level || limit > threats.length)) return undefined;
+
+  let filtered = threats;
+  if (category) filtered = filtered.filter((t) => t.category === category);
+  if (status) filtered = filtered.filter((t) => t.status === status);
+  if (level) {
+    const [min, max] = LEVEL_SEVERITY_RANGES[level] || [0, 100];
+    filtered = filtered.filter((t) => t.severity >= min && t.severity <= max);
+  }
+  return filtered.slice(0, limit);
+}
+
+/**
+ * 쿼리 키에 해당하는 initial_state 데이터 (없으면 undefined → REST 요청)
+ *
+ * 지원 키: ['threats', category, status, level, limit], ['alerts', limit], ['threatIndex'],
+ * ['kpi'], ['distribution'], ['trend', 24]
+ */
+export function initialDataFor(key: QueryKey, state: WebSocketInitialState | null = latest): unknown {
+  if (!state) return undefined;
+
+  switch (key[0]) {
+    case 'threats':
+      // ['threats', category] (카테고리 상세 모달)은 다른 형태의 키라 제외
+      return key.length === 5 ? threatsFor(state, key) : undefined;
+    case 'alerts': {
+      // 스냅샷은 최근 알림 N개 - limit 이하일 때만 /alerts?limit와 같음
+      const limit = (key[1] as number | undefined) ?? 20;
+      if (!state.alerts || key.length !== 2 || state.alerts.length < limit) return undefined;
+      return state.alerts.slice(0, limit);
+    }
+    case 'threatIndex':
+      return {
+        total_index: state.total_index,
+        level: state.level,
+        level_name: state.level_name,
+        categories: state.categories,
+        change_24h: 0,
+        timestamp: new Date(receivedAt).toISOString(),
+      } satisfies ThreatIndexResponse;
+    case 'kpi':
+      return state.kpi;
+    case 'distribution':
+      return state.distribution;
+    case 'trend':
+      return key[1] === SNAPSHOT_TREND_HOURS && state.trend?.length ? state.trend : undefined;
+    default:
+      return undefined;
+  }
+}
+
+/** initial_state 수신 - 이미 만들어진 쿼리 캐시를 채우고 대기 중인 쿼리를 진행 */
+export function seedQueryCache(queryClient: QueryClient, state: WebSocketInitialState): void {
+  latest = state;
+  receivedAt = Date.now();
+
+  for (const root of ['threats', 'alerts', 'threatIndex', 'kpi', 'distribution', 'trend']) {
+    for (const query of queryClient.getQueryCache().findAll({ queryKey: [root] })) {
+      const data = initialDataFor(query.queryKey, state);
+      if (data !== undefined) {
+        queryClient.setQueryData(query.queryKey, data, { updatedAt: receivedAt });
+      }
+    }
+  }
+  settleInitialState();
+}
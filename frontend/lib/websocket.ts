@@ -1,4 +1,10 @@
-import { WebSocketMessage, WebSocketMessageType } from '@/types';
+import {
+  ThreatIndexDelta,
+  ThreatIndexResponse,
+  WebSocketMessage,
+  WebSocketMessageType,
+  WebSocketSubscription,
+} from '@/types';
 import { WS_URL } from './constants';
 
 type MessageCallback = (data: unknown) => void;
@@ -15,6 +21,13 @@ class WebSocketClient {
   private listeners: Map<WebSocketMessageType, Set<MessageCallback>> = new Map();
   private connectionListeners: Set<(connected: boolean) => void> = new Set();
   private isIntentionalClose = false;
+  private decoder = new TextDecoder();
+  private subscription: WebSocketSubscription | null = null;
+  private threatIndex: ThreatIndexResponse | null = null;
+  private resyncRequested = false;
+  // 재연결 시 놓친 이벤트를 재전송받기 위한 스트림 위치
+  private stream: string | null = null;
+  private lastSeq: number | null = null;
 
   constructor(url: string) {
     this.url = url;
@@ -36,22 +49,46 @@ class WebSocketClient {
         return;
       }
 
+      // 연결 중이면 같은 소켓을 기다림 (여러 훅/컴포넌트가 동시에 connect 호출)
+      if (this.ws?.readyState === WebSocket.CONNECTING) {
+        const unsubscribe = this.onConnectionChange(() => {
+          unsubscribe();
+          resolve();
+        });
+        return;
+      }
+
       this.isIntentionalClose = false;
       
       try {
         this.ws = new WebSocket(this.url);
+        // 서버는 UTF-8 JSON을 바이너리 프레임으로 전송
+        this.ws.binaryType = 'arraybuffer';
 
         this.ws.onopen = () => {
           console.log('[WS] Connected');
           this.reconnectAttempts = 0;
+          this.threatIndex = null;
+          this.resyncRequested = false;
+          // 재연결 시 서버 측 구독 조건 복원
+          if (this.subscription) {
+            this.send({ action: 'subscribe', ...this.subscription });
+          }
+          // 이전 연결의 마지막 seq 이후 이벤트 재전송 요청 (구독 복원 후)
+          if (this.stream !== null && this.lastSeq !== null) {
+            this.send({ action: 'resume', stream: this.stream, last_seq: this.lastSeq });
+          }
           this.notifyConnectionListeners(true);
           resolve();
         };
 
         this.ws.onmessage = (event) => {
           try {
-            const message: WebSocketMessage = JSON.parse(event.data);
-            this.notifyListeners(message.type, message.data);
+            const text = typeof event.data === 'string' ? event.data : this.decoder.decode(event.data);
+            const parsed: WebSocketMessage | WebSocketMessage[] = JSON.parse(text);
+            // 배칭 윈도우가 켜진 서버는 여러 메시지를 배열 프레임 하나로 전송
+            const messages = Array.isArray(parsed) ? parsed : [parsed];
+            messages.forEach((message) => this.handleMessage(message));
           } catch (error) {
             console.error('[WS] Failed to parse message:', error);
           }
@@ -110,6 +147,83 @@ class WebSocketClient {
     }, delay);
   }
 
+  /**
+   * 수신 메시지 처리 - threat_index 변경분은 전체 상태로 복원해 전달
+   */
+  private handleMessage(message: WebSocketMessage): void {
+    this.trackPosition(message);
+
+    // 서버 heartbeat - 응답이 없으면 서버가 연결을 정리
+    if (message.type === 'ping') {
+      this.send({ action: 'pong', id: (message.data as { id: number }).id });
+      return;
+    }
+
+    if (message.type === 'threat_index') {
+      this.threatIndex = message.data as ThreatIndexResponse;
+      this.resyncRequested = false;
+      this.notifyListeners('threat_index', this.threatIndex);
+      return;
+    }
+
+    if (message.type === 'threat_index_delta') {
+      const delta = message.data as ThreatIndexDelta;
+      const current = this.threatIndex;
+
+      // 기준 상태가 없거나 seq가 이어지지 않으면 전체 상태 재요청
+      if (!current || current.seq === undefined || delta.seq !== current.seq + 1) {
+        if (!this.resyncRequested) {
+          this.resyncRequested = this.send({ action: 'resync' });
+        }
+        return;
+      }
+
+      const { categories, ...fields } = delta.changes;
+      this.threatIndex = {
+        ...current,
+        ...fields,
+        categories: { ...current.categories, ...categories },
+        timestamp: message.timestamp ?? current.timestamp,
+        seq: delta.seq,
+      };
+      this.notifyListeners('threat_index', this.threatIndex);
+      return;
+    }
+
+    this.notifyListeners(message.type, message.data);
+  }
+
+  /**
+   * 스트림 위치 갱신 - initial_state/resumed/snapshot은 서버 위치로 재설정, 이벤트는 최대 seq
+   */
+  private trackPosition(message: WebSocketMessage): void {
+    if (message.stream !== undefined && message.seq !== undefined) {
+      this.stream = message.stream;
+      this.lastSeq = message.seq;
+    } else if (message.seq !== undefined && (this.lastSeq === null || message.seq > this.lastSeq)) {
+      this.lastSeq = message.seq;
+    }
+  }
+
+  /**
+   * 서버로 메시지 전송 (연결되지 않은 경우 무시)
+   */
+  send(payload: Record<string, unknown>): boolean {
+    if (this.ws?.readyState !== WebSocket.OPEN) {
+      return false;
+    }
+    this.ws.send(JSON.stringify(payload));
+    return true;
+  }
+
+  /**
+   * 서버 측 수신 범위 설정 (메시지 타입 / 카테고리 / 최소 알림 레벨)
+   */
+  updateSubscription(subscription: WebSocketSubscription): void {
+    this.subscription = { ...this.subscription, ...subscription };
+    this.send({ action: 'subscribe', ...subscription });
+  }
+
   /**
    * 메시지 타입별 리스너 등록
    */
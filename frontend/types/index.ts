@@ -6,6 +6,7 @@ export interface ThreatIndexResponse {
   categories: CategoryIndices;
   change_24h: number;
   timestamp: string;
+  seq?: number;
 }
 
 export interface CategoryIndices {
@@ -42,9 +43,17 @@ export interface AlertResponse {
   title: string;
   message: string;
   threat_id?: string;
+  category?: ThreatCategory | null;
   is_read: boolean;
   created_at: string;
   time_ago: string;
+  // 집계 알림 (같은 유형 알림 폭주 시 윈도우 종료 후 1건으로 전송)
+  aggregated?: boolean;
+  count?: number;
+  threat_count?: number; // 관련 위협 수 (threat_ids는 최근 20개)
+  threat_ids?: string[];
+  first_at?: string;
+  last_at?: string;
 }
 
 export interface TrendDataPoint {
@@ -64,12 +73,43 @@ export type ThreatCategory = 'terror' | 'cyber' | 'smuggling' | 'drone' | 'insid
 export type ThreatStatus = 'new' | 'analyzing' | 'confirmed' | 'resolved' | 'false_positive';
 
 // ============ WebSocket Types ============
-export type WebSocketMessageType = 'threat_index' | 'new_threat' | 'new_alert' | 'threat_update' | 'demo_event' | 'initial_state';
+export type WebSocketMessageType = 'threat_index' | 'new_threat' | 'new_alert' | 'threat_update' | 'demo_event' | 'initial_state' | 'threat_index_delta' | 'subscription' | 'error' | 'resumed' | 'snapshot' | 'ping';
+
+export interface WebSocketSubscription {
+  types?: Array<Exclude<WebSocketMessageType, 'initial_state' | 'threat_index_delta' | 'subscription' | 'error' | 'resumed' | 'snapshot' | 'ping'> | '*'>;
+  categories?: Array<ThreatCategory | '*'>;
+  min_level?: number;
+}
+
+export interface ThreatIndexDelta {
+  seq: number;
+  changes: Partial<Omit<ThreatIndexResponse, 'categories'>> & { categories?: Partial<CategoryIndices> };
+}
 
 export interface WebSocketMessage {
   type: WebSocketMessageType;
   data: unknown;
   timestamp?: string;
+  seq?: number;
+  stream?: string;
+}
+
+// 재연결 시 놓친 이벤트를 재전송할 수 없을 때 서버가 보내는 스냅샷
+export interface WebSocketResumeSnapshot {
+  state: Omit<ThreatIndexResponse, 'change_24h' | 'timestamp'> & { active_threats_count: number; is_running: boolean };
+  threats: ThreatResponse[];
+  alerts: AlertResponse[];
+}
+
+// initial_state - 현재 상태 + 서버 설정(WS_INITIAL_SNAPSHOT_SECTIONS)에 포함된 섹션
+export interface WebSocketInitialState extends Omit<ThreatIndexResponse, 'change_24h' | 'timestamp'> {
+  active_threats_count: number;
+  is_running: boolean;
+  threats?: ThreatResponse[];
+  alerts?: AlertResponse[];
+  kpi?: KPIMetrics;
+  distribution?: CategoryDistribution[];
+  trend?: TrendDataPoint[];
 }
 
 // ============ Analytics Types ============